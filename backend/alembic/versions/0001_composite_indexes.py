@@ -0,0 +1,45 @@
+"""Composite indexes for list, stats and spam-check queries
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    "service_bookings": [
+        ("ix_service_bookings_active_created", ["is_active", "created_at"]),
+        ("ix_service_bookings_active_status_created", ["is_active", "status", "created_at"]),
+        ("ix_service_bookings_active_type_created", ["is_active", "service_type", "created_at"]),
+    ],
+    "contact_inquiries": [
+        ("ix_contact_inquiries_active_created", ["is_active", "created_at"]),
+        ("ix_contact_inquiries_active_status_created", ["is_active", "status", "created_at"]),
+        ("ix_contact_inquiries_active_type_created", ["is_active", "inquiry_type", "created_at"]),
+        ("ix_contact_inquiries_ip_created", ["ip_address", "created_at"]),
+    ],
+}
+
+def upgrade() -> None:
+    # Tables are created by the application on startup; only index what exists
+    existing_tables = sa.inspect(op.get_bind()).get_table_names()
+    for table_name, indexes in INDEXES.items():
+        if table_name not in existing_tables:
+            continue
+        for index_name, columns in indexes:
+            op.create_index(index_name, table_name, columns, if_not_exists=True)
+
+def downgrade() -> None:
+    existing_tables = sa.inspect(op.get_bind()).get_table_names()
+    for table_name, indexes in INDEXES.items():
+        if table_name not in existing_tables:
+            continue
+        for index_name, _ in indexes:
+            op.drop_index(index_name, table_name=table_name, if_exists=True)
@@ -0,0 +1,25 @@
+"""Covering index for the booking stats aggregate
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_service_bookings_stats"
+COLUMNS = ["is_active", "status", "service_type", "created_at", "quote_amount", "estimated_cost"]
+
+def upgrade() -> None:
+    if "service_bookings" in sa.inspect(op.get_bind()).get_table_names():
+        op.create_index(INDEX_NAME, "service_bookings", COLUMNS, if_not_exists=True)
+
+def downgrade() -> None:
+    if "service_bookings" in sa.inspect(op.get_bind()).get_table_names():
+        op.drop_index(INDEX_NAME, table_name="service_bookings", if_exists=True)
@@ -0,0 +1,31 @@
+"""Record which pricing rules produced each booking estimate
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+def _has_column(table_name: str, column_name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    if table_name not in inspector.get_table_names():
+        return False
+    return column_name in {column["name"] for column in inspector.get_columns(table_name)}
+
+def upgrade() -> None:
+    # New tables (pricing_rule_sets) are created by the application on startup
+    inspector = sa.inspect(op.get_bind())
+    if "service_bookings" in inspector.get_table_names() and not _has_column("service_bookings", "pricing_version"):
+        op.add_column("service_bookings", sa.Column("pricing_version", sa.Integer(), nullable=True))
+
+def downgrade() -> None:
+    if _has_column("service_bookings", "pricing_version"):
+        with op.batch_alter_table("service_bookings") as batch_op:
+            batch_op.drop_column("pricing_version")
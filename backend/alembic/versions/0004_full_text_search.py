@@ -0,0 +1,45 @@
+"""Full-text search indexes over bookings and contact inquiries
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from models.search import (
+    SEARCH_COLUMNS, fts_table_name, postgres_search_ddl, sqlite_rebuild_sql, sqlite_search_ddl
+)
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    existing = set(sa.inspect(bind).get_table_names())
+    for table_name in SEARCH_COLUMNS:
+        if table_name not in existing:
+            # Created with its search index by the application on startup
+            continue
+        if bind.dialect.name == "sqlite":
+            for statement in sqlite_search_ddl(table_name):
+                op.execute(statement)
+            # Index the rows written before the triggers existed
+            op.execute(sqlite_rebuild_sql(table_name))
+        elif bind.dialect.name == "postgresql":
+            for statement in postgres_search_ddl(table_name):
+                op.execute(statement)
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    for table_name in SEARCH_COLUMNS:
+        if bind.dialect.name == "sqlite":
+            fts = fts_table_name(table_name)
+            for suffix in ("ai", "ad", "au"):
+                op.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+            op.execute(f"DROP TABLE IF EXISTS {fts}")
+        elif bind.dialect.name == "postgresql":
+            op.execute(f"DROP INDEX IF EXISTS ix_{table_name}_search")
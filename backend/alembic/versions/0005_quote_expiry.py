@@ -0,0 +1,35 @@
+"""Expired quote status and the index quote-expiry sweeps use
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_service_bookings_status_quote_valid_until"
+COLUMNS = ["status", "quote_valid_until"]
+
+def upgrade() -> None:
+    # New tables (activity_log) are created by the application on startup
+    bind = op.get_bind()
+    # Without the type there is nothing to extend; create_all adds EXPIRED with it
+    if bind.dialect.name == "postgresql" and bind.scalar(
+        sa.text("SELECT 1 FROM pg_type WHERE typname = 'projectstatus'")
+    ):
+        # Enum columns store member names; ADD VALUE cannot run inside a transaction
+        with op.get_context().autocommit_block():
+            op.execute("ALTER TYPE projectstatus ADD VALUE IF NOT EXISTS 'EXPIRED'")
+    if "service_bookings" in sa.inspect(bind).get_table_names():
+        op.create_index(INDEX_NAME, "service_bookings", COLUMNS, if_not_exists=True)
+
+def downgrade() -> None:
+    # PostgreSQL cannot drop an enum value; EXPIRED is left in place
+    if "service_bookings" in sa.inspect(op.get_bind()).get_table_names():
+        op.drop_index(INDEX_NAME, table_name="service_bookings", if_exists=True)
@@ -0,0 +1,26 @@
+"""Drop the per-IP index the spam check no longer reads
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_contact_inquiries_ip_created"
+COLUMNS = ["ip_address", "created_at"]
+
+def upgrade() -> None:
+    # Submission velocity is counted in Redis/in-process now, so the index only slows inserts
+    if "contact_inquiries" in sa.inspect(op.get_bind()).get_table_names():
+        op.drop_index(INDEX_NAME, table_name="contact_inquiries", if_exists=True)
+
+def downgrade() -> None:
+    if "contact_inquiries" in sa.inspect(op.get_bind()).get_table_names():
+        op.create_index(INDEX_NAME, "contact_inquiries", COLUMNS, if_not_exists=True)
@@ -0,0 +1,56 @@
+"""Record who set each contact inquiry's status
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+# An archive kept in an attached SQLite file (ARCHIVE_DATABASE_PATH) is not
+# visible to this connection and needs the column added by hand
+TABLES = ["contact_inquiries", "contact_inquiries_archive"]
+
+def _has_column(table_name: str, column_name: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    if table_name not in inspector.get_table_names():
+        return False
+    return column_name in {column["name"] for column in inspector.get_columns(table_name)}
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    existing_tables = sa.inspect(bind).get_table_names()
+    if bind.dialect.name == "postgresql":
+        to_status = "a.details->>'to'"
+    else:
+        to_status = "json_extract(a.details, '$.to')"
+    for table_name in TABLES:
+        if table_name not in existing_tables or _has_column(table_name, "status_set_by"):
+            continue
+        op.add_column(table_name, sa.Column("status_set_by", sa.String(255), nullable=True))
+        if "activity_log" not in existing_tables:
+            continue
+        # Only statuses an admin set through the bulk route (which records the
+        # actor in activity_log) count as verdicts; the rest stay unjudged.
+        # Enum columns store names, activity details store values.
+        op.execute(
+            f"UPDATE {table_name} SET status_set_by = ("
+            "SELECT a.actor FROM activity_log a "
+            "WHERE a.action = 'status_changed' AND a.entity_type = 'contact' "
+            f"AND a.entity_id = CAST({table_name}.id AS VARCHAR(64)) "
+            f"AND {to_status} = lower(CAST({table_name}.status AS VARCHAR(20))) "
+            "ORDER BY a.timestamp DESC, a.id DESC LIMIT 1"
+            ") WHERE status IN ('READ', 'REPLIED', 'RESOLVED', 'SPAM')"
+        )
+
+def downgrade() -> None:
+    for table_name in TABLES:
+        if _has_column(table_name, "status_set_by"):
+            with op.batch_alter_table(table_name) as batch_op:
+                batch_op.drop_column("status_set_by")
@@ -0,0 +1,27 @@
+"""Drop the covering index the booking stats no longer read
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_service_bookings_stats"
+COLUMNS = ["is_active", "status", "service_type", "created_at", "quote_amount", "estimated_cost"]
+
+def upgrade() -> None:
+    # Stats are read from the daily rollups, whose rebuild groups on date(created_at)
+    # and cannot use this index either, so it only slows booking writes
+    if "service_bookings" in sa.inspect(op.get_bind()).get_table_names():
+        op.drop_index(INDEX_NAME, table_name="service_bookings", if_exists=True)
+
+def downgrade() -> None:
+    if "service_bookings" in sa.inspect(op.get_bind()).get_table_names():
+        op.create_index(INDEX_NAME, "service_bookings", COLUMNS, if_not_exists=True)
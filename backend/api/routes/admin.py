@@ -3,22 +3,40 @@
 Admin endpoints for managing bookings and contacts
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 import os
+import uuid
 import logging
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
-from core.database import get_db
+from core.database import ReadSessionLocal, get_db, get_read_db, mark_recent_write, read_lag
+from models.booking import ServiceType, ProjectStatus
+from models.contact import InquiryType, InquiryStatus
+from services.activity_service import ActivityService
+from services.archive_service import ArchiveService
 from services.booking_service import BookingService
 from services.contact_service import ContactService
+from services.email_service import EmailService
+from services.export_service import ExportService
+from services.import_service import ImportService
+from services.pricing import PricingService
+from services.response_cache import RECENT_BOOKINGS_TAG, RECENT_CONTACTS_TAG, STATS_TAG, response_cache
+from services.search_service import SearchService
+from utils.bulk_io import BulkFormat
 from utils.rate_limit import rate_limit
 from schemas.admin import (
     AdminStats, BookingSummary, ContactSummary,
-    RevenueStats, ActivityLog, AuthResponse, AdminLogin
+    RevenueStats, ActivityLog, AuthResponse, AdminLogin,
+    PricingRuleSetCreate, PricingRuleSetResponse, ReestimateRequest, ReestimateResult,
+    ImportResult, BookingSearchHit, BookingSearchResults, ContactSearchHit, ContactSearchResults,
+    BookingBulkStatusUpdate, ContactBulkStatusUpdate, BulkStatusResult,
+    AdminBookingResponse, AdminContactResponse, ArchiveResult
 )
 
 security = HTTPBearer()
@@ -78,7 +96,8 @@ async def admin_login(credentials: AdminLogin):
 async def get_admin_stats(
     request: Request,  # Add Request parameter
     days: int = Query(30, description="Number of days to include in stats"),
-    db: Session = Depends(get_db),
+    monthly: bool = Query(False, description="Include a per-month revenue breakdown"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: dict = Depends(verify_admin_token)
 ):
     """Get administrative statistics"""
@@ -86,25 +105,30 @@ async def get_admin_stats(
         booking_service = BookingService(db)
         contact_service = ContactService(db)
         
-        end_date = datetime.utcnow()
-        start_date = end_date - timedelta(days=days)
-        
-        # Get booking stats
-        booking_stats = booking_service.get_stats(start_date, end_date)
-        
-        # Get contact stats
-        contact_stats = contact_service.get_stats(start_date, end_date)
-        
-        # Calculate revenue stats
-        revenue_stats = booking_service.get_revenue_stats(start_date, end_date)
+        async def load():
+            end_date = datetime.utcnow()
+            start_date = end_date - timedelta(days=days)
+            
+            # Get booking stats
+            booking_stats = await booking_service.get_stats(start_date, end_date)
+            
+            # Get contact stats
+            contact_stats = await contact_service.get_stats(start_date, end_date)
+            
+            # Calculate revenue stats
+            revenue_stats = await booking_service.get_revenue_stats(start_date, end_date, monthly)
+            
+            return jsonable_encoder(AdminStats(
+                period_days=days,
+                start_date=start_date,
+                end_date=end_date,
+                bookings=booking_stats,
+                contacts=contact_stats,
+                revenue=revenue_stats
+            ))
         
-        return AdminStats(
-            period_days=days,
-            start_date=start_date,
-            end_date=end_date,
-            bookings=booking_stats,
-            contacts=contact_stats,
-            revenue=revenue_stats
+        return await response_cache.get_or_load(
+            f"stats:{days}:{monthly}", load, tags=(STATS_TAG,), replica_lag=read_lag(request)
         )
         
     except Exception as e:
@@ -116,26 +140,31 @@ async def get_admin_stats(
 async def get_booking_summary(
     request: Request,  # Add Request parameter
     limit: int = Query(20, description="Number of recent bookings"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: dict = Depends(verify_admin_token)
 ):
     """Get recent booking summary"""
     try:
         booking_service = BookingService(db)
-        bookings = booking_service.get_recent_bookings(limit)
         
-        return [
-            BookingSummary(
-                booking_id=booking.booking_id,
-                project_name=booking.project_name,
-                client_name=f"{booking.first_name} {booking.last_name}",
-                service_type=booking.service_type,
-                status=booking.status,
-                estimated_cost=booking.estimated_cost,
-                created_at=booking.created_at
-            )
-            for booking in bookings
-        ]
+        async def load():
+            bookings = await booking_service.get_recent_bookings(limit)
+            return jsonable_encoder([
+                BookingSummary(
+                    booking_id=str(booking.booking_id),
+                    project_name=booking.project_name,
+                    client_name=f"{booking.first_name} {booking.last_name}",
+                    service_type=booking.service_type,
+                    status=booking.status,
+                    estimated_cost=booking.estimated_cost,
+                    created_at=booking.created_at
+                )
+                for booking in bookings
+            ])
+        
+        return await response_cache.get_or_load(
+            f"bookings:recent:{limit}", load, tags=(RECENT_BOOKINGS_TAG,), replica_lag=read_lag(request)
+        )
         
     except Exception as e:
         logger.error(f"Error getting booking summary: {str(e)}")
@@ -146,27 +175,491 @@ async def get_booking_summary(
 async def get_contact_summary(
     request: Request,  # Add Request parameter
     limit: int = Query(20, description="Number of recent contacts"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: dict = Depends(verify_admin_token)
 ):
     """Get recent contact summary"""
     try:
         contact_service = ContactService(db)
-        contacts = contact_service.get_recent_contacts(limit)
+        
+        async def load():
+            contacts = await contact_service.get_recent_contacts(limit)
+            return jsonable_encoder([
+                ContactSummary(
+                    id=contact.id,
+                    name=contact.name,
+                    email=contact.email,
+                    subject=contact.subject,
+                    inquiry_type=contact.inquiry_type,
+                    status=contact.status,
+                    created_at=contact.created_at
+                )
+                for contact in contacts
+            ])
+        
+        return await response_cache.get_or_load(
+            f"contacts:recent:{limit}", load, tags=(RECENT_CONTACTS_TAG,), replica_lag=read_lag(request)
+        )
+        
+    except Exception as e:
+        logger.error(f"Error getting contact summary: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve contact summary")
+
+@router.get("/bookings/{booking_id}", response_model=AdminBookingResponse)
+@rate_limit(requests=200, window=3600)
+async def get_booking_detail(
+    request: Request,
+    booking_id: uuid.UUID,
+    include_archived: bool = Query(False, description="Also look in the archive"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: dict = Depends(verify_admin_token)
+):
+    """Get a booking, optionally one that has been archived"""
+    try:
+        booking = await BookingService(db).get_booking_by_id(str(booking_id))
+        if booking is None and include_archived:
+            booking = await ArchiveService(db).get_booking(str(booking_id))
+        if booking is None:
+            raise HTTPException(status_code=404, detail="Booking not found")
+        
+        return AdminBookingResponse.from_orm(booking)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting booking {booking_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve booking")
+
+@router.get("/contacts/{contact_id}", response_model=AdminContactResponse)
+@rate_limit(requests=200, window=3600)
+async def get_contact_detail(
+    request: Request,
+    contact_id: int,
+    include_archived: bool = Query(False, description="Also look in the archive"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: dict = Depends(verify_admin_token)
+):
+    """Get a contact inquiry, optionally one that has been archived"""
+    try:
+        contact = await ContactService(db).get_inquiry_by_id(contact_id)
+        if contact is None and include_archived:
+            contact = await ArchiveService(db).get_inquiry(contact_id)
+        if contact is None:
+            raise HTTPException(status_code=404, detail="Contact not found")
+        
+        return AdminContactResponse.from_orm(contact)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting contact {contact_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve contact")
+
+@router.get("/activity", response_model=List[ActivityLog])
+@rate_limit(requests=120, window=3600)
+async def get_activity(
+    request: Request,
+    entity_type: Optional[str] = Query(None, description="booking or contact"),
+    entity_id: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: dict = Depends(verify_admin_token)
+):
+    """Recent recorded changes, newest first"""
+    try:
+        entries = await ActivityService(db).get_recent(limit, entity_type, entity_id)
         
         return [
-            ContactSummary(
-                id=contact.id,
-                name=contact.name,
-                email=contact.email,
-                subject=contact.subject,
-                inquiry_type=contact.inquiry_type,
-                status=contact.status,
-                created_at=contact.created_at
+            ActivityLog(
+                timestamp=entry.timestamp,
+                action=entry.action,
+                entity_type=entry.entity_type,
+                entity_id=entry.entity_id,
+                actor=entry.actor,
+                details=entry.details or {}
             )
-            for contact in contacts
+            for entry in entries
         ]
         
     except Exception as e:
-        logger.error(f"Error getting contact summary: {str(e)}")
-        raise HTTPException(status_code=500, detail="Failed to retrieve contact summary")
\ No newline at end of file
+        logger.error(f"Error getting activity log: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve activity log")
+
+@router.get("/search/bookings", response_model=BookingSearchResults)
+@rate_limit(requests=120, window=3600)
+async def search_bookings(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200, description="Words to search for"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: dict = Depends(verify_admin_token)
+):
+    """Search bookings by project name, description, company and client notes"""
+    try:
+        hits, has_more = await SearchService(db).search_bookings(q, limit, offset)
+        
+        return BookingSearchResults(
+            results=[
+                BookingSearchHit(
+                    booking_id=str(booking.booking_id),
+                    project_name=booking.project_name,
+                    client_name=f"{booking.first_name} {booking.last_name}",
+                    service_type=booking.service_type,
+                    status=booking.status,
+                    estimated_cost=booking.estimated_cost,
+                    created_at=booking.created_at,
+                    rank=rank
+                )
+                for booking, rank in hits
+            ],
+            limit=limit,
+            offset=offset,
+            has_more=has_more
+        )
+        
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error searching bookings: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to search bookings")
+
+@router.get("/search/contacts", response_model=ContactSearchResults)
+@rate_limit(requests=120, window=3600)
+async def search_contacts(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200, description="Words to search for"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: dict = Depends(verify_admin_token)
+):
+    """Search contact inquiries by subject and message"""
+    try:
+        hits, has_more = await SearchService(db).search_inquiries(q, limit, offset)
+        
+        return ContactSearchResults(
+            results=[
+                ContactSearchHit(
+                    id=contact.id,
+                    name=contact.name,
+                    email=contact.email,
+                    subject=contact.subject,
+                    inquiry_type=contact.inquiry_type,
+                    status=contact.status,
+                    created_at=contact.created_at,
+                    rank=rank
+                )
+                for contact, rank in hits
+            ],
+            limit=limit,
+            offset=offset,
+            has_more=has_more
+        )
+        
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error searching contacts: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to search contacts")
+
+@router.get("/pricing", response_model=PricingRuleSetResponse)
+@rate_limit(requests=50, window=3600)
+async def get_pricing_rules(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(verify_admin_token)
+):
+    """Get the pricing rules new estimates use"""
+    try:
+        pricing = await PricingService(db).get_current_rules()
+        return PricingRuleSetResponse(version=pricing.version, rules=pricing.rules)
+        
+    except Exception as e:
+        logger.error(f"Error getting pricing rules: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve pricing rules")
+
+@router.post("/pricing", response_model=PricingRuleSetResponse, status_code=201)
+@rate_limit(requests=20, window=3600)
+async def publish_pricing_rules(
+    request: Request,
+    response: Response,
+    pricing_data: PricingRuleSetCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(verify_admin_token)
+):
+    """Publish a new pricing rules version"""
+    try:
+        rules = pricing_data.dict(exclude={"notes"})
+        rule_set = await PricingService(db).publish_rules(rules, pricing_data.notes)
+        mark_recent_write(response)
+        
+        logger.info(f"Pricing rules v{rule_set.version} published by {current_user['email']}")
+        return PricingRuleSetResponse(
+            version=rule_set.version,
+            rules=rule_set.rules,
+            notes=rule_set.notes,
+            created_at=rule_set.created_at
+        )
+        
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error publishing pricing rules: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to publish pricing rules")
+
+@router.post("/bookings/reestimate", response_model=ReestimateResult)
+@rate_limit(requests=10, window=3600)
+async def reestimate_bookings(
+    request: Request,
+    response: Response,
+    reestimate_data: ReestimateRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(verify_admin_token)
+):
+    """Re-price open bookings against the current pricing rules"""
+    try:
+        result = await PricingService(db).reestimate_bookings(
+            reestimate_data.statuses, reestimate_data.chunk_size
+        )
+        mark_recent_write(response)
+        return ReestimateResult(**result)
+        
+    except Exception as e:
+        logger.error(f"Error re-estimating bookings: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to re-estimate bookings")
+
+@router.patch("/bookings/status", response_model=BulkStatusResult)
+@rate_limit(requests=20, window=3600)
+async def bulk_update_booking_status(
+    request: Request,
+    response: Response,
+    status_update: BookingBulkStatusUpdate,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(verify_admin_token)
+):
+    """Move many bookings to one status and email their clients in one batch"""
+    try:
+        requested = list(dict.fromkeys(status_update.booking_ids))
+        bookings = await BookingService(db).update_statuses(
+            requested, status_update.status, actor=current_user["email"]
+        )
+        mark_recent_write(response)
+        
+        if bookings:
+            background_tasks.add_task(EmailService().send_status_updates, bookings, status_update.status)
+        
+        updated = {str(booking.booking_id) for booking in bookings}
+        logger.info(f"Bulk booking status update by {current_user['email']}: {len(updated)} -> {status_update.status.value}")
+        return BulkStatusResult(
+            status=status_update.status.value,
+            updated=sorted(updated),
+            not_found=[str(booking_id) for booking_id in requested if str(booking_id) not in updated],
+            emails_queued=len(bookings)
+        )
+        
+    except Exception as e:
+        logger.error(f"Error bulk updating booking status: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to update booking statuses")
+
+@router.patch("/contacts/status", response_model=BulkStatusResult)
+@rate_limit(requests=20, window=3600)
+async def bulk_update_contact_status(
+    request: Request,
+    response: Response,
+    status_update: ContactBulkStatusUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(verify_admin_token)
+):
+    """Move many contact inquiries to one status"""
+    try:
+        requested = list(dict.fromkeys(status_update.contact_ids))
+        contacts = await ContactService(db).update_inquiry_statuses(
+            requested, status_update.status, actor=current_user["email"]
+        )
+        mark_recent_write(response)
+        
+        updated = {contact.id for contact in contacts}
+        logger.info(f"Bulk contact status update by {current_user['email']}: {len(updated)} -> {status_update.status.value}")
+        return BulkStatusResult(
+            status=status_update.status.value,
+            updated=[str(contact_id) for contact_id in sorted(updated)],
+            not_found=[str(contact_id) for contact_id in requested if contact_id not in updated]
+        )
+        
+    except Exception as e:
+        logger.error(f"Error bulk updating contact status: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to update contact statuses")
+
+@router.post("/archive", response_model=ArchiveResult)
+@rate_limit(requests=10, window=3600)
+async def archive_rows(
+    request: Request,
+    response: Response,
+    dry_run: bool = Query(False, description="Only count the rows each rule would move"),
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(verify_admin_token)
+):
+    """Move aged bookings and inquiries matching the archive rules to the archive tables"""
+    try:
+        archive_service = ArchiveService(db)
+        if dry_run:
+            return ArchiveResult(archived=await archive_service.count_matching(), dry_run=True)
+        
+        result = await archive_service.archive()
+        mark_recent_write(response)
+        
+        logger.info(f"Archive run by {current_user['email']}: {result['archived']}")
+        return ArchiveResult(**result)
+        
+    except Exception as e:
+        logger.error(f"Error archiving rows: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to archive rows")
+
+@router.post("/import/bookings", response_model=ImportResult)
+@rate_limit(requests=20, window=3600)
+async def import_bookings(
+    request: Request,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    format: Optional[BulkFormat] = Query(None, description="ndjson or csv (defaults from Content-Type)"),
+    send_emails: bool = Query(False, description="Send the usual confirmation and notification emails"),
+    batch_size: Optional[int] = Query(None, ge=1, le=5000, description="Rows per transaction"),
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(verify_admin_token)
+):
+    """Import bookings from an NDJSON or CSV request body"""
+    try:
+        email_service = EmailService()
+        
+        def queue_emails(bookings: list):
+            for booking in bookings:
+                background_tasks.add_task(email_service.send_booking_confirmation, booking)
+                background_tasks.add_task(email_service.send_booking_notification, booking)
+        
+        result = await ImportService(db).import_bookings(
+            request.stream(),
+            format or BulkFormat.from_content_type(request.headers.get("content-type")),
+            batch_size,
+            queue_emails if send_emails else None
+        )
+        mark_recent_write(response)
+        
+        logger.info(f"Booking import by {current_user['email']}: {result['imported']} imported, {result['failed']} failed")
+        return ImportResult(**result)
+        
+    except Exception as e:
+        logger.error(f"Error importing bookings: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to import bookings")
+
+@router.post("/import/contacts", response_model=ImportResult)
+@rate_limit(requests=20, window=3600)
+async def import_contacts(
+    request: Request,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    format: Optional[BulkFormat] = Query(None, description="ndjson or csv (defaults from Content-Type)"),
+    send_emails: bool = Query(False, description="Send the usual confirmation and notification emails"),
+    batch_size: Optional[int] = Query(None, ge=1, le=5000, description="Rows per transaction"),
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(verify_admin_token)
+):
+    """Import contact inquiries from an NDJSON or CSV request body"""
+    try:
+        email_service = EmailService()
+        
+        def queue_emails(contacts: list):
+            for contact in contacts:
+                background_tasks.add_task(email_service.send_contact_confirmation, contact)
+                background_tasks.add_task(email_service.send_contact_notification, contact)
+        
+        result = await ImportService(db).import_contacts(
+            request.stream(),
+            format or BulkFormat.from_content_type(request.headers.get("content-type")),
+            batch_size,
+            queue_emails if send_emails else None
+        )
+        mark_recent_write(response)
+        
+        logger.info(f"Contact import by {current_user['email']}: {result['imported']} imported, {result['failed']} failed")
+        return ImportResult(**result)
+        
+    except Exception as e:
+        logger.error(f"Error importing contacts: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to import contacts")
+
+def export_response(export, name: str, format: BulkFormat) -> StreamingResponse:
+    """
+    Stream an ExportService export from its own read session.
+    
+    Dependency sessions close before a streaming body is sent, so the session
+    is opened inside the body generator and lives exactly as long as the stream.
+    """
+    async def body():
+        async with ReadSessionLocal() as db:
+            async for chunk in export(ExportService(db)):
+                yield chunk
+    
+    filename = f"{name}-{datetime.utcnow():%Y%m%d-%H%M%S}.{format.value}"
+    return StreamingResponse(
+        body(),
+        media_type=format.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+@router.get("/export/bookings")
+@rate_limit(requests=20, window=3600)
+async def export_bookings(
+    request: Request,
+    format: BulkFormat = BulkFormat.NDJSON,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    status: Optional[ProjectStatus] = None,
+    service_type: Optional[ServiceType] = None,
+    include_archived: bool = Query(False, description="Append archived bookings, with archived_at"),
+    current_user: dict = Depends(verify_admin_token)
+):
+    """Stream bookings as NDJSON or CSV"""
+    return export_response(
+        lambda service: service.export_bookings(
+            format, start_date, end_date, status, service_type, include_archived
+        ),
+        "bookings", format
+    )
+
+@router.get("/export/contacts")
+@rate_limit(requests=20, window=3600)
+async def export_contacts(
+    request: Request,
+    format: BulkFormat = BulkFormat.NDJSON,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    status: Optional[InquiryStatus] = None,
+    inquiry_type: Optional[InquiryType] = None,
+    include_archived: bool = Query(False, description="Append archived inquiries, with archived_at"),
+    current_user: dict = Depends(verify_admin_token)
+):
+    """Stream contact inquiries as NDJSON or CSV"""
+    return export_response(
+        lambda service: service.export_contacts(
+            format, start_date, end_date, status, inquiry_type, include_archived
+        ),
+        "contacts", format
+    )
+
+@router.get("/export/newsletter")
+@rate_limit(requests=20, window=3600)
+async def export_newsletter(
+    request: Request,
+    format: BulkFormat = BulkFormat.NDJSON,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    confirmed: Optional[bool] = None,
+    current_user: dict = Depends(verify_admin_token)
+):
+    """Stream newsletter subscriptions as NDJSON or CSV"""
+    return export_response(
+        lambda service: service.export_subscriptions(format, start_date, end_date, confirmed),
+        "newsletter", format
+    )
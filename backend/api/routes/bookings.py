@@ -3,12 +3,13 @@
 Service booking API endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Request
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Request, Response
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 import logging
 
-from core.database import get_db
+from core.database import get_db, get_read_db, mark_recent_write
 from core.config import get_settings
 from models.booking import ServiceBooking, ServiceType, ProjectStatus
 from schemas.booking import (
@@ -17,6 +18,10 @@ from schemas.booking import (
 )
 from services.booking_service import BookingService
 from services.email_service import EmailService
+from services.response_cache import BOOKINGS_TAG, booking_tag, response_cache
+from utils.pagination import TotalMode
+from utils.etag import make_etag, not_modified, page_etag, set_etag
+from utils.idempotency import idempotent
 from utils.rate_limit import rate_limit
 
 router = APIRouter()
@@ -24,12 +29,14 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 @router.post("/", response_model=BookingResponse, status_code=201)
+@idempotent(scope="bookings", status_code=201)
 @rate_limit(requests=5, window=3600)  # 5 requests per hour
 async def create_booking(
     request: Request,  # Move Request to first parameter
     booking_data: BookingCreate,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
+    response: Response,
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new service booking"""
     try:
@@ -37,7 +44,8 @@ async def create_booking(
         email_service = EmailService()
         
         # Create booking
-        booking = booking_service.create_booking(booking_data, request.client.host)
+        booking = await booking_service.create_booking(booking_data, request.client.host)
+        mark_recent_write(response)
         
         # Send confirmation emails in background
         background_tasks.add_task(
@@ -61,29 +69,52 @@ async def create_booking(
 @rate_limit(requests=20, window=3600)  # Add rate limiting to GET endpoint
 async def list_bookings(
     request: Request,  # Add Request parameter
+    response: Response,
     status: Optional[ProjectStatus] = None,
     service_type: Optional[ServiceType] = None,
     limit: int = 50,
     offset: int = 0,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    include_total: TotalMode = TotalMode.APPROX,
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """List service bookings with filtering"""
+    """List service bookings with filtering (pass next_cursor back as cursor for the next page)"""
     try:
         booking_service = BookingService(db)
-        bookings, total = booking_service.get_bookings(
+        params = (status, service_type, limit, offset, cursor)
+        total = await booking_service.count_bookings(status, service_type, include_total)
+        
+        # Revalidate against (id, updated_at) of the page before loading full rows
+        versions = await booking_service.get_page_versions(status, service_type, limit, offset, cursor)
+        etag = page_etag("bookings", params, total, versions[:limit], len(versions) > limit)
+        unchanged = not_modified(request, etag)
+        if unchanged:
+            return unchanged
+        
+        bookings, _, next_cursor = await booking_service.get_bookings(
             status=status,
             service_type=service_type,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor,
+            include_total=TotalMode.NONE
         )
+        set_etag(response, page_etag(
+            "bookings", params, total,
+            [(booking.id, booking.updated_at) for booking in bookings], next_cursor is not None
+        ))
         
         return BookingList(
             bookings=[BookingResponse.from_orm(booking) for booking in bookings],
             total=total,
+            total_is_exact=include_total == TotalMode.EXACT,
             limit=limit,
-            offset=offset
+            offset=offset,
+            next_cursor=next_cursor
         )
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error listing bookings: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to retrieve bookings")
@@ -93,17 +124,34 @@ async def list_bookings(
 async def get_booking(
     request: Request,  # Add Request parameter
     booking_id: str,
-    db: Session = Depends(get_db)
+    response: Response,
+    db: AsyncSession = Depends(get_db)
 ):
-    """Get a specific booking by ID"""
+    """Get a specific booking by ID (send If-None-Match with its ETag to revalidate)"""
     try:
         booking_service = BookingService(db)
-        booking = booking_service.get_booking_by_id(booking_id)
         
-        if not booking:
+        async def load():
+            booking = await booking_service.get_booking_by_id(booking_id)
+            if not booking:
+                return None
+            return {
+                "etag": make_etag("booking", booking.id, booking.updated_at),
+                "body": jsonable_encoder(BookingResponse.from_orm(booking))
+            }
+        
+        # Served from the response cache until a write to this booking invalidates it
+        tag = booking_tag(booking_id)
+        cached = await response_cache.get_or_load(tag, load, tags=(tag, BOOKINGS_TAG))
+        if not cached:
             raise HTTPException(status_code=404, detail="Booking not found")
         
-        return BookingResponse.from_orm(booking)
+        unchanged = not_modified(request, cached["etag"])
+        if unchanged:
+            return unchanged
+        
+        set_etag(response, cached["etag"])
+        return cached["body"]
         
     except HTTPException:
         raise
@@ -117,16 +165,18 @@ async def update_booking(
     request: Request,  # Add Request parameter
     booking_id: str,
     booking_update: BookingUpdate,
-    db: Session = Depends(get_db)
+    response: Response,
+    db: AsyncSession = Depends(get_db)
 ):
     """Update a booking"""
     try:
         booking_service = BookingService(db)
-        booking = booking_service.update_booking(booking_id, booking_update)
+        booking = await booking_service.update_booking(booking_id, booking_update)
         
         if not booking:
             raise HTTPException(status_code=404, detail="Booking not found")
         
+        mark_recent_write(response)
         logger.info(f"Booking updated: {booking_id}")
         return BookingResponse.from_orm(booking)
         
@@ -143,18 +193,21 @@ async def update_booking_status(
     booking_id: str,
     status_update: BookingStatusUpdate,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
+    response: Response,
+    db: AsyncSession = Depends(get_db)
 ):
     """Update booking status"""
     try:
         booking_service = BookingService(db)
         email_service = EmailService()
         
-        booking = booking_service.update_status(booking_id, status_update.status)
+        booking = await booking_service.update_status(booking_id, status_update.status)
         
         if not booking:
             raise HTTPException(status_code=404, detail="Booking not found")
         
+        mark_recent_write(response)
+        
         # Send status update email
         background_tasks.add_task(
             email_service.send_status_update,
@@ -3,12 +3,12 @@
 Contact inquiry API endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Request
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 import logging
 
-from core.database import get_db
+from core.database import get_db, get_read_db, mark_recent_write
 from models.contact import ContactInquiry, InquiryType, InquiryStatus
 from schemas.contact import (
     ContactCreate, ContactResponse, ContactList,
@@ -16,18 +16,23 @@ from schemas.contact import (
 )
 from services.contact_service import ContactService
 from services.email_service import EmailService
+from utils.pagination import TotalMode
+from utils.etag import make_etag, not_modified, page_etag, set_etag
+from utils.idempotency import idempotent
 from utils.rate_limit import rate_limit
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 @router.post("/", response_model=ContactResponse, status_code=201)
+@idempotent(scope="contact", status_code=201)
 @rate_limit(requests=3, window=3600)  # 3 requests per hour
 async def create_contact(
     request: Request,  # Move Request to first parameter
     contact_data: ContactCreate,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
+    response: Response,
+    db: AsyncSession = Depends(get_db)
 ):
     """Submit a contact inquiry"""
     try:
@@ -35,11 +40,12 @@ async def create_contact(
         email_service = EmailService()
         
         # Create contact inquiry
-        contact = contact_service.create_inquiry(
+        contact = await contact_service.create_inquiry(
             contact_data, 
             request.client.host,
             request.headers.get("user-agent", "")
         )
+        mark_recent_write(response)
         
         # Send emails in background
         background_tasks.add_task(
@@ -63,29 +69,52 @@ async def create_contact(
 # @rate_limit(requests=20, window=3600)  # Add rate limiting
 async def list_contacts(
     request: Request,  # Add Request parameter
+    response: Response,
     status: Optional[InquiryStatus] = None,
     inquiry_type: Optional[InquiryType] = None,
     limit: int = 50,
     offset: int = 0,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    include_total: TotalMode = TotalMode.APPROX,
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """List contact inquiries"""
+    """List contact inquiries (pass next_cursor back as cursor for the next page)"""
     try:
         contact_service = ContactService(db)
-        contacts, total = contact_service.get_inquiries(
+        params = (status, inquiry_type, limit, offset, cursor)
+        total = await contact_service.count_inquiries(status, inquiry_type, include_total)
+        
+        # Revalidate against (id, updated_at) of the page before loading full rows
+        versions = await contact_service.get_page_versions(status, inquiry_type, limit, offset, cursor)
+        etag = page_etag("contacts", params, total, versions[:limit], len(versions) > limit)
+        unchanged = not_modified(request, etag)
+        if unchanged:
+            return unchanged
+        
+        contacts, _, next_cursor = await contact_service.get_inquiries(
             status=status,
             inquiry_type=inquiry_type,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor,
+            include_total=TotalMode.NONE
         )
+        set_etag(response, page_etag(
+            "contacts", params, total,
+            [(contact.id, contact.updated_at) for contact in contacts], next_cursor is not None
+        ))
         
         return ContactList(
             contacts=[ContactResponse.from_orm(contact) for contact in contacts],
             total=total,
+            total_is_exact=include_total == TotalMode.EXACT,
             limit=limit,
-            offset=offset
+            offset=offset,
+            next_cursor=next_cursor
         )
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error listing contacts: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to retrieve contacts")
@@ -95,17 +124,27 @@ async def list_contacts(
 async def get_contact(
     request: Request,  # Add Request parameter
     contact_id: int,
-    db: Session = Depends(get_db)
+    response: Response,
+    db: AsyncSession = Depends(get_db)
 ):
-    """Get contact inquiry by ID"""
+    """Get contact inquiry by ID (send If-None-Match with its ETag to revalidate)"""
     try:
         contact_service = ContactService(db)
         
-        contact = contact_service.get_inquiry_by_id(contact_id)
+        # A two-column lookup answers an unchanged inquiry without loading it
+        version = await contact_service.get_inquiry_version(contact_id)
+        if not version:
+            raise HTTPException(status_code=404, detail="Contact not found")
+        unchanged = not_modified(request, make_etag("contact", *version))
+        if unchanged:
+            return unchanged
+        
+        contact = await contact_service.get_inquiry_by_id(contact_id)
         
         if not contact:
             raise HTTPException(status_code=404, detail="Contact not found")
         
+        set_etag(response, make_etag("contact", contact.id, contact.updated_at))
         return ContactResponse.from_orm(contact)
         
     except HTTPException:
@@ -121,17 +160,19 @@ async def update_contact_status(
     request: Request,
     contact_id: int,
     status_data: dict,  # {"status": "new|responded|resolved"}
-    db: Session = Depends(get_db)
+    response: Response,
+    db: AsyncSession = Depends(get_db)
 ):
     """Update contact inquiry status"""
     try:
         contact_service = ContactService(db)
         
-        contact = contact_service.update_inquiry_status(contact_id, status_data.get("status"))
+        contact = await contact_service.update_inquiry_status(contact_id, status_data.get("status"))
         
         if not contact:
             raise HTTPException(status_code=404, detail="Contact not found")
         
+        mark_recent_write(response)
         logger.info(f"Contact status updated: {contact_id} -> {status_data.get('status')}")
         return ContactResponse.from_orm(contact)
         
@@ -143,12 +184,14 @@ async def update_contact_status(
     
 
 @router.post("/newsletter", response_model=NewsletterResponse, status_code=201)
+@idempotent(scope="newsletter", status_code=201)
 @rate_limit(requests=5, window=3600)  # 5 subscriptions per hour
 async def subscribe_newsletter(
     request: Request,  # Add Request parameter
     subscription_data: NewsletterSubscribe,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
+    response: Response,
+    db: AsyncSession = Depends(get_db)
 ):
     """Subscribe to newsletter"""
     try:
@@ -156,7 +199,8 @@ async def subscribe_newsletter(
         email_service = EmailService()
         
         # Create or update subscription
-        subscription = contact_service.subscribe_newsletter(subscription_data.email)
+        subscription = await contact_service.subscribe_newsletter(subscription_data.email)
+        mark_recent_write(response)
         
         # Send confirmation email
         background_tasks.add_task(
@@ -177,13 +221,13 @@ async def subscribe_newsletter(
 async def get_newsletter_subscriber(
     request: Request,  # Add Request parameter
     email: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get newsletter subscriber info"""
     try:
         contact_service = ContactService(db)
         
-        subscription = contact_service.get_subscription(email)
+        subscription = await contact_service.get_subscription(email)
         
         if not subscription:
             raise HTTPException(status_code=404, detail="Subscriber not found")
@@ -201,14 +245,14 @@ async def get_newsletter_subscriber(
 async def confirm_newsletter_subscription(
     request: Request,  # Add Request parameter
     email: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Confirm newsletter subscription"""
     try:
         contact_service = ContactService(db)
         
         # Capture the return value
-        subscription = contact_service.confirm_subscription(email)
+        subscription = await contact_service.confirm_subscription(email)
         
         if not subscription:
             raise HTTPException(status_code=404, detail="Subscription not found")
@@ -228,14 +272,14 @@ async def confirm_newsletter_subscription(
 async def unsubscribe_newsletter(
     request: Request,  # Add Request parameter
     email: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Unsubscribe from newsletter"""
     try:
         contact_service = ContactService(db)
         
         # Capture the return value
-        subscription = contact_service.unsubscribe_newsletter(email)
+        subscription = await contact_service.unsubscribe_newsletter(email)
         
         if not subscription:
             raise HTTPException(status_code=404, detail="Active subscription not found")
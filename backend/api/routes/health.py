@@ -4,13 +4,13 @@ Health check endpoints
 """
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 from datetime import datetime
 import psutil
 import os
 
-from core.database import get_db
+from core.database import get_db, get_pool_stats
 from core.config import get_settings
 from utils.rate_limit import get_rate_limit_stats
 
@@ -28,7 +28,7 @@ async def health_check():
     }
 
 @router.get("/detailed")
-async def detailed_health_check(db: Session = Depends(get_db)):
+async def detailed_health_check(db: AsyncSession = Depends(get_db)):
     """Detailed health check with database and system info"""
     health_info = {
         "status": "healthy",
@@ -41,8 +41,11 @@ async def detailed_health_check(db: Session = Depends(get_db)):
     
     # Database check
     try:
-        db.execute(text("SELECT 1"))
-        health_info["checks"]["database"] = {"status": "healthy"}
+        await db.execute(text("SELECT 1"))
+        health_info["checks"]["database"] = {
+            "status": "healthy",
+            "pools": get_pool_stats()
+        }
     except Exception as e:
         health_info["checks"]["database"] = {
             "status": "unhealthy",
@@ -72,11 +75,11 @@ async def liveness_probe():
     return {"status": "alive", "timestamp": datetime.utcnow().isoformat()}
 
 @router.get("/readiness")
-async def readiness_probe(db: Session = Depends(get_db)):
+async def readiness_probe(db: AsyncSession = Depends(get_db)):
     """Kubernetes readiness probe"""
     try:
         # Test database connection
-        db.execute(text("SELECT 1"))
+        await db.execute(text("SELECT 1"))
         return {"status": "ready", "timestamp": datetime.utcnow().isoformat()}
     except Exception:
         return {"status": "not ready", "timestamp": datetime.utcnow().isoformat()}
@@ -84,4 +87,9 @@ async def readiness_probe(db: Session = Depends(get_db)):
 @router.get("/rate-limit-stats")
 async def rate_limit_stats():
     """Get rate limiting statistics"""
-    return get_rate_limit_stats()
\ No newline at end of file
+    return get_rate_limit_stats()
+
+@router.get("/pool")
+async def pool_stats():
+    """Get database connection pool statistics"""
+    return get_pool_stats()
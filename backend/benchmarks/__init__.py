@@ -0,0 +1,4 @@
+# backend/benchmarks/__init__.py
+"""
+Performance benchmarks for the web services backend
+"""
@@ -0,0 +1,186 @@
+# backend/benchmarks/booking_stats.py
+"""
+Benchmark for BookingService.get_stats on a large bookings table
+
+Seeds a throwaway SQLite database (1M rows by default) and compares the old
+five-query implementation, the same queries extended to fill the whole
+BookingStats schema, and the current read from the daily rollups. Also
+reports how long a full rollup rebuild takes, the one remaining scan of the
+bookings table.
+
+Usage:
+    python -m benchmarks.booking_stats --rows 1000000 --days 365
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import tempfile
+import time
+import uuid
+from datetime import datetime, time as day_start, timedelta
+from pathlib import Path
+
+from sqlalchemy import and_, create_engine, event, func, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+import models
+from models.base import Base
+from models.booking import ServiceBooking, ServiceType, ProjectStatus
+from core.database import create_async_db_engine
+from services.booking_service import BookingService
+from services.stats_rollups import StatsRollupService
+
+def seed(path: Path, rows: int, days: int):
+    """Insert synthetic bookings spread over the last `days` days"""
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    now = datetime.utcnow()
+    statuses = list(ProjectStatus)
+    service_types = list(ServiceType)
+    chunk = 50_000
+
+    with engine.begin() as conn:
+        for start in range(0, rows, chunk):
+            batch = []
+            for _ in range(min(chunk, rows - start)):
+                created_at = now - timedelta(seconds=random.randint(0, days * 86400))
+                estimated_cost = round(random.uniform(600, 20000), 2)
+                batch.append({
+                    "booking_id": uuid.uuid4(),
+                    "service_type": random.choice(service_types),
+                    "project_name": "Benchmark Project",
+                    "description": "Synthetic booking for the stats benchmark",
+                    "timeline": "Within 1 month",
+                    "budget_range": "£2,500 - £5,000",
+                    "first_name": "Bench",
+                    "last_name": "Mark",
+                    "email": "bench@example.com",
+                    "status": random.choice(statuses),
+                    "estimated_cost": estimated_cost,
+                    "quote_amount": estimated_cost if random.random() < 0.4 else None,
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                    "is_active": random.random() > 0.02
+                })
+            conn.execute(insert(ServiceBooking), batch)
+    engine.dispose()
+
+async def legacy_get_stats(db, start_date: datetime, end_date: datetime) -> dict:
+    """The previous implementation: four counts plus a GROUP BY"""
+    period_filter = and_(
+        ServiceBooking.created_at >= start_date,
+        ServiceBooking.created_at <= end_date,
+        ServiceBooking.is_active == True
+    )
+
+    async def count(*criteria) -> int:
+        return await db.scalar(select(func.count(ServiceBooking.id)).where(period_filter, *criteria)) or 0
+
+    total_bookings = await count()
+    new_bookings = await count(ServiceBooking.status == ProjectStatus.PENDING)
+    completed_bookings = await count(ServiceBooking.status == ProjectStatus.COMPLETED)
+    service_types = await db.execute(
+        select(ServiceBooking.service_type, func.count(ServiceBooking.id))
+        .where(period_filter).group_by(ServiceBooking.service_type)
+    )
+    quoted = await count(ServiceBooking.status.in_([
+        ProjectStatus.QUOTED, ProjectStatus.ACCEPTED, ProjectStatus.IN_PROGRESS, ProjectStatus.COMPLETED
+    ]))
+    return {
+        "total_bookings": total_bookings,
+        "new_bookings": new_bookings,
+        "completed_bookings": completed_bookings,
+        "by_service_type": dict(service_types.all()),
+        "conversion_rate": round(quoted / total_bookings * 100, 2) if total_bookings else 0
+    }
+
+async def legacy_full_get_stats(db, start_date: datetime, end_date: datetime) -> dict:
+    """The previous implementation plus the by_status and average value queries it skipped"""
+    stats = await legacy_get_stats(db, start_date, end_date)
+    period_filter = and_(
+        ServiceBooking.created_at >= start_date,
+        ServiceBooking.created_at <= end_date,
+        ServiceBooking.is_active == True
+    )
+    statuses = await db.execute(
+        select(ServiceBooking.status, func.count(ServiceBooking.id))
+        .where(period_filter).group_by(ServiceBooking.status)
+    )
+    average = await db.scalar(
+        select(func.avg(func.coalesce(ServiceBooking.quote_amount, ServiceBooking.estimated_cost)))
+        .where(period_filter)
+    )
+    stats["by_status"] = dict(statuses.all())
+    stats["average_project_value"] = round(average, 2) if average is not None else None
+    return stats
+
+async def measure(session_factory, engine, function, start_date, end_date, repeat: int):
+    statements = []
+    listener = lambda *args: statements.append(1)
+    event.listen(engine.sync_engine, "before_cursor_execute", listener)
+    timings = []
+    try:
+        for _ in range(repeat):
+            statements.clear()
+            async with session_factory() as session:
+                started = time.perf_counter()
+                result = await function(session, start_date, end_date)
+                timings.append(time.perf_counter() - started)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", listener)
+    return min(timings), len(statements), result
+
+async def main(rows: int, days: int, window: int, repeat: int):
+    logging.disable(logging.WARNING)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "stats.db"
+        print(f"Seeding {rows:,} bookings...")
+        seed(path, rows, days)
+
+        engine = create_async_db_engine(f"sqlite+aiosqlite:///{path}", "bench_stats")
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        async with session_factory() as session:
+            started = time.perf_counter()
+            await StatsRollupService(session).rebuild()
+            rebuild_time = time.perf_counter() - started
+
+        # Rollups have day resolution, so start the window at midnight
+        end_date = datetime.utcnow()
+        start_date = datetime.combine((end_date - timedelta(days=window)).date(), day_start.min)
+
+        legacy_time, legacy_statements, legacy = await measure(
+            session_factory, engine, legacy_get_stats, start_date, end_date, repeat
+        )
+        full_time, full_statements, full = await measure(
+            session_factory, engine, legacy_full_get_stats, start_date, end_date, repeat
+        )
+        rollup_time, rollup_statements, rollup = await measure(
+            session_factory, engine,
+            lambda session, start, end: BookingService(session).get_stats(start, end),
+            start_date, end_date, repeat
+        )
+        await engine.dispose()
+
+    assert legacy["total_bookings"] == rollup["total_bookings"]
+    assert legacy["conversion_rate"] == rollup["conversion_rate"]
+    assert full["by_status"] == rollup["by_status"]
+
+    print(f"{'implementation':<16}{'statements':>12}{'best (ms)':>12}")
+    print(f"{'legacy':<16}{legacy_statements:>12}{legacy_time * 1000:>12.1f}")
+    print(f"{'legacy (full)':<16}{full_statements:>12}{full_time * 1000:>12.1f}")
+    print(f"{'rollups':<16}{rollup_statements:>12}{rollup_time * 1000:>12.1f}")
+    print(f"Reduction vs legacy: {(1 - rollup_time / legacy_time) * 100:.1f}%, "
+          f"vs legacy (full): {(1 - rollup_time / full_time) * 100:.1f}% "
+          f"({rollup['total_bookings']:,} bookings in a {window}-day window)")
+    print(f"Full rollup rebuild: {rebuild_time * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--days", type=int, default=730, help="spread of created_at values")
+    parser.add_argument("--window", type=int, default=365, help="stats window in days")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.days, args.window, args.repeat))
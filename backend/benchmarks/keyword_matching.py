@@ -0,0 +1,74 @@
+# backend/benchmarks/keyword_matching.py
+"""
+Benchmark for spam keyword scoring as the keyword list grows
+
+Scores a typical inquiry against keyword lists of increasing size, using the
+previous implementation (one `keyword in text` check per keyword) and the
+compiled KeywordMatcher, reporting build time and cost per scored inquiry.
+
+Usage:
+    python -m benchmarks.keyword_matching --sizes 10,100,1000,5000,20000 --iterations 2000
+"""
+
+import argparse
+import random
+import string
+import time
+
+from core.config import get_settings
+from utils.keywords import KeywordMatcher
+
+MESSAGE = (
+    "Hi, I run a small bakery and would like a new website with online ordering, "
+    "a gallery of our cakes and a contact form. We currently use a page builder but "
+    "it is slow and hard to update. Could you give me an idea of cost and timeline? "
+    "We would like to launch before the summer if possible. Thanks, Sam"
+) * 3
+
+def keyword_list(size: int, rng: random.Random) -> dict:
+    """The configured spam keywords padded with random words and phrases"""
+    weights = dict(get_settings().SPAM_KEYWORDS)
+    while len(weights) < size:
+        words = [
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10)))
+            for _ in range(rng.randint(1, 3))
+        ]
+        weights[" ".join(words)] = 0.3
+    return weights
+
+# The previous scoring, kept here for comparison
+
+def legacy_score(weights: dict, text: str) -> float:
+    text = text.lower()
+    score = 0.0
+    for keyword, weight in weights.items():
+        if keyword in text:
+            score += weight
+    return score
+
+def per_call_us(call, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+def main(sizes: list, iterations: int):
+    rng = random.Random(42)
+    print(f"{'keywords':>10}{'build (ms)':>14}{'legacy (us)':>16}{'matcher (us)':>16}")
+    for size in sizes:
+        weights = keyword_list(size, rng)
+        started = time.perf_counter()
+        matcher = KeywordMatcher(weights)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        assert abs(matcher.score(MESSAGE) - legacy_score(weights, MESSAGE)) < 1e-9
+        legacy = per_call_us(lambda: legacy_score(weights, MESSAGE), iterations)
+        compiled = per_call_us(lambda: matcher.score(MESSAGE), iterations)
+        print(f"{size:>10}{build_ms:>14.1f}{legacy:>16.1f}{compiled:>16.1f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10,100,1000,5000,20000")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    main([int(size) for size in args.sizes.split(",")], args.iterations)
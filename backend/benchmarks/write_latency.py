@@ -0,0 +1,209 @@
+# backend/benchmarks/write_latency.py
+"""
+Benchmark for booking, contact and newsletter write latency
+
+Runs each write against a throwaway SQLite database using the previous
+implementation (load, mutate, commit, then refresh() the row) and the current
+one (INSERT/UPDATE ... RETURNING), reporting statements and latency per call.
+
+Usage:
+    python -m benchmarks.write_latency --iterations 500
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+import models
+from models.base import Base
+from models.booking import ServiceType, ProjectStatus
+from models.newsletter import NewsletterSubscription
+from core.database import create_async_db_engine
+from schemas.booking import BookingCreate, BookingUpdate
+from schemas.contact import ContactCreate
+from services.booking_service import BookingService
+from services.contact_service import ContactService
+from services.pricing import pricing_registry
+from services.stats_rollups import booking_contribution, contact_contribution
+
+def booking_data(index: int) -> BookingCreate:
+    return BookingCreate(
+        service_type=ServiceType.WEB_APPLICATIONS,
+        project_name=f"Benchmark Project {index}",
+        description="A web application with user accounts and a reporting dashboard",
+        timeline="Within 1 month",
+        budget_range="£2,500 - £5,000",
+        technologies=["Python", "Vue.js"],
+        features=["User Authentication"],
+        first_name="Bench",
+        last_name="Mark",
+        email="bench@example.com"
+    )
+
+def contact_data(index: int) -> ContactCreate:
+    return ContactCreate(
+        first_name="Bench",
+        last_name="Mark",
+        email=f"bench{index}@example.com",
+        subject="Benchmark inquiry",
+        message="I would like to know more about your web development services"
+    )
+
+# The previous write paths, kept here for comparison
+
+async def legacy_create_booking(service: BookingService, index: int):
+    pricing = await pricing_registry.current(service.db)
+    booking = service._new_booking(booking_data(index), pricing)
+    service.db.add(booking)
+    await service.db.flush()
+    await service.db.refresh(booking)
+    await service.rollups.record_booking(None, booking_contribution(booking))
+    await service.db.commit()
+    return booking
+
+async def legacy_update_booking(service: BookingService, booking_id: str, notes: str):
+    booking = await service.get_booking_by_id(booking_id)
+    before = booking_contribution(booking)
+    booking.notes = notes
+    await service.rollups.record_booking(before, booking_contribution(booking))
+    await service.db.commit()
+    await service.db.refresh(booking)
+    return booking
+
+async def legacy_update_status(service: BookingService, booking_id: str, status: ProjectStatus):
+    booking = await service.get_booking_by_id(booking_id)
+    before = booking_contribution(booking)
+    booking.status = status
+    await service.rollups.record_booking(before, booking_contribution(booking))
+    await service.db.commit()
+    await service.db.refresh(booking)
+    return booking
+
+async def legacy_create_inquiry(service: ContactService, index: int):
+    inquiry = await service._new_inquiry(contact_data(index), "10.0.0.1", "benchmark")
+    service.db.add(inquiry)
+    await service.db.flush()
+    await service.db.refresh(inquiry)
+    await service.rollups.record_contact(None, contact_contribution(inquiry))
+    await service.db.commit()
+    return inquiry
+
+async def legacy_subscribe(service: ContactService, email: str):
+    existing = await service.db.scalar(
+        select(NewsletterSubscription).where(NewsletterSubscription.email == email).limit(1)
+    )
+    if existing:
+        if existing.unsubscribed_at:
+            existing.unsubscribed_at = None
+            existing.subscribed_at = datetime.utcnow()
+            existing.confirmed = False
+            await service.db.commit()
+            await service.db.refresh(existing)
+        return existing
+    subscription = NewsletterSubscription(email=email)
+    service.db.add(subscription)
+    await service.db.commit()
+    await service.db.refresh(subscription)
+    return subscription
+
+async def legacy_unsubscribe(service: ContactService, email: str):
+    subscription = await service.db.scalar(
+        select(NewsletterSubscription).where(
+            NewsletterSubscription.email == email,
+            NewsletterSubscription.unsubscribed_at == None
+        ).limit(1)
+    )
+    subscription.confirmed = False
+    subscription.unsubscribed_at = datetime.utcnow()
+    await service.db.commit()
+    await service.db.refresh(subscription)
+    return subscription
+
+def operations(legacy: bool, booking_ids: list):
+    """(name, call) pairs; call(session, i) performs one write"""
+    statuses = [ProjectStatus.REVIEWED, ProjectStatus.PENDING]
+
+    def booking(i):
+        return booking_ids[i % len(booking_ids)]
+
+    if legacy:
+        return [
+            ("create_booking", lambda db, i: legacy_create_booking(BookingService(db), i)),
+            ("update_booking", lambda db, i: legacy_update_booking(BookingService(db), booking(i), f"Note {i}")),
+            ("update_status", lambda db, i: legacy_update_status(BookingService(db), booking(i), statuses[i % 2])),
+            ("create_inquiry", lambda db, i: legacy_create_inquiry(ContactService(db), i)),
+            ("subscribe", lambda db, i: legacy_subscribe(ContactService(db), f"legacy{i}@example.com")),
+            ("unsubscribe", lambda db, i: legacy_unsubscribe(ContactService(db), f"legacy{i}@example.com")),
+        ]
+    return [
+        ("create_booking", lambda db, i: BookingService(db).create_booking(booking_data(i))),
+        ("update_booking", lambda db, i: BookingService(db).update_booking(
+            booking(i), BookingUpdate(notes=f"Note {i}")
+        )),
+        ("update_status", lambda db, i: BookingService(db).update_status(booking(i), statuses[i % 2])),
+        ("create_inquiry", lambda db, i: ContactService(db).create_inquiry(contact_data(i), "10.0.0.1", "benchmark")),
+        ("subscribe", lambda db, i: ContactService(db).subscribe_newsletter(f"current{i}@example.com")),
+        ("unsubscribe", lambda db, i: ContactService(db).unsubscribe_newsletter(f"current{i}@example.com")),
+    ]
+
+async def measure(session_factory, engine, call, iterations: int):
+    """Median and p95 latency (ms) and statements per call"""
+    statements = []
+    listener = lambda *args: statements.append(1)
+    event.listen(engine.sync_engine, "before_cursor_execute", listener)
+    timings = []
+    try:
+        for i in range(iterations):
+            async with session_factory() as session:
+                started = time.perf_counter()
+                await call(session, i)
+                timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", listener)
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.95) - 1], len(statements) / iterations
+
+async def main(iterations: int):
+    logging.disable(logging.WARNING)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "writes.db"
+        engine = create_async_db_engine(f"sqlite+aiosqlite:///{path}", "bench_writes")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+        async with session_factory() as session:
+            service = BookingService(session)
+            booking_ids = [str((await service.create_booking(booking_data(i))).booking_id) for i in range(100)]
+            # Warm the pricing cache so neither side pays for it
+            await pricing_registry.current(session)
+
+        results = {}
+        for legacy in (True, False):
+            for name, call in operations(legacy, booking_ids):
+                results[name, legacy] = await measure(session_factory, engine, call, iterations)
+        await engine.dispose()
+
+    print(f"{'write':<16}{'statements':>20}{'median (ms)':>20}{'p95 (ms)':>20}")
+    for name, _ in operations(False, booking_ids):
+        old, new = results[name, True], results[name, False]
+        print(
+            f"{name:<16}"
+            f"{f'{old[2]:.1f} -> {new[2]:.1f}':>20}"
+            f"{f'{old[0]:.2f} -> {new[0]:.2f}':>20}"
+            f"{f'{old[1]:.2f} -> {new[1]:.2f}':>20}"
+        )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
@@ -3,9 +3,9 @@
 Configuration management for the web services backend
 """
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, NoDecode
 from pydantic import EmailStr, validator
-from typing import List, Optional
+from typing import Annotated, Dict, List, Optional
 import os
 from functools import lru_cache
 from pathlib import Path
@@ -18,6 +18,14 @@ env_path = backend_dir / ".env"
 
 load_dotenv(dotenv_path=env_path)
 
+def to_async_url(url: str) -> str:
+    """Swap a database URL over to its async driver"""
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://")
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://")
+    return url
+
 class Settings(BaseSettings):
     """Application settings"""
     
@@ -27,7 +35,23 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = "sqlite:///./web_services.db"
+    DATABASE_READ_URL: Optional[str] = None  # replica for list/summary/stats reads
     DATABASE_ECHO: bool = False
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    DATABASE_POOL_RECYCLE: int = 300  # seconds before a connection is replaced
+    
+    # SQLite tuning (ignored for other databases)
+    SQLITE_PRODUCTION_MODE: bool = True  # WAL journaling, tuned pragmas, pooled connections
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024  # bytes
+    SQLITE_CACHE_SIZE: int = -64000  # negative values are KiB
+    SQLITE_BUSY_TIMEOUT: int = 5000  # milliseconds
+    SQLITE_FOREIGN_KEYS: bool = False  # enforce declared foreign keys, as PostgreSQL always does
+    
+    # Clients read from the primary for this long after their own writes
+    READ_YOUR_WRITES_SECONDS: int = 10
     
     # Security
     SECRET_KEY: str = "your-super-secret-key-change-in-production"
@@ -64,6 +88,64 @@ class Settings(BaseSettings):
     BUSINESS_PHONE: str = "07802738966"
     BUSINESS_ADDRESS: str = "118 Vellan Ave, Fishermead, Milton Keynes, MK6 2SW"
     
+    # Paginated list totals
+    LIST_COUNT_CACHE_TTL: int = 300  # seconds before cached list counts are recounted
+    
+    # Pricing
+    PRICING_CACHE_TTL: int = 60  # seconds before workers reload the current pricing rules
+    REESTIMATE_CHUNK_SIZE: int = 1000  # bookings re-priced per transaction
+    
+    # Bulk import
+    IMPORT_BATCH_SIZE: int = 500  # valid rows inserted per transaction
+    IMPORT_MAX_ERRORS: int = 1000  # per-line errors kept in an import report
+    EXPORT_CHUNK_SIZE: int = 1000  # rows fetched per round trip by streaming exports
+    
+    # Idempotency-Key support for create endpoints
+    IDEMPOTENCY_TTL: int = 86400  # seconds a stored response is replayed for
+    IDEMPOTENCY_LOCK_TIMEOUT: int = 60  # seconds before an unfinished request's key can be reclaimed
+    
+    # Response cache for hot reads (in-process LRU in front of Redis)
+    CACHE_ENABLED: bool = True
+    CACHE_MAX_ENTRIES: int = 1024  # per process
+    CACHE_LOCAL_TTL: int = 5  # seconds; bounds staleness after another worker's write
+    CACHE_TTL: int = 60  # seconds in the shared Redis tier
+    
+    # Background expiry of lapsed quotes
+    QUOTE_EXPIRY_ENABLED: bool = True
+    QUOTE_EXPIRY_INTERVAL: int = 3600  # seconds between sweeps
+    QUOTE_EXPIRY_BATCH_SIZE: int = 200  # bookings expired per write transaction
+    QUOTE_EXPIRY_MAX_BATCHES: int = 50  # per sweep; the next sweep continues
+    QUOTE_EXPIRY_BATCH_PAUSE: float = 0.05  # seconds between batches for other writers
+    
+    # Hot/cold archival; rows matching a rule move to the *_archive tables
+    ARCHIVE_ENABLED: bool = False  # run the archiver in the background
+    ARCHIVE_INTERVAL: int = 86400  # seconds between background runs
+    ARCHIVE_DATABASE_PATH: Optional[str] = None  # SQLite file attached for the archive tables
+    ARCHIVE_INACTIVE_DAYS: int = 30  # soft-deleted rows; 0 disables a rule
+    ARCHIVE_SPAM_DAYS: int = 30  # spam inquiries
+    ARCHIVE_CLOSED_DAYS: int = 730  # closed bookings and resolved inquiries
+    ARCHIVE_CLOSED_BOOKING_STATUSES: Annotated[List[str], NoDecode] = ["completed", "cancelled", "expired"]
+    ARCHIVE_BATCH_SIZE: int = 500  # rows moved per transaction
+    ARCHIVE_MAX_BATCHES: int = 100  # per rule and run; the next run continues
+    ARCHIVE_BATCH_PAUSE: float = 0.05  # seconds between batches for other writers
+    
+    # Contact inquiry scoring; keywords match case-insensitively anywhere in the text
+    SPAM_KEYWORDS: Dict[str, float] = {
+        keyword: 0.3 for keyword in [
+            "viagra", "casino", "lottery", "prize", "winner", "congratulations",
+            "urgent", "immediate", "act now", "limited time", "free money"
+        ]
+    }  # keyword -> spam score added when present (JSON in the environment)
+    SPAM_KEYWORDS_FILE: Optional[str] = None  # extra "keyword,weight" lines, merged over SPAM_KEYWORDS
+    PRIORITY_KEYWORDS: Annotated[List[str], NoDecode] = ["urgent", "asap", "immediate", "emergency", "critical"]  # in a subject
+    SPAM_VELOCITY_WINDOW: int = 3600  # seconds of submissions counted per IP address
+    SPAM_VELOCITY_LIMIT: int = 3  # earlier submissions in the window before the spam score rises
+    SPAM_VELOCITY_MAX_IPS: int = 10000  # addresses tracked per process when Redis is unavailable
+    SPAM_CLASSIFIER_ENABLED: bool = True  # blend in the classifier trained on inquiry statuses
+    SPAM_CLASSIFIER_WEIGHT: float = 0.8  # share of the content score from the classifier; 1 replaces the rules
+    SPAM_CLASSIFIER_MIN_DOCUMENTS: int = 20  # spam and non-spam inquiries needed before it is used
+    SPAM_CLASSIFIER_CACHE_TTL: int = 300  # seconds before workers reload the token counts
+    
     # Rate Limiting
     RATE_LIMIT_REQUESTS: int = 100
     RATE_LIMIT_WINDOW: int = 3600  # 1 hour
@@ -88,6 +170,12 @@ class Settings(BaseSettings):
             raise ValueError("ENVIRONMENT must be development, staging, or production")
         return v
     
+    @validator("SQLITE_SYNCHRONOUS")
+    def validate_sqlite_synchronous(cls, v):
+        if v.upper() not in ["OFF", "NORMAL", "FULL", "EXTRA"]:
+            raise ValueError("SQLITE_SYNCHRONOUS must be OFF, NORMAL, FULL, or EXTRA")
+        return v.upper()
+    
     @validator("ALLOWED_ORIGINS", pre=True)
     def parse_cors_origins(cls, v):
         if isinstance(v, str):
@@ -100,6 +188,18 @@ class Settings(BaseSettings):
             return [host.strip() for host in v.split(",")]
         return v
     
+    @validator("ARCHIVE_CLOSED_BOOKING_STATUSES", pre=True)
+    def parse_archive_statuses(cls, v):
+        if isinstance(v, str):
+            return [status.strip() for status in v.split(",") if status.strip()]
+        return v
+    
+    @validator("PRIORITY_KEYWORDS", pre=True)
+    def parse_priority_keywords(cls, v):
+        if isinstance(v, str):
+            return [keyword.strip() for keyword in v.split(",") if keyword.strip()]
+        return v
+    
     @property
     def is_development(self) -> bool:
         return self.ENVIRONMENT == "development"
@@ -118,9 +218,21 @@ class Settings(BaseSettings):
     @property
     def database_url_async(self) -> str:
         """Get asynchronous database URL"""
-        if self.DATABASE_URL.startswith("postgresql://"):
-            return self.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
-        return self.DATABASE_URL
+        return to_async_url(self.DATABASE_URL)
+    
+    @property
+    def archive_schema(self) -> Optional[str]:
+        """Schema of the archive tables: the attached archive file, or None for the main database"""
+        if self.ARCHIVE_DATABASE_PATH and self.DATABASE_URL.startswith("sqlite"):
+            return "archive"
+        return None
+    
+    @property
+    def database_read_url_async(self) -> Optional[str]:
+        """Get asynchronous read replica URL (None when reads use the primary)"""
+        if not self.DATABASE_READ_URL:
+            return None
+        return to_async_url(self.DATABASE_READ_URL)
     
     class Config:
         env_file = ".env"
@@ -3,43 +3,227 @@
 Database configuration and session management
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.pool import StaticPool
+from fastapi import Request, Response
+from typing import AsyncGenerator
 import logging
+import time
 
 from core.config import get_settings
+from core.pool_metrics import (
+    InstrumentedQueuePool, InstrumentedAsyncAdaptedQueuePool, describe_pool
+)
 from models.base import Base
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
-# Create database engine
-if settings.DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(
-        settings.DATABASE_URL,
+# Pool sizing shared by the pooled engines
+pool_options = {
+    "pool_size": settings.DATABASE_POOL_SIZE,
+    "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+    "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+    "pool_recycle": settings.DATABASE_POOL_RECYCLE
+}
+
+def is_sqlite_memory(url: str) -> bool:
+    """Check if a URL points at an in-memory SQLite database"""
+    return ":memory:" in url or url.split("://", 1)[1] in ("", "/")
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune every new SQLite connection for concurrent readers and writers"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    cursor.execute(f"PRAGMA cache_size={int(settings.SQLITE_CACHE_SIZE)}")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT)}")
+    if settings.SQLITE_FOREIGN_KEYS:
+        cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+def attach_archive_database(dbapi_connection, connection_record):
+    """Attach the cold archive file so the archive tables resolve on every connection"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("ATTACH DATABASE ? AS archive", (settings.ARCHIVE_DATABASE_PATH,))
+    cursor.close()
+
+def use_archive_database(db_engine, url: str):
+    """Attach ARCHIVE_DATABASE_PATH to a file-backed SQLite engine when configured"""
+    if settings.archive_schema and url.startswith("sqlite") and not is_sqlite_memory(url):
+        event.listen(db_engine, "connect", attach_archive_database)
+    return db_engine
+
+def create_db_engine(url: str, name: str, production_mode: bool = None):
+    """Create a synchronous engine (used for schema management and scripts)"""
+    if production_mode is None:
+        production_mode = settings.SQLITE_PRODUCTION_MODE
+
+    if not url.startswith("sqlite"):
+        return create_engine(
+            url,
+            echo=settings.DATABASE_ECHO,
+            pool_pre_ping=True,
+            poolclass=InstrumentedQueuePool,
+            pool_logging_name=f"{name}_sync",
+            **pool_options
+        )
+
+    if is_sqlite_memory(url) or not production_mode:
+        return use_archive_database(create_engine(
+            url,
+            echo=settings.DATABASE_ECHO,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool
+        ), url)
+
+    # Each thread checks out its own connection instead of sharing one
+    db_engine = create_engine(
+        url,
         echo=settings.DATABASE_ECHO,
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool
+        poolclass=InstrumentedQueuePool,
+        pool_logging_name=f"{name}_sync",
+        **pool_options
     )
-else:
-    engine = create_engine(
-        settings.database_url_sync,
+    event.listen(db_engine, "connect", set_sqlite_pragmas)
+    return use_archive_database(db_engine, url)
+
+def create_async_db_engine(url: str, name: str, production_mode: bool = None):
+    """Create an async engine (used by the API request path)"""
+    if production_mode is None:
+        production_mode = settings.SQLITE_PRODUCTION_MODE
+
+    if not url.startswith("sqlite"):
+        return create_async_engine(
+            url,
+            echo=settings.DATABASE_ECHO,
+            pool_pre_ping=True,
+            poolclass=InstrumentedAsyncAdaptedQueuePool,
+            pool_logging_name=name,
+            **pool_options
+        )
+
+    if is_sqlite_memory(url):
+        return create_async_engine(
+            url,
+            echo=settings.DATABASE_ECHO,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool
+        )
+
+    # aiosqlite runs every pooled connection on its own thread
+    db_engine = create_async_engine(
+        url,
         echo=settings.DATABASE_ECHO,
-        pool_pre_ping=True,
-        pool_recycle=300
+        connect_args={"check_same_thread": False},
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_logging_name=name,
+        **pool_options
     )
+    if production_mode:
+        event.listen(db_engine.sync_engine, "connect", set_sqlite_pragmas)
+    use_archive_database(db_engine.sync_engine, url)
+    return db_engine
+
+engine = create_db_engine(settings.database_url_sync, "primary")
+async_engine = create_async_db_engine(settings.database_url_async, "primary")
 
-# Create session factory
+# Replica for list/summary/stats reads; falls back to the primary
+if settings.database_read_url_async:
+    read_async_engine = create_async_db_engine(settings.database_read_url_async, "replica")
+else:
+    read_async_engine = async_engine
+
+# Create session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-def get_db() -> Session:
-    """Dependency to get database session"""
-    db = SessionLocal()
+# Objects stay loaded after commit so background tasks (emails) can read them
+# once the request session has been closed
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+class ReadOnlySession(Session):
+    """Session that refuses to write pending changes"""
+    
+    def flush(self, objects=None):
+        if self.new or self.dirty or self.deleted:
+            raise RuntimeError("Cannot write changes through a read-only session")
+        super().flush(objects)
+
+ReadSessionLocal = async_sessionmaker(
+    bind=read_async_engine,
+    class_=AsyncSession,
+    sync_session_class=ReadOnlySession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+# Cookie marking a client that has just written and should read the primary
+PRIMARY_STICKY_COOKIE = "db_primary_until"
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency to get an async database session"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def should_read_primary(request: Request) -> bool:
+    """Check if a request must see its own recent writes"""
+    if request.headers.get("x-read-consistency", "").lower() == "primary":
+        return True
+    
+    sticky_until = request.cookies.get(PRIMARY_STICKY_COOKIE)
+    if not sticky_until:
+        return False
     try:
+        return float(sticky_until) > time.time()
+    except ValueError:
+        return False
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Dependency to get a read-only session, served by the replica when configured"""
+    if read_async_engine is not async_engine and should_read_primary(request):
+        session_factory = AsyncSessionLocal
+    else:
+        session_factory = ReadSessionLocal
+    
+    async with session_factory() as db:
         yield db
-    finally:
-        db.close()
+
+def read_lag(request: Request) -> float:
+    """Seconds a get_read_db session for this request may trail the primary"""
+    if read_async_engine is async_engine or should_read_primary(request):
+        return 0
+    return settings.READ_YOUR_WRITES_SECONDS
+
+def mark_recent_write(response: Response):
+    """Pin the client's reads to the primary until replicas catch up"""
+    if read_async_engine is async_engine:
+        return
+    
+    response.set_cookie(
+        PRIMARY_STICKY_COOKIE,
+        str(time.time() + settings.READ_YOUR_WRITES_SECONDS),
+        max_age=settings.READ_YOUR_WRITES_SECONDS,
+        httponly=True,
+        samesite="lax"
+    )
+
+def get_pool_stats() -> dict:
+    """Get connection pool occupancy and checkout metrics"""
+    stats = {
+        "primary": describe_pool(async_engine.pool, "primary")
+    }
+    if read_async_engine is not async_engine:
+        stats["replica"] = describe_pool(read_async_engine.pool, "replica")
+    return stats
 
 def create_tables():
     """Create all database tables"""
@@ -52,4 +236,10 @@ def create_tables():
 
 def init_db():
     """Initialize database"""
-    create_tables()
\ No newline at end of file
+    create_tables()
+
+async def close_db():
+    """Dispose of pooled async connections"""
+    await async_engine.dispose()
+    if read_async_engine is not async_engine:
+        await read_async_engine.dispose()
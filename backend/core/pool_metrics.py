@@ -0,0 +1,132 @@
+# backend/core/pool_metrics.py
+"""
+Connection pool instrumentation and metrics
+"""
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+from typing import Dict, Optional, Tuple
+import threading
+import time
+
+# Upper bounds (seconds) of the checkout latency histogram buckets
+LATENCY_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+class PoolMetrics:
+    """Thread-safe counters for connection checkouts from a single pool"""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear all counters"""
+        with self._lock:
+            self.checkouts = 0
+            self.waits = 0
+            self.timeouts = 0
+            self.latency_sum = 0.0
+            self.latency_max = 0.0
+            self.bucket_counts = [0] * (len(self.buckets) + 1)
+
+    def record_checkout(self, duration: float, waited: bool):
+        """Record a successful checkout and how long it took"""
+        with self._lock:
+            self.checkouts += 1
+            if waited:
+                self.waits += 1
+            self.latency_sum += duration
+            self.latency_max = max(self.latency_max, duration)
+            self.bucket_counts[self._bucket_index(duration)] += 1
+
+    def record_timeout(self, duration: float):
+        """Record a checkout that gave up waiting for a connection"""
+        with self._lock:
+            self.waits += 1
+            self.timeouts += 1
+            self.bucket_counts[self._bucket_index(duration)] += 1
+
+    def _bucket_index(self, duration: float) -> int:
+        for index, upper_bound in enumerate(self.buckets):
+            if duration <= upper_bound:
+                return index
+        return len(self.buckets)
+
+    def snapshot(self) -> Dict:
+        """Get a copy of the counters with a cumulative latency histogram"""
+        with self._lock:
+            histogram = {}
+            cumulative = 0
+            for upper_bound, count in zip(self.buckets, self.bucket_counts):
+                cumulative += count
+                histogram[f"le_{upper_bound * 1000:g}ms"] = cumulative
+            histogram["le_inf"] = cumulative + self.bucket_counts[-1]
+
+            return {
+                "checkouts": self.checkouts,
+                "waits": self.waits,
+                "timeouts": self.timeouts,
+                "checkout_latency_ms": {
+                    "avg": round(self.latency_sum / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                    "max": round(self.latency_max * 1000, 3),
+                    "histogram": histogram
+                }
+            }
+
+# Metrics keyed by pool logging name, so they survive pool.recreate()
+_pool_metrics: Dict[str, PoolMetrics] = {}
+_registry_lock = threading.Lock()
+
+def get_pool_metrics(name: str) -> PoolMetrics:
+    """Get (or create) the metrics for a named pool"""
+    with _registry_lock:
+        if name not in _pool_metrics:
+            _pool_metrics[name] = PoolMetrics()
+        return _pool_metrics[name]
+
+class InstrumentedPoolMixin:
+    """Times every checkout and counts checkouts that had to wait"""
+
+    def _do_get(self):
+        metrics = get_pool_metrics(self._orig_logging_name or "default")
+        # No idle connection and no overflow headroom left: this checkout queues
+        # (max_overflow=-1 means unlimited overflow, so nothing ever queues)
+        waited = (
+            self._max_overflow > -1
+            and self.checkedin() == 0
+            and self.overflow() >= self._max_overflow
+        )
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            metrics.record_timeout(time.perf_counter() - start)
+            raise
+        metrics.record_checkout(time.perf_counter() - start, waited)
+        return connection
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    """QueuePool with checkout metrics"""
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool with checkout metrics"""
+
+def describe_pool(pool, name: Optional[str] = None) -> Dict:
+    """Current pool occupancy plus recorded checkout metrics"""
+    stats = {"pool_class": type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow,
+            "timeout": pool.timeout()
+        })
+
+    if name in _pool_metrics:
+        stats.update(_pool_metrics[name].snapshot())
+
+    return stats
@@ -16,7 +16,11 @@ from typing import Optional
 
 from core.config import get_settings
 from api.routes import bookings, contact, health, admin
+from services.archive_service import archive_sweeper
 from services.email_service import EmailService
+from services.quote_expiry import quote_expiry_sweeper
+from services.response_cache import response_cache
+from services.submission_velocity import submission_velocity
 from utils.logger import setup_logging
 from utils.rate_limit import init_rate_limiter
 
@@ -88,6 +92,30 @@ async def startup_event():
         logger.warning(f"Failed to initialize Redis rate limiter: {str(e)}")
         logger.warning("Rate limiting will be disabled")
 
+    # Share cached responses between workers through Redis
+    try:
+        await response_cache.connect(getattr(settings, 'REDIS_URL', 'redis://localhost:6379'))
+    except Exception as e:
+        logger.warning(f"Response cache Redis tier unavailable: {str(e)}")
+        logger.warning("Caching responses in-process only")
+
+    # Share per-IP submission counts between workers through Redis
+    try:
+        await submission_velocity.connect(getattr(settings, 'REDIS_URL', 'redis://localhost:6379'))
+    except Exception as e:
+        logger.warning(f"Submission velocity Redis tier unavailable: {str(e)}")
+        logger.warning("Counting submissions in-process only")
+
+    # Expire lapsed quotes in the background
+    if settings.QUOTE_EXPIRY_ENABLED:
+        quote_expiry_sweeper.start()
+        logger.info(f"Quote expiry sweeper running every {settings.QUOTE_EXPIRY_INTERVAL}s")
+
+    # Move aged rows to the archive tables in the background
+    if settings.ARCHIVE_ENABLED:
+        archive_sweeper.start()
+        logger.info(f"Archiver running every {settings.ARCHIVE_INTERVAL}s")
+
     # Initialize email service (if needed)
     try:
         email_service = EmailService()
@@ -103,6 +131,14 @@ async def shutdown_event():
     """Cleanup on shutdown"""
     logger.info("Shutting down Harry Sibbenga Web Services API")
 
+    await quote_expiry_sweeper.stop()
+    await archive_sweeper.stop()
+
+    from core.database import close_db
+    await close_db()
+    await response_cache.close()
+    await submission_velocity.close()
+
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
     """Custom HTTP exception handler"""
@@ -7,6 +7,15 @@ from .base import Base, BaseModel
 from .booking import ServiceBooking, ServiceType, ProjectStatus, ProjectComplexity
 from .contact import ContactInquiry, InquiryType, InquiryStatus
 from .newsletter import NewsletterSubscription
+from .rollup import BookingDailyRollup, ContactDailyRollup
+from .pricing import PricingRuleSet
+from .idempotency import IdempotencyRecord
+from .activity import ActivityLogEntry
+from .archive import ArchivedServiceBooking, ArchivedContactInquiry
+from .spam import SpamTokenCount
+from .search import register_search_indexes
+
+register_search_indexes()
 
 __all__ = [
     "Base",
@@ -18,5 +27,13 @@ __all__ = [
     "ContactInquiry",
     "InquiryType",
     "InquiryStatus",
-    "NewsletterSubscription"
+    "NewsletterSubscription",
+    "BookingDailyRollup",
+    "ContactDailyRollup",
+    "PricingRuleSet",
+    "IdempotencyRecord",
+    "ActivityLogEntry",
+    "ArchivedServiceBooking",
+    "ArchivedContactInquiry",
+    "SpamTokenCount"
 ]
\ No newline at end of file
@@ -0,0 +1,27 @@
+# backend/models/activity.py
+"""
+Audit trail of changes made to bookings and inquiries
+"""
+
+from sqlalchemy import Column, DateTime, Index, Integer, JSON, String
+from datetime import datetime
+
+from .base import Base
+
+class ActivityLogEntry(Base):
+    """One recorded change to an entity, newest read first"""
+    __tablename__ = "activity_log"
+    __table_args__ = (
+        Index("ix_activity_log_entity", "entity_type", "entity_id", "timestamp"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    timestamp = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+    action = Column(String(50), nullable=False)
+    entity_type = Column(String(50), nullable=False)
+    entity_id = Column(String(64), nullable=False)
+    actor = Column(String(255), nullable=True)  # admin email or background job name
+    details = Column(JSON, nullable=True)
+
+    def __repr__(self):
+        return f"<ActivityLogEntry {self.action} {self.entity_type} {self.entity_id}>"
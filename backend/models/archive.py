@@ -0,0 +1,59 @@
+# backend/models/archive.py
+"""
+Cold archive copies of the booking and inquiry tables
+"""
+
+from sqlalchemy import Column, DateTime, Index, Table
+
+from core.config import get_settings
+from .base import Base
+from .booking import ServiceBooking
+from .contact import ContactInquiry
+
+settings = get_settings()
+
+def archive_table(model, *indexes) -> Table:
+    """Same columns as the hot table plus archived_at, with only the indexes given
+
+    Rows keep their hot-table id, so moving a row twice cannot duplicate it.
+    """
+    source = model.__table__
+    columns = [
+        Column(column.name, column.type, primary_key=column.primary_key, nullable=column.nullable)
+        for column in source.columns
+    ]
+    return Table(
+        f"{source.name}_archive",
+        Base.metadata,
+        *columns,
+        Column("archived_at", DateTime, nullable=False),
+        *indexes,
+        schema=settings.archive_schema
+    )
+
+class ArchivedServiceBooking(Base):
+    """A booking moved out of service_bookings by the archiver"""
+    __table__ = archive_table(
+        ServiceBooking,
+        Index("ix_service_bookings_archive_booking_id", "booking_id", unique=True),
+        Index("ix_service_bookings_archive_archived_at", "archived_at")
+    )
+
+    def __repr__(self):
+        return f"<ArchivedServiceBooking {self.booking_id}: {self.project_name}>"
+
+class ArchivedContactInquiry(Base):
+    """A contact inquiry moved out of contact_inquiries by the archiver"""
+    __table__ = archive_table(
+        ContactInquiry,
+        Index("ix_contact_inquiries_archive_archived_at", "archived_at")
+    )
+
+    def __repr__(self):
+        return f"<ArchivedContactInquiry {self.id}: {self.subject}>"
+
+# Archive model for each hot model
+ARCHIVE_MODELS = {
+    ServiceBooking: ArchivedServiceBooking,
+    ContactInquiry: ArchivedContactInquiry
+}
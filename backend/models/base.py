@@ -12,6 +12,9 @@ Base = declarative_base()
 class BaseModel(Base):
     """Base model with common fields"""
     __abstract__ = True
+    # Fetch server-generated columns (id, timestamps) with INSERT/UPDATE ... RETURNING
+    # instead of expiring them, so writes never need a refresh() round trip
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(Integer, primary_key=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
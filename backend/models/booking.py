@@ -3,7 +3,7 @@
 Service booking model for project inquiries
 """
 
-from sqlalchemy import Column, String, Text, Float, JSON, Enum, DateTime
+from sqlalchemy import Column, String, Text, Float, Integer, JSON, Enum, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.types import TypeDecorator, CHAR
 import uuid
@@ -27,6 +27,7 @@ class ProjectStatus(str, enum.Enum):
     IN_PROGRESS = "in_progress"
     COMPLETED = "completed"
     CANCELLED = "cancelled"
+    EXPIRED = "expired"  # quote lapsed without being accepted
 
 class ProjectComplexity(str, enum.Enum):
     SIMPLE = "simple"
@@ -67,6 +68,14 @@ class GUID(TypeDecorator):
 class ServiceBooking(BaseModel):
     """Service booking model"""
     __tablename__ = "service_bookings"
+    __table_args__ = (
+        # List and stats queries filter on is_active and sort/range on created_at
+        Index("ix_service_bookings_active_created", "is_active", "created_at"),
+        Index("ix_service_bookings_active_status_created", "is_active", "status", "created_at"),
+        Index("ix_service_bookings_active_type_created", "is_active", "service_type", "created_at"),
+        # Quote-expiry sweeps find lapsed quotes without scanning the table
+        Index("ix_service_bookings_status_quote_valid_until", "status", "quote_valid_until"),
+    )
     
     # Unique identifier
     booking_id = Column(GUID(), default=uuid.uuid4, unique=True, index=True)
@@ -84,6 +93,7 @@ class ServiceBooking(BaseModel):
     complexity = Column(Enum(ProjectComplexity), nullable=True)
     estimated_hours = Column(Float, nullable=True)
     estimated_cost = Column(Float, nullable=True)
+    pricing_version = Column(Integer, nullable=True)  # pricing rules behind the estimate
     
     # Client information
     first_name = Column(String(100), nullable=False)
@@ -3,7 +3,7 @@
 Contact inquiry model for general inquiries
 """
 
-from sqlalchemy import Column, String, Text, Enum, Float, DateTime
+from sqlalchemy import Column, String, Text, Enum, Float, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID
 import enum
 
@@ -28,6 +28,12 @@ class InquiryStatus(str, enum.Enum):
 class ContactInquiry(BaseModel):
     """Contact inquiry model"""
     __tablename__ = "contact_inquiries"
+    __table_args__ = (
+        # List and stats queries filter on is_active and sort/range on created_at
+        Index("ix_contact_inquiries_active_created", "is_active", "created_at"),
+        Index("ix_contact_inquiries_active_status_created", "is_active", "status", "created_at"),
+        Index("ix_contact_inquiries_active_type_created", "is_active", "inquiry_type", "created_at"),
+    )
     
     # Contact details
     first_name = Column(String(100), nullable=False)
@@ -43,6 +49,7 @@ class ContactInquiry(BaseModel):
     
     # Management
     status = Column(Enum(InquiryStatus), default=InquiryStatus.NEW)
+    status_set_by = Column(String(255), nullable=True)  # NULL while the status is the one scored on arrival
     priority = Column(String(20), default="normal")
     
     # Response tracking
@@ -0,0 +1,24 @@
+# backend/models/idempotency.py
+"""
+Stored responses for requests sent with an Idempotency-Key header
+"""
+
+from sqlalchemy import Column, DateTime, Integer, JSON, String
+
+from .base import Base
+
+class IdempotencyRecord(Base):
+    """The first response to an idempotent request, replayed to its retries"""
+    __tablename__ = "idempotency_keys"
+
+    scope = Column(String(100), primary_key=True)  # endpoint the key was used on
+    key = Column(String(255), primary_key=True)
+    request_hash = Column(String(64), nullable=False)
+    # Both None while the first request is still being processed
+    status_code = Column(Integer, nullable=True)
+    response_body = Column(JSON, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<IdempotencyRecord {self.scope} {self.key}: {self.status_code}>"
@@ -0,0 +1,19 @@
+# backend/models/pricing.py
+"""
+Versioned pricing rules used to estimate bookings
+"""
+
+from sqlalchemy import Column, Integer, JSON, Text
+
+from .base import BaseModel
+
+class PricingRuleSet(BaseModel):
+    """One published version of the pricing rules"""
+    __tablename__ = "pricing_rule_sets"
+    
+    version = Column(Integer, nullable=False, unique=True, index=True)
+    rules = Column(JSON, nullable=False)
+    notes = Column(Text, nullable=True)
+    
+    def __repr__(self):
+        return f"<PricingRuleSet v{self.version}>"
@@ -0,0 +1,42 @@
+# backend/models/rollup.py
+"""
+Daily statistics rollups maintained alongside booking and contact writes
+"""
+
+from sqlalchemy import Column, Date, Enum, Float, Integer
+
+from .base import Base
+from .booking import ServiceType, ProjectStatus
+from .contact import InquiryType, InquiryStatus
+
+class BookingDailyRollup(Base):
+    """Active booking totals per day, service type and status"""
+    __tablename__ = "booking_daily_rollups"
+
+    day = Column(Date, primary_key=True)
+    service_type = Column(Enum(ServiceType), primary_key=True)
+    status = Column(Enum(ProjectStatus), primary_key=True)
+
+    booking_count = Column(Integer, nullable=False, default=0)
+    quoted_sum = Column(Float, nullable=False, default=0.0)
+    estimate_sum = Column(Float, nullable=False, default=0.0)
+    estimate_count = Column(Integer, nullable=False, default=0)
+    # Project value is the quote when there is one, otherwise the estimate
+    value_sum = Column(Float, nullable=False, default=0.0)
+    value_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<BookingDailyRollup {self.day} {self.service_type} {self.status}: {self.booking_count}>"
+
+class ContactDailyRollup(Base):
+    """Active inquiry totals per day, inquiry type and status"""
+    __tablename__ = "contact_daily_rollups"
+
+    day = Column(Date, primary_key=True)
+    inquiry_type = Column(Enum(InquiryType), primary_key=True)
+    status = Column(Enum(InquiryStatus), primary_key=True)
+
+    inquiry_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<ContactDailyRollup {self.day} {self.inquiry_type} {self.status}: {self.inquiry_count}>"
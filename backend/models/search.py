@@ -0,0 +1,98 @@
+# backend/models/search.py
+"""
+Full-text search indexes for bookings and contact inquiries
+
+SQLite gets an external-content FTS5 table per searchable table, kept in sync
+by triggers; PostgreSQL gets a GIN index over the same columns' tsvector.
+Both are created alongside their table by ``Base.metadata.create_all``.
+"""
+
+from sqlalchemy import event
+from typing import Dict, List, Tuple
+
+from .base import Base
+
+# Searchable text columns per table, in the order they are indexed
+SEARCH_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "service_bookings": ("project_name", "description", "company", "client_notes"),
+    "contact_inquiries": ("subject", "message")
+}
+
+# PostgreSQL text search configuration used by both the index and queries
+SEARCH_CONFIG = "english"
+
+def fts_table_name(table_name: str) -> str:
+    """Name of the SQLite FTS5 table shadowing a searchable table"""
+    return f"{table_name}_fts"
+
+def search_vector_sql(table_name: str) -> str:
+    """tsvector expression the PostgreSQL GIN index is built on
+
+    Queries must use this exact expression for the planner to pick the index.
+    """
+    document = " || ' ' || ".join(
+        f"coalesce({column}, '')" for column in SEARCH_COLUMNS[table_name]
+    )
+    return f"to_tsvector('{SEARCH_CONFIG}', {document})"
+
+def sqlite_search_ddl(table_name: str) -> List[str]:
+    """Statements creating the FTS5 table and the triggers that keep it in sync"""
+    fts = fts_table_name(table_name)
+    columns = SEARCH_COLUMNS[table_name]
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    insert_new = f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values});"
+    delete_old = (
+        f"INSERT INTO {fts}({fts}, rowid, {column_list}) "
+        f"VALUES ('delete', old.id, {old_values});"
+    )
+
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{column_list}, content='{table_name}', content_rowid='id', "
+        f"tokenize='porter unicode61')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table_name} "
+        f"BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table_name} "
+        f"BEGIN {delete_old} END",
+        # Only text edits touch the index; status changes and the like do not
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {column_list} ON {table_name} "
+        f"BEGIN {delete_old} {insert_new} END"
+    ]
+
+def sqlite_rebuild_sql(table_name: str) -> str:
+    """Statement re-reading every row of the content table into its FTS5 index"""
+    fts = fts_table_name(table_name)
+    return f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"
+
+def postgres_search_ddl(table_name: str) -> List[str]:
+    """Statements creating the GIN index over the table's tsvector"""
+    return [
+        f"CREATE INDEX IF NOT EXISTS ix_{table_name}_search ON {table_name} "
+        f"USING GIN ({search_vector_sql(table_name)})"
+    ]
+
+def _create_search_index(table, connection, **kw):
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        statements = sqlite_search_ddl(table.name)
+    elif dialect == "postgresql":
+        statements = postgres_search_ddl(table.name)
+    else:
+        return
+    for statement in statements:
+        connection.exec_driver_sql(statement)
+
+def _drop_search_index(table, connection, **kw):
+    # Triggers and the GIN index go with the table; the FTS5 table does not
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {fts_table_name(table.name)}")
+
+def register_search_indexes(metadata=Base.metadata):
+    """Create and drop search indexes together with their tables"""
+    for table_name in SEARCH_COLUMNS:
+        table = metadata.tables[table_name]
+        if not event.contains(table, "after_create", _create_search_index):
+            event.listen(table, "after_create", _create_search_index)
+            event.listen(table, "before_drop", _drop_search_index)
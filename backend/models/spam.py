@@ -0,0 +1,23 @@
+# backend/models/spam.py
+"""
+Token counts behind the contact inquiry spam classifier
+"""
+
+from sqlalchemy import Column, Integer, String
+
+from .base import Base
+
+class SpamTokenCount(Base):
+    """How many spam and non-spam inquiries contain a token
+
+    The row with an empty token holds the number of spam and non-spam
+    inquiries themselves.
+    """
+    __tablename__ = "spam_token_counts"
+
+    token = Column(String(64), primary_key=True)
+    spam_count = Column(Integer, nullable=False, default=0)
+    ham_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<SpamTokenCount {self.token!r}: {self.spam_count}/{self.ham_count}>"
@@ -3,12 +3,15 @@
 Pydantic schemas for admin endpoints
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+import uuid
 
-from models.booking import ServiceType, ProjectStatus
+from models.booking import ServiceType, ProjectStatus, ProjectComplexity
 from models.contact import InquiryType, InquiryStatus
+from schemas.booking import BookingResponse
+from schemas.contact import ContactResponse
 
 class AdminLogin(BaseModel):
     email: str
@@ -39,6 +42,14 @@ class ContactStats(BaseModel):
     by_status: Dict[InquiryStatus, int]
     spam_rate: float
 
+class MonthlyRevenue(BaseModel):
+    """Revenue figures for one calendar month"""
+    month: str
+    total_quoted: float
+    total_accepted: float
+    total_completed: float
+    average_project_size: float
+
 class RevenueStats(BaseModel):
     """Revenue statistics"""
     total_quoted: float
@@ -46,6 +57,7 @@ class RevenueStats(BaseModel):
     total_completed: float
     average_project_size: float
     monthly_recurring: float
+    monthly: Optional[List[MonthlyRevenue]] = None
 
 class AdminStats(BaseModel):
     """Combined admin statistics"""
@@ -82,4 +94,111 @@ class ActivityLog(BaseModel):
     action: str
     entity_type: str
     entity_id: str
-    details: Dict[str, Any]
\ No newline at end of file
+    actor: Optional[str] = None
+    details: Dict[str, Any] = {}
+
+class PricingRuleSetCreate(BaseModel):
+    """A new pricing rules version"""
+    hourly_rate: float = Field(..., gt=0)
+    hours_per_feature: float = Field(..., ge=0)
+    base_hours: Dict[ServiceType, float]
+    complexity_multipliers: Dict[ProjectComplexity, float]
+    technology_points: int = 2
+    feature_points: int = 2
+    complex_feature_points: int = 5
+    complex_features: List[str] = []
+    description_points: List[List[int]] = [[500, 10], [200, 5]]
+    simple_below: int = 20
+    medium_below: int = 40
+    notes: Optional[str] = None
+
+class PricingRuleSetResponse(BaseModel):
+    """A published pricing rules version"""
+    version: int
+    rules: Dict[str, Any]
+    notes: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+class ReestimateRequest(BaseModel):
+    """Which bookings a bulk re-estimate should re-price"""
+    statuses: List[ProjectStatus] = [ProjectStatus.PENDING, ProjectStatus.REVIEWED]
+    chunk_size: Optional[int] = Field(None, ge=1, le=10000)
+
+class ReestimateResult(BaseModel):
+    """Outcome of a bulk re-estimate"""
+    pricing_version: int
+    bookings_repriced: int
+    estimates_changed: int
+    chunks: int
+    duration_seconds: float
+
+# Most rows one bulk status change may touch
+MAX_BULK_STATUS_IDS = 500
+
+class BookingBulkStatusUpdate(BaseModel):
+    """Move several bookings to one status"""
+    booking_ids: List[uuid.UUID] = Field(..., min_length=1, max_length=MAX_BULK_STATUS_IDS)
+    status: ProjectStatus
+
+class ContactBulkStatusUpdate(BaseModel):
+    """Move several contact inquiries to one status"""
+    contact_ids: List[int] = Field(..., min_length=1, max_length=MAX_BULK_STATUS_IDS)
+    status: InquiryStatus
+
+class BulkStatusResult(BaseModel):
+    """Outcome of a bulk status change"""
+    status: str
+    updated: List[str]
+    not_found: List[str]
+    emails_queued: int = 0
+
+class ArchiveResult(BaseModel):
+    """Rows moved to the archive per rule (or that would be, on a dry run)"""
+    archived: Dict[str, int]
+    batches: int = 0
+    duration_seconds: float = 0.0
+    dry_run: bool = False
+
+class ImportLineError(BaseModel):
+    """Why one line of an import was rejected"""
+    line: int
+    errors: List[str]
+
+class ImportResult(BaseModel):
+    """Outcome of a bulk import"""
+    entity: str
+    processed: int
+    imported: int
+    failed: int
+    errors: List[ImportLineError]
+    errors_truncated: bool = False
+
+class BookingSearchHit(BookingSummary):
+    """Booking matching a full-text search"""
+    rank: float
+
+class ContactSearchHit(ContactSummary):
+    """Contact inquiry matching a full-text search"""
+    rank: float
+
+class BookingSearchResults(BaseModel):
+    """Page of booking search results, best match first"""
+    results: List[BookingSearchHit]
+    limit: int
+    offset: int
+    has_more: bool
+
+class ContactSearchResults(BaseModel):
+    """Page of contact inquiry search results, best match first"""
+    results: List[ContactSearchHit]
+    limit: int
+    offset: int
+    has_more: bool
+
+class AdminBookingResponse(BookingResponse):
+    """A booking as the admin sees it, which may come from the archive"""
+    archived_at: Optional[datetime] = None
+
+class AdminContactResponse(ContactResponse):
+    """A contact inquiry as the admin sees it, which may come from the archive"""
+    archived_at: Optional[datetime] = None
@@ -108,7 +108,9 @@ class BookingResponse(BaseModel):
 class BookingList(BaseModel):
     """Schema for paginated booking list"""
     bookings: List[BookingResponse]
-    total: int
+    total: Optional[int]  # None when the total was not requested
+    total_is_exact: bool = True
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
 
@@ -68,9 +68,11 @@ class ContactResponse(BaseModel):
 class ContactList(BaseModel):
     """Schema for paginated contact list"""
     contacts: List[ContactResponse]
-    total: int
+    total: Optional[int]  # None when the total was not requested
+    total_is_exact: bool = True
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
 
 class NewsletterSubscribe(BaseModel):
     """Schema for newsletter subscription"""
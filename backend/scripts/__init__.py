@@ -0,0 +1,4 @@
+# backend/scripts/__init__.py
+"""
+Maintenance commands for the web services backend
+"""
@@ -0,0 +1,43 @@
+# backend/scripts/archive_rows.py
+"""
+Move aged bookings and inquiries from the hot tables to the archive tables
+
+Rules and batch sizes come from the ARCHIVE_* settings. The API can run the
+same job in the background (ARCHIVE_ENABLED=true) or on demand through
+POST /api/admin/archive.
+
+Usage:
+    python -m scripts.archive_rows --dry-run
+    python -m scripts.archive_rows --batch-size 500
+"""
+
+import argparse
+import asyncio
+
+from core.database import AsyncSessionLocal, close_db, init_db
+from services.archive_service import ArchiveService
+
+async def main(dry_run: bool, batch_size: int, max_batches: int):
+    init_db()
+    try:
+        async with AsyncSessionLocal() as db:
+            service = ArchiveService(db)
+            if dry_run:
+                counts = await service.count_matching()
+            else:
+                result = await service.archive(batch_size=batch_size, max_batches=max_batches)
+                counts = result["archived"]
+    finally:
+        await close_db()
+
+    verb = "Would archive" if dry_run else "Archived"
+    for rule, count in counts.items():
+        print(f"{verb} {count:,} {rule}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dry-run", action="store_true", help="Only count the rows each rule would move")
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--max-batches", type=int, default=None)
+    args = parser.parse_args()
+    asyncio.run(main(args.dry_run, args.batch_size, args.max_batches))
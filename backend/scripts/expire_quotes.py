@@ -0,0 +1,33 @@
+# backend/scripts/expire_quotes.py
+"""
+Expire quotes that passed quote_valid_until without being accepted
+
+The API runs the same sweep in the background every QUOTE_EXPIRY_INTERVAL
+seconds; use this to run it from cron instead (QUOTE_EXPIRY_ENABLED=false).
+
+Usage:
+    python -m scripts.expire_quotes --batch-size 200
+"""
+
+import argparse
+import asyncio
+
+from core.database import AsyncSessionLocal, close_db, init_db
+from services.quote_expiry import QuoteExpiryService
+
+async def main(batch_size: int, max_batches: int):
+    init_db()
+    try:
+        async with AsyncSessionLocal() as db:
+            result = await QuoteExpiryService(db).expire_quotes(batch_size, max_batches)
+    finally:
+        await close_db()
+
+    print(f"Expired {result['expired']:,} quotes in {result['batches']} batches ({result['duration_seconds']}s)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--max-batches", type=int, default=None)
+    args = parser.parse_args()
+    asyncio.run(main(args.batch_size, args.max_batches))
@@ -0,0 +1,30 @@
+# backend/scripts/rebuild_rollups.py
+"""
+Regenerate the daily statistics rollups from the raw bookings and inquiries
+
+Run once after upgrading an existing database, or whenever rows were changed
+outside BookingService/ContactService.
+
+Usage:
+    python -m scripts.rebuild_rollups
+"""
+
+import argparse
+import asyncio
+
+from core.database import AsyncSessionLocal, close_db, init_db
+from services.stats_rollups import StatsRollupService
+
+async def main():
+    init_db()
+    try:
+        async with AsyncSessionLocal() as db:
+            counts = await StatsRollupService(db).rebuild()
+    finally:
+        await close_db()
+
+    print(f"Rebuilt {counts['booking_rollups']:,} booking and {counts['contact_rollups']:,} contact rollup rows")
+
+if __name__ == "__main__":
+    argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter).parse_args()
+    asyncio.run(main())
@@ -0,0 +1,35 @@
+# backend/scripts/train_spam_classifier.py
+"""
+Recount the spam classifier's token counts from every judged inquiry
+
+Counts are kept up to date as statuses change; run this once after upgrading
+an existing database, or whenever inquiries were changed outside
+ContactService. Hot and archived inquiries are both used; spam filed
+automatically on arrival is left out until a person confirms it.
+
+Usage:
+    python -m scripts.train_spam_classifier
+"""
+
+import argparse
+import asyncio
+
+from core.database import AsyncSessionLocal, close_db, init_db
+from services.spam_classifier import SpamTokenService
+
+async def main():
+    init_db()
+    try:
+        async with AsyncSessionLocal() as db:
+            counts = await SpamTokenService(db).rebuild()
+    finally:
+        await close_db()
+
+    print(
+        f"Trained on {counts['spam_documents']:,} spam and {counts['ham_documents']:,} "
+        f"other inquiries ({counts['tokens']:,} distinct tokens)"
+    )
+
+if __name__ == "__main__":
+    argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter).parse_args()
+    asyncio.run(main())
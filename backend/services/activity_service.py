@@ -0,0 +1,48 @@
+# backend/services/activity_service.py
+"""
+Recording and reading the activity log
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import desc, insert, select
+from typing import List, Optional
+import logging
+
+from models.activity import ActivityLogEntry
+
+logger = logging.getLogger(__name__)
+
+class ActivityService:
+    """Service for the audit trail of booking and inquiry changes"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def record_many(self, entries: List[dict]):
+        """Add log entries in the caller's transaction with one executemany
+
+        Each entry has action, entity_type, entity_id and optionally actor and details.
+        """
+        if entries:
+            await self.db.execute(insert(ActivityLogEntry), entries)
+
+    async def get_recent(
+        self,
+        limit: int = 50,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[str] = None
+    ) -> List[ActivityLogEntry]:
+        """Newest entries first, optionally for one entity type or entity"""
+        try:
+            query = select(ActivityLogEntry)
+            if entity_type:
+                query = query.where(ActivityLogEntry.entity_type == entity_type)
+            if entity_id:
+                query = query.where(ActivityLogEntry.entity_id == entity_id)
+            result = await self.db.scalars(
+                query.order_by(desc(ActivityLogEntry.timestamp), desc(ActivityLogEntry.id)).limit(limit)
+            )
+            return result.all()
+        except Exception as e:
+            logger.error(f"Error getting activity log: {str(e)}")
+            raise
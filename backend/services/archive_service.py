@@ -0,0 +1,214 @@
+# backend/services/archive_service.py
+"""
+Hot/cold archival: moving aged bookings and inquiries into the archive tables
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import DateTime, delete, func, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+import asyncio
+import logging
+import time
+
+from core.config import get_settings
+from core.database import AsyncSessionLocal
+from models.archive import ARCHIVE_MODELS, ArchivedContactInquiry, ArchivedServiceBooking
+from models.booking import ServiceBooking, ProjectStatus
+from models.contact import ContactInquiry, InquiryStatus
+from services.list_counters import booking_counters, contact_counters
+from services.response_cache import (
+    BOOKINGS_TAG, RECENT_BOOKINGS_TAG, RECENT_CONTACTS_TAG, response_cache
+)
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+@dataclass
+class ArchiveRule:
+    """Rows of one model that move to the archive once older than a number of days"""
+    name: str
+    model: type
+    days: int
+    criteria: Callable[[], list]
+
+    def matches(self, now: datetime) -> list:
+        cutoff = now - timedelta(days=self.days)
+        model = self.model
+        # Untouched for `days`; the created_at bound lets the (is_active, [status,]
+        # created_at) indexes narrow the scan, since updated_at >= created_at
+        return [*self.criteria(), model.created_at < cutoff, model.updated_at < cutoff]
+
+def archive_rules() -> List[ArchiveRule]:
+    """The rules enabled in settings, in the order they run"""
+    closed_bookings = [ProjectStatus(status) for status in settings.ARCHIVE_CLOSED_BOOKING_STATUSES]
+    rules = [
+        ArchiveRule("inactive bookings", ServiceBooking, settings.ARCHIVE_INACTIVE_DAYS,
+                    lambda: [ServiceBooking.is_active == False]),
+        ArchiveRule("inactive inquiries", ContactInquiry, settings.ARCHIVE_INACTIVE_DAYS,
+                    lambda: [ContactInquiry.is_active == False]),
+        ArchiveRule("spam inquiries", ContactInquiry, settings.ARCHIVE_SPAM_DAYS,
+                    lambda: [ContactInquiry.is_active == True, ContactInquiry.status == InquiryStatus.SPAM]),
+        ArchiveRule("closed bookings", ServiceBooking, settings.ARCHIVE_CLOSED_DAYS,
+                    lambda: [ServiceBooking.is_active == True, ServiceBooking.status.in_(closed_bookings)]),
+        ArchiveRule("resolved inquiries", ContactInquiry, settings.ARCHIVE_CLOSED_DAYS,
+                    lambda: [ContactInquiry.is_active == True, ContactInquiry.status == InquiryStatus.RESOLVED]),
+    ]
+    return [rule for rule in rules if rule.days > 0]
+
+class ArchiveService:
+    """
+    Moves rows matching the archive rules out of the hot tables.
+
+    Each batch commits its copy into the archive table before deleting the rows
+    from the hot one in a second short transaction. SQLite does not commit
+    atomically across an attached archive file in WAL mode, so this order is
+    what keeps a crash from losing rows; at worst a row is left in both tables
+    and the next run deletes the hot copy.
+    Archived rows leave the list totals but stay in the statistics rollups
+    (a rollup rebuild reads the archive tables too).
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def archive(
+        self,
+        rules: Optional[List[ArchiveRule]] = None,
+        batch_size: Optional[int] = None,
+        max_batches: Optional[int] = None,
+        pause: Optional[float] = None
+    ) -> dict:
+        """Apply every rule in bounded batches and report the rows moved per rule"""
+        rules = archive_rules() if rules is None else rules
+        batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+        max_batches = max_batches or settings.ARCHIVE_MAX_BATCHES
+        pause = settings.ARCHIVE_BATCH_PAUSE if pause is None else pause
+
+        started = time.perf_counter()
+        now = datetime.utcnow()
+        moved = {}
+        batches = 0
+        try:
+            for rule in rules:
+                moved[rule.name] = 0
+                for _ in range(max_batches):
+                    count = await self._archive_batch(rule, now, batch_size)
+                    if count:
+                        batches += 1
+                        moved[rule.name] += count
+                    if count < batch_size:
+                        break
+                    await asyncio.sleep(pause)
+        finally:
+            if any(moved.values()):
+                # Buckets are recounted on next use; cached reads may name moved rows
+                booking_counters.reset()
+                contact_counters.reset()
+                await response_cache.invalidate(BOOKINGS_TAG, RECENT_BOOKINGS_TAG, RECENT_CONTACTS_TAG)
+
+        result = {
+            "archived": moved,
+            "batches": batches,
+            "duration_seconds": round(time.perf_counter() - started, 3)
+        }
+        if any(moved.values()):
+            logger.info(f"Archived {sum(moved.values())} rows in {batches} batches: {moved}")
+        return result
+
+    async def _archive_batch(self, rule: ArchiveRule, now: datetime, batch_size: int) -> int:
+        model = rule.model
+        hot = model.__table__
+        archive = ARCHIVE_MODELS[model].__table__
+        try:
+            ids = (await self.db.scalars(
+                select(model.id).where(*rule.matches(now)).order_by(model.id).limit(batch_size)
+            )).all()
+            if not ids:
+                await self.db.commit()
+                return 0
+
+            columns = [column.name for column in hot.columns]
+            dialect_insert = postgresql.insert if self.db.bind.dialect.name == "postgresql" else sqlite.insert
+            # A row left in both tables by an interrupted move is copied only once
+            await self.db.execute(
+                dialect_insert(archive).from_select(
+                    [*columns, "archived_at"],
+                    select(*hot.columns, literal(now, DateTime)).where(hot.c.id.in_(ids))
+                ).on_conflict_do_nothing()
+            )
+            await self.db.commit()
+
+            # Rows changed since the copy no longer match and stay hot; their
+            # stale copies go. The two deletes touch different rows, so either
+            # committing alone loses nothing.
+            deleted = await self.db.execute(delete(hot).where(hot.c.id.in_(ids), *rule.matches(now)))
+            await self.db.execute(
+                delete(archive).where(
+                    archive.c.id.in_(ids),
+                    archive.c.id.in_(select(hot.c.id).where(hot.c.id.in_(ids)))
+                )
+            )
+            await self.db.commit()
+            return deleted.rowcount
+
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error archiving {rule.name}: {str(e)}")
+            raise
+
+    async def count_matching(self, rules: Optional[List[ArchiveRule]] = None) -> dict:
+        """Rows each rule would archive now, without moving anything"""
+        now = datetime.utcnow()
+        counts = {}
+        for rule in archive_rules() if rules is None else rules:
+            counts[rule.name] = await self.db.scalar(
+                select(func.count(rule.model.id)).where(*rule.matches(now))
+            )
+        return counts
+
+    async def get_booking(self, booking_id: str) -> Optional[ArchivedServiceBooking]:
+        """An archived booking by its booking ID"""
+        return await self.db.scalar(
+            select(ArchivedServiceBooking).where(ArchivedServiceBooking.booking_id == booking_id).limit(1)
+        )
+
+    async def get_inquiry(self, contact_id: int) -> Optional[ArchivedContactInquiry]:
+        """An archived contact inquiry by its ID"""
+        return await self.db.get(ArchivedContactInquiry, contact_id)
+
+class ArchiveSweeper:
+    """Runs ArchiveService every ARCHIVE_INTERVAL seconds in the background"""
+
+    def __init__(self):
+        self.task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+    async def _run(self):
+        while True:
+            try:
+                async with AsyncSessionLocal() as db:
+                    await ArchiveService(db).archive()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Whatever was left is moved on the next run
+                logger.error(f"Archive run failed: {str(e)}")
+            await asyncio.sleep(settings.ARCHIVE_INTERVAL)
+
+# Process-wide background archiver
+archive_sweeper = ArchiveSweeper()
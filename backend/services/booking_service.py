@@ -3,248 +3,374 @@
 Business logic for service bookings
 """
 
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, case, func, desc, select, update
 from typing import List, Optional, Tuple
 from datetime import datetime, timedelta
 import uuid
 import logging
 
 from models.booking import ServiceBooking, ServiceType, ProjectStatus, ProjectComplexity
+from models.rollup import BookingDailyRollup
 from schemas.booking import BookingCreate, BookingUpdate
 from core.config import get_settings
+from services.activity_service import ActivityService
+from services.list_counters import booking_counters
+from services.pricing import pricing_registry
+from services.response_cache import RECENT_BOOKINGS_TAG, STATS_TAG, booking_tag, response_cache
+from services.stats_rollups import StatsRollupService, booking_contribution, rollup_day
+from utils.pagination import TotalMode, after_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Statuses that count as converted (a quote went out)
+CONVERTED_STATUSES = [
+    ProjectStatus.QUOTED, ProjectStatus.ACCEPTED,
+    ProjectStatus.IN_PROGRESS, ProjectStatus.COMPLETED
+]
+
+# Update fields that need the row's current values (rollup deltas or re-pricing)
+PREIMAGE_FIELDS = {"quote_amount", "estimated_cost", "technologies", "features", "description"}
+
+# Statuses whose quote counts as accepted revenue
+ACCEPTED_STATUSES = [ProjectStatus.ACCEPTED, ProjectStatus.IN_PROGRESS, ProjectStatus.COMPLETED]
+
 class BookingService:
     """Service for managing bookings"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
+        self.rollups = StatsRollupService(db)
     
-    def create_booking(self, booking_data: BookingCreate, client_ip: str = None) -> ServiceBooking:
+    async def create_booking(self, booking_data: BookingCreate, client_ip: str = None) -> ServiceBooking:
         """Create a new service booking"""
         try:
-            # Calculate project complexity
-            complexity = self._calculate_complexity(
-                booking_data.technologies,
-                booking_data.features,
-                booking_data.description
-            )
-            
-            # Estimate hours and cost
-            estimated_hours, estimated_cost = self._estimate_project(
-                booking_data.service_type,
-                complexity,
-                len(booking_data.features)
-            )
-            
-            # Create booking
-            booking = ServiceBooking(
-                booking_id=str(uuid.uuid4()),
-                service_type=booking_data.service_type,
-                project_name=booking_data.project_name,
-                description=booking_data.description,
-                timeline=booking_data.timeline,
-                budget_range=booking_data.budget_range,
-                technologies=booking_data.technologies,
-                features=booking_data.features,
-                complexity=complexity,
-                estimated_hours=estimated_hours,
-                estimated_cost=estimated_cost,
-                first_name=booking_data.first_name,
-                last_name=booking_data.last_name,
-                email=booking_data.email,
-                phone=booking_data.phone,
-                company=booking_data.company,
-                client_notes=booking_data.client_notes,
-                status=ProjectStatus.PENDING,
-                priority=self._determine_priority(booking_data.budget_range, booking_data.timeline)
-            )
+            pricing = await pricing_registry.current(self.db)
+            booking = self._new_booking(booking_data, pricing)
             
             self.db.add(booking)
-            self.db.commit()
-            self.db.refresh(booking)
+            await self.db.flush()
+            await self.rollups.record_booking(None, booking_contribution(booking))
+            await self.db.commit()
+            booking_counters.record_insert(booking.status, booking.service_type)
+            await response_cache.invalidate(RECENT_BOOKINGS_TAG, STATS_TAG)
             
             logger.info(f"Created booking {booking.booking_id} for {booking.email}")
             return booking
             
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Error creating booking: {str(e)}")
             raise
     
-    def get_bookings(
+    async def create_bookings_bulk(self, bookings_data: List[BookingCreate]) -> List[ServiceBooking]:
+        """Create many bookings in one transaction"""
+        try:
+            pricing = await pricing_registry.current(self.db)
+            # Stamp timestamps up front so rollups don't need the rows read back
+            now = datetime.utcnow()
+            bookings = [self._new_booking(booking_data, pricing, created_at=now) for booking_data in bookings_data]
+            
+            self.db.add_all(bookings)
+            await self.db.flush()
+            await self.rollups.record_bookings((None, booking_contribution(booking)) for booking in bookings)
+            await self.db.commit()
+            for booking in bookings:
+                booking_counters.record_insert(booking.status, booking.service_type)
+            await response_cache.invalidate(RECENT_BOOKINGS_TAG, STATS_TAG)
+            
+            logger.info(f"Created {len(bookings)} bookings in bulk")
+            return bookings
+            
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error creating bookings in bulk: {str(e)}")
+            raise
+    
+    def _new_booking(self, booking_data: BookingCreate, pricing, created_at: datetime = None) -> ServiceBooking:
+        """Build a pending booking priced with the given rules"""
+        # Calculate project complexity, hours and cost with the current pricing rules
+        complexity, estimated_hours, estimated_cost = pricing.score(
+            booking_data.service_type,
+            booking_data.technologies,
+            booking_data.features,
+            booking_data.description
+        )
+        
+        booking = ServiceBooking(
+            booking_id=str(uuid.uuid4()),
+            service_type=booking_data.service_type,
+            project_name=booking_data.project_name,
+            description=booking_data.description,
+            timeline=booking_data.timeline,
+            budget_range=booking_data.budget_range,
+            technologies=booking_data.technologies,
+            features=booking_data.features,
+            complexity=complexity,
+            estimated_hours=estimated_hours,
+            estimated_cost=estimated_cost,
+            pricing_version=pricing.version,
+            first_name=booking_data.first_name,
+            last_name=booking_data.last_name,
+            email=booking_data.email,
+            phone=booking_data.phone,
+            company=booking_data.company,
+            client_notes=booking_data.client_notes,
+            status=ProjectStatus.PENDING,
+            priority=self._determine_priority(booking_data.budget_range, booking_data.timeline),
+            is_active=True
+        )
+        if created_at:
+            booking.created_at = booking.updated_at = created_at
+        return booking
+    
+    async def get_bookings(
         self,
         status: Optional[ProjectStatus] = None,
         service_type: Optional[ServiceType] = None,
         limit: int = 50,
-        offset: int = 0
-    ) -> Tuple[List[ServiceBooking], int]:
-        """Get bookings with filtering and pagination"""
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        include_total: TotalMode = TotalMode.EXACT
+    ) -> Tuple[List[ServiceBooking], Optional[int], Optional[str]]:
+        """Get bookings with filtering and offset or cursor pagination"""
         try:
-            query = self.db.query(ServiceBooking).filter(ServiceBooking.is_active == True)
-            
-            # Apply filters
-            if status:
-                query = query.filter(ServiceBooking.status == status)
-            if service_type:
-                query = query.filter(ServiceBooking.service_type == service_type)
+            total = await self.count_bookings(status, service_type, include_total)
             
-            # Get total count
-            total = query.count()
+            result = await self.db.scalars(
+                self._list_query(select(ServiceBooking), status, service_type, offset, cursor).limit(limit + 1)
+            )
+            bookings = list(result.all())
             
-            # Apply pagination and ordering
-            bookings = query.order_by(desc(ServiceBooking.created_at)).offset(offset).limit(limit).all()
+            next_cursor = None
+            if len(bookings) > limit:
+                bookings = bookings[:limit]
+                next_cursor = encode_cursor(bookings[-1].created_at, bookings[-1].id)
             
-            return bookings, total
+            return bookings, total, next_cursor
             
         except Exception as e:
             logger.error(f"Error getting bookings: {str(e)}")
             raise
     
-    def get_booking_by_id(self, booking_id: str) -> Optional[ServiceBooking]:
+    async def count_bookings(
+        self,
+        status: Optional[ProjectStatus] = None,
+        service_type: Optional[ServiceType] = None,
+        include_total: TotalMode = TotalMode.EXACT
+    ) -> Optional[int]:
+        """Total for a booking list, computed as include_total asks"""
+        if include_total == TotalMode.EXACT:
+            return await self.db.scalar(
+                self._filtered(select(func.count(ServiceBooking.id)), status, service_type)
+            )
+        if include_total == TotalMode.APPROX:
+            return await booking_counters.total(self.db, status, service_type)
+        return None
+    
+    async def get_page_versions(
+        self,
+        status: Optional[ProjectStatus] = None,
+        service_type: Optional[ServiceType] = None,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> List[Tuple[int, datetime]]:
+        """(id, updated_at) of the rows get_bookings would return, plus the next-page probe"""
+        result = await self.db.execute(
+            self._list_query(
+                select(ServiceBooking.id, ServiceBooking.updated_at), status, service_type, offset, cursor
+            ).limit(limit + 1)
+        )
+        return [tuple(row) for row in result.all()]
+    
+    def _filtered(self, query, status: Optional[ProjectStatus], service_type: Optional[ServiceType]):
+        query = query.where(ServiceBooking.is_active == True)
+        if status:
+            query = query.where(ServiceBooking.status == status)
+        if service_type:
+            query = query.where(ServiceBooking.service_type == service_type)
+        return query
+    
+    def _list_query(
+        self,
+        query,
+        status: Optional[ProjectStatus],
+        service_type: Optional[ServiceType],
+        offset: int,
+        cursor: Optional[str]
+    ):
+        query = self._filtered(query, status, service_type)
+        
+        # A cursor seeks past the previous page through the index instead of skipping rows
+        if cursor:
+            query = query.where(after_cursor(ServiceBooking, cursor, self.db.bind.dialect.name))
+        else:
+            query = query.offset(offset)
+        
+        return query.order_by(desc(ServiceBooking.created_at), desc(ServiceBooking.id))
+    
+    async def get_booking_by_id(self, booking_id: str) -> Optional[ServiceBooking]:
         """Get a booking by ID"""
         try:
-            return self.db.query(ServiceBooking).filter(
-                and_(
+            return await self.db.scalar(
+                select(ServiceBooking).where(
+                    and_(
+                        ServiceBooking.booking_id == booking_id,
+                        ServiceBooking.is_active == True
+                    )
+                ).limit(1)
+            )
+        except Exception as e:
+            logger.error(f"Error getting booking {booking_id}: {str(e)}")
+            raise
+    
+    async def get_booking_version(self, booking_id: str) -> Optional[Tuple[int, datetime]]:
+        """(id, updated_at) of an active booking, without loading the row"""
+        try:
+            result = await self.db.execute(
+                select(ServiceBooking.id, ServiceBooking.updated_at).where(
                     ServiceBooking.booking_id == booking_id,
                     ServiceBooking.is_active == True
-                )
-            ).first()
+                ).limit(1)
+            )
+            row = result.first()
+            return tuple(row) if row else None
         except Exception as e:
-            logger.error(f"Error getting booking {booking_id}: {str(e)}")
+            logger.error(f"Error getting booking version {booking_id}: {str(e)}")
             raise
     
-    def update_booking(self, booking_id: str, booking_update: BookingUpdate) -> Optional[ServiceBooking]:
+    async def update_booking(self, booking_id: str, booking_update: BookingUpdate) -> Optional[ServiceBooking]:
         """Update a booking"""
         try:
-            booking = self.get_booking_by_id(booking_id)
+            update_data = booking_update.dict(exclude_unset=True)
+            if not PREIMAGE_FIELDS & update_data.keys():
+                # Nothing derived from the old values: one UPDATE ... RETURNING
+                booking = await self.db.scalar(
+                    update(ServiceBooking)
+                    .where(ServiceBooking.booking_id == booking_id, ServiceBooking.is_active == True)
+                    .values(**update_data, updated_at=datetime.utcnow())
+                    .returning(ServiceBooking),
+                    execution_options={"populate_existing": True}
+                )
+                await self.db.commit()
+                if booking:
+                    await response_cache.invalidate(booking_tag(booking_id), RECENT_BOOKINGS_TAG)
+                return booking
+            
+            booking = await self.get_booking_by_id(booking_id)
             if not booking:
                 return None
             
+            before = booking_contribution(booking)
+            
             # Update fields
-            update_data = booking_update.dict(exclude_unset=True)
             for field, value in update_data.items():
                 setattr(booking, field, value)
             
-            # Recalculate complexity if relevant fields changed
+            # Recalculate complexity and estimates if relevant fields changed
             if any(field in update_data for field in ['technologies', 'features', 'description']):
-                booking.complexity = self._calculate_complexity(
+                pricing = await pricing_registry.current(self.db)
+                booking.complexity, booking.estimated_hours, booking.estimated_cost = pricing.score(
+                    booking.service_type,
                     booking.technologies,
                     booking.features,
                     booking.description
                 )
-                
-                # Recalculate estimates
-                booking.estimated_hours, booking.estimated_cost = self._estimate_project(
-                    booking.service_type,
-                    booking.complexity,
-                    len(booking.features)
-                )
+                booking.pricing_version = pricing.version
             
-            self.db.commit()
-            self.db.refresh(booking)
+            booking.updated_at = datetime.utcnow()
+            await self.rollups.record_booking(before, booking_contribution(booking))
+            await self.db.commit()
+            await response_cache.invalidate(booking_tag(booking_id), RECENT_BOOKINGS_TAG, STATS_TAG)
             
             return booking
             
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Error updating booking {booking_id}: {str(e)}")
             raise
     
-    def update_status(self, booking_id: str, status: ProjectStatus) -> Optional[ServiceBooking]:
+    async def update_status(self, booking_id: str, status: ProjectStatus) -> Optional[ServiceBooking]:
         """Update booking status"""
+        bookings = await self.update_statuses([booking_id], status)
+        return bookings[0] if bookings else None
+    
+    async def update_statuses(
+        self,
+        booking_ids: List[str],
+        status: ProjectStatus,
+        *criteria,
+        actor: Optional[str] = None
+    ) -> List[ServiceBooking]:
+        """Move bookings to a status with one set-based UPDATE
+        
+        Returns the updated bookings; IDs with no active booking, or failing any
+        extra criteria, are skipped. With an actor, each change is also written
+        to the activity log in the same transaction.
+        """
         try:
-            booking = self.get_booking_by_id(booking_id)
-            if not booking:
-                return None
-            
-            booking.status = status
+            active = and_(
+                ServiceBooking.booking_id.in_(booking_ids), ServiceBooking.is_active == True, *criteria
+            )
+            # Pre-images for the rollup and counter deltas, locked until commit where supported
+            current = await self.db.scalars(select(ServiceBooking).where(active).with_for_update())
+            before = {
+                booking.id: (booking.status, booking_contribution(booking))
+                for booking in current
+            }
+            if not before:
+                return []
+            
+            now = datetime.utcnow()
+            values = {"status": status, "updated_at": now}
+            if status == ProjectStatus.QUOTED:
+                # Bookings quoted before keep their original quote window
+                values["quote_sent_at"] = func.coalesce(ServiceBooking.quote_sent_at, now)
+                values["quote_valid_until"] = case(
+                    (ServiceBooking.quote_sent_at.is_(None), now + timedelta(days=30)),
+                    else_=ServiceBooking.quote_valid_until
+                )
             
-            # Set quote sent timestamp if status is quoted
-            if status == ProjectStatus.QUOTED and not booking.quote_sent_at:
-                booking.quote_sent_at = datetime.utcnow()
-                booking.quote_valid_until = datetime.utcnow() + timedelta(days=30)
+            result = await self.db.scalars(
+                update(ServiceBooking)
+                .where(ServiceBooking.id.in_(list(before)))
+                .values(**values)
+                .returning(ServiceBooking),
+                execution_options={"populate_existing": True}
+            )
+            bookings = result.all()
             
-            self.db.commit()
-            self.db.refresh(booking)
+            await self.rollups.record_bookings(
+                (before[booking.id][1], booking_contribution(booking)) for booking in bookings
+            )
+            if actor:
+                await ActivityService(self.db).record_many([
+                    {
+                        "action": "status_changed",
+                        "entity_type": "booking",
+                        "entity_id": str(booking.booking_id),
+                        "actor": actor,
+                        "details": {"from": before[booking.id][0].value, "to": status.value}
+                    }
+                    for booking in bookings
+                ])
+            await self.db.commit()
+            for booking in bookings:
+                booking_counters.record_status_change(before[booking.id][0], status, booking.service_type)
+            await response_cache.invalidate(
+                *(booking_tag(booking.booking_id) for booking in bookings),
+                RECENT_BOOKINGS_TAG, STATS_TAG
+            )
             
-            return booking
+            return bookings
             
         except Exception as e:
-            self.db.rollback()
-            logger.error(f"Error updating booking status {booking_id}: {str(e)}")
+            await self.db.rollback()
+            logger.error(f"Error updating status of {len(booking_ids)} bookings: {str(e)}")
             raise
     
-    def _calculate_complexity(
-        self, 
-        technologies: List[str], 
-        features: List[str], 
-        description: str
-    ) -> ProjectComplexity:
-        """Calculate project complexity based on requirements"""
-        score = 0
-        
-        # Technology complexity
-        score += len(technologies) * 2
-        
-        # Feature complexity
-        complex_features = [
-            "Real-time Features", "Payment Processing", "Data Analytics",
-            "Third-party Integrations", "File Upload/Storage"
-        ]
-        score += sum(5 for feature in features if feature in complex_features)
-        score += len(features) * 2
-        
-        # Description complexity (longer = more complex)
-        if len(description) > 500:
-            score += 10
-        elif len(description) > 200:
-            score += 5
-        
-        # Determine complexity level
-        if score < 20:
-            return ProjectComplexity.SIMPLE
-        elif score < 40:
-            return ProjectComplexity.MEDIUM
-        else:
-            return ProjectComplexity.COMPLEX
-    
-    def _estimate_project(
-        self,
-        service_type: ServiceType,
-        complexity: ProjectComplexity,
-        feature_count: int
-    ) -> Tuple[float, float]:
-        """Estimate project hours and cost"""
-        # Base hours by service type
-        base_hours = {
-            ServiceType.BUSINESS_WEBSITES: 20,
-            ServiceType.WEB_APPLICATIONS: 40,
-            ServiceType.DATA_AUTOMATION: 24,
-            ServiceType.DIGITAL_TRANSFROMATION: 50,
-            ServiceType.CONSULTATION: 8
-        }
-        
-        # Complexity multipliers
-        complexity_multipliers = {
-            ProjectComplexity.SIMPLE: 1.0,
-            ProjectComplexity.MEDIUM: 1.5,
-            ProjectComplexity.COMPLEX: 2.5
-        }
-        
-        # Calculate hours
-        hours = base_hours[service_type] * complexity_multipliers[complexity]
-        hours += feature_count * 3  # 3 hours per feature
-        
-        # Calculate cost (£75/hour base rate)
-        hourly_rate = 75
-        cost = hours * hourly_rate
-        
-        return round(hours, 1), round(cost, 2)
-    
     def _determine_priority(self, budget_range: str, timeline: str) -> str:
         """Determine booking priority"""
         urgent_timelines = ["ASAP (Rush job)", "Within 2 weeks"]
@@ -257,131 +383,132 @@ class BookingService:
         else:
             return "low"
     
-    def get_stats(self, start_date: datetime, end_date: datetime) -> dict:
-        """Get booking statistics for a date range"""
+    async def get_stats(self, start_date: datetime, end_date: datetime) -> dict:
+        """Get booking statistics for the days in a date range from the daily rollups"""
         try:
-            query = self.db.query(ServiceBooking).filter(
-                and_(
-                    ServiceBooking.created_at >= start_date,
-                    ServiceBooking.created_at <= end_date,
-                    ServiceBooking.is_active == True
-                )
+            result = await self.db.execute(
+                select(
+                    BookingDailyRollup.status,
+                    BookingDailyRollup.service_type,
+                    func.sum(BookingDailyRollup.booking_count),
+                    func.sum(BookingDailyRollup.value_sum),
+                    func.sum(BookingDailyRollup.value_count)
+                ).where(
+                    BookingDailyRollup.day >= rollup_day(start_date),
+                    BookingDailyRollup.day <= rollup_day(end_date)
+                ).group_by(
+                    BookingDailyRollup.status, BookingDailyRollup.service_type
+                ).having(func.sum(BookingDailyRollup.booking_count) > 0)
             )
             
-            total_bookings = query.count()
-            new_bookings = query.filter(ServiceBooking.status == ProjectStatus.PENDING).count()
-            completed_bookings = query.filter(ServiceBooking.status == ProjectStatus.COMPLETED).count()
-            
-            # Service type breakdown
-            service_types = self.db.query(
-                ServiceBooking.service_type,
-                func.count(ServiceBooking.id)
-            ).filter(
-                and_(
-                    ServiceBooking.created_at >= start_date,
-                    ServiceBooking.created_at <= end_date,
-                    ServiceBooking.is_active == True
-                )
-            ).group_by(ServiceBooking.service_type).all()
-            
-            # Calculate conversion rate
-            quoted = query.filter(ServiceBooking.status.in_([
-                ProjectStatus.QUOTED, ProjectStatus.ACCEPTED, 
-                ProjectStatus.IN_PROGRESS, ProjectStatus.COMPLETED
-            ])).count()
-            conversion_rate = (quoted / total_bookings * 100) if total_bookings > 0 else 0
-            
-            return {
-                "total_bookings": total_bookings,
-                "new_bookings": new_bookings,
-                "completed_bookings": completed_bookings,
-                "pending_bookings": total_bookings - completed_bookings,
-                "by_service_type": dict(service_types),
-                "conversion_rate": round(conversion_rate, 2)
-            }
+            return self._summarize_stats(result.all())
             
         except Exception as e:
             logger.error(f"Error getting booking stats: {str(e)}")
             raise
     
-    def get_revenue_stats(self, start_date: datetime, end_date: datetime) -> dict:
-        """Get revenue statistics"""
+    def _summarize_stats(self, groups) -> dict:
+        """Build booking stats from (status, service_type, count, value_sum, value_count) groups"""
+        by_status = {}
+        by_service_type = {}
+        value_sum = 0.0
+        value_count = 0
+        
+        for status, service_type, count, group_value_sum, group_value_count in groups:
+            by_status[status] = by_status.get(status, 0) + count
+            by_service_type[service_type] = by_service_type.get(service_type, 0) + count
+            value_sum += group_value_sum or 0
+            value_count += group_value_count or 0
+        
+        total_bookings = sum(by_status.values())
+        completed_bookings = by_status.get(ProjectStatus.COMPLETED, 0)
+        
+        # Calculate conversion rate
+        quoted = sum(by_status.get(status, 0) for status in CONVERTED_STATUSES)
+        conversion_rate = (quoted / total_bookings * 100) if total_bookings > 0 else 0
+        
+        return {
+            "total_bookings": total_bookings,
+            "new_bookings": by_status.get(ProjectStatus.PENDING, 0),
+            "completed_bookings": completed_bookings,
+            "pending_bookings": total_bookings - completed_bookings,
+            "by_service_type": by_service_type,
+            "by_status": by_status,
+            "average_project_value": round(value_sum / value_count, 2) if value_count else None,
+            "conversion_rate": round(conversion_rate, 2)
+        }
+    
+    async def get_revenue_stats(self, start_date: datetime, end_date: datetime, monthly: bool = False) -> dict:
+        """Get revenue statistics from the daily rollups, optionally broken down by month"""
         try:
-            query = self.db.query(ServiceBooking).filter(
-                and_(
-                    ServiceBooking.created_at >= start_date,
-                    ServiceBooking.created_at <= end_date,
-                    ServiceBooking.is_active == True
-                )
+            query = select(
+                func.sum(BookingDailyRollup.quoted_sum),
+                func.sum(case(
+                    (BookingDailyRollup.status.in_(ACCEPTED_STATUSES), BookingDailyRollup.quoted_sum)
+                )),
+                func.sum(case(
+                    (BookingDailyRollup.status == ProjectStatus.COMPLETED, BookingDailyRollup.quoted_sum)
+                )),
+                # Sum and count rather than AVG so monthly groups can be combined
+                func.sum(BookingDailyRollup.estimate_sum),
+                func.sum(BookingDailyRollup.estimate_count)
+            ).where(
+                BookingDailyRollup.day >= rollup_day(start_date),
+                BookingDailyRollup.day <= rollup_day(end_date)
             )
             
-            # Total quoted amount
-            total_quoted = self.db.query(func.sum(ServiceBooking.quote_amount)).filter(
-                and_(
-                    ServiceBooking.created_at >= start_date,
-                    ServiceBooking.created_at <= end_date,
-                    ServiceBooking.quote_amount.isnot(None),
-                    ServiceBooking.is_active == True
-                )
-            ).scalar() or 0
+            if monthly:
+                month = self._month_bucket(BookingDailyRollup.day)
+                query = query.add_columns(month).group_by(month).order_by(month)
             
-            # Accepted projects
-            accepted_query = query.filter(ServiceBooking.status.in_([
-                ProjectStatus.ACCEPTED, ProjectStatus.IN_PROGRESS, ProjectStatus.COMPLETED
-            ]))
+            rows = (await self.db.execute(query)).all()
             
-            total_accepted = self.db.query(func.sum(ServiceBooking.quote_amount)).filter(
-                and_(
-                    ServiceBooking.created_at >= start_date,
-                    ServiceBooking.created_at <= end_date,
-                    ServiceBooking.status.in_([
-                        ProjectStatus.ACCEPTED, ProjectStatus.IN_PROGRESS, ProjectStatus.COMPLETED
-                    ]),
-                    ServiceBooking.quote_amount.isnot(None),
-                    ServiceBooking.is_active == True
-                )
-            ).scalar() or 0
+            # Column-wise totals across the (possibly monthly) groups
+            quoted, accepted, completed, estimate_sum, estimate_count = (
+                sum(row[index] or 0 for row in rows) for index in range(5)
+            )
             
-            # Completed projects
-            total_completed = self.db.query(func.sum(ServiceBooking.quote_amount)).filter(
-                and_(
-                    ServiceBooking.created_at >= start_date,
-                    ServiceBooking.created_at <= end_date,
-                    ServiceBooking.status == ProjectStatus.COMPLETED,
-                    ServiceBooking.quote_amount.isnot(None),
-                    ServiceBooking.is_active == True
-                )
-            ).scalar() or 0
+            stats = {
+                "total_quoted": float(quoted),
+                "total_accepted": float(accepted),
+                "total_completed": float(completed),
+                "average_project_size": float(estimate_sum / estimate_count) if estimate_count else 0.0,
+                "monthly_recurring": float(completed) / max(1, (end_date - start_date).days / 30)
+            }
             
-            # Average project size
-            avg_project_size = self.db.query(func.avg(ServiceBooking.estimated_cost)).filter(
-                and_(
-                    ServiceBooking.created_at >= start_date,
-                    ServiceBooking.created_at <= end_date,
-                    ServiceBooking.estimated_cost.isnot(None),
-                    ServiceBooking.is_active == True
-                )
-            ).scalar() or 0
+            if monthly:
+                stats["monthly"] = [
+                    {
+                        "month": row_month,
+                        "total_quoted": float(row_quoted or 0),
+                        "total_accepted": float(row_accepted or 0),
+                        "total_completed": float(row_completed or 0),
+                        "average_project_size": float(row_sum / row_count) if row_count else 0.0
+                    }
+                    for row_quoted, row_accepted, row_completed, row_sum, row_count, row_month in rows
+                ]
             
-            return {
-                "total_quoted": float(total_quoted),
-                "total_accepted": float(total_accepted),
-                "total_completed": float(total_completed),
-                "average_project_size": float(avg_project_size),
-                "monthly_recurring": float(total_completed) / max(1, (end_date - start_date).days / 30)
-            }
+            return stats
             
         except Exception as e:
             logger.error(f"Error getting revenue stats: {str(e)}")
             raise
     
-    def get_recent_bookings(self, limit: int = 20) -> List[ServiceBooking]:
+    def _month_bucket(self, column):
+        """YYYY-MM label for a date column in the session's SQL dialect"""
+        if self.db.bind.dialect.name == "sqlite":
+            return func.strftime("%Y-%m", column)
+        return func.to_char(column, "YYYY-MM")
+    
+    async def get_recent_bookings(self, limit: int = 20) -> List[ServiceBooking]:
         """Get recent bookings"""
         try:
-            return self.db.query(ServiceBooking).filter(
-                ServiceBooking.is_active == True
-            ).order_by(desc(ServiceBooking.created_at)).limit(limit).all()
+            result = await self.db.scalars(
+                select(ServiceBooking).where(
+                    ServiceBooking.is_active == True
+                ).order_by(desc(ServiceBooking.created_at)).limit(limit)
+            )
+            return list(result.all())
         except Exception as e:
             logger.error(f"Error getting recent bookings: {str(e)}")
             raise
-
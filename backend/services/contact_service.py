@@ -3,25 +3,78 @@
 Business logic for contact inquiries
 """
 
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, func, desc, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from typing import List, Optional, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
 import logging
 
+from core.config import get_settings
 from models.contact import ContactInquiry, InquiryType, InquiryStatus
 from models.newsletter import NewsletterSubscription
+from models.rollup import ContactDailyRollup
 from schemas.contact import ContactCreate
+from services.activity_service import ActivityService
+from services.list_counters import contact_counters
+from services.spam_classifier import SpamTokenService, spam_classifier, spam_features
+from services.response_cache import RECENT_CONTACTS_TAG, STATS_TAG, response_cache
+from services.stats_rollups import StatsRollupService, contact_contribution, rollup_day
+from services.submission_velocity import submission_velocity
+from utils.keywords import KeywordMatcher, load_keyword_weights
+from utils.pagination import TotalMode, after_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Inquiries scoring above this are filed as spam on arrival
+SPAM_THRESHOLD = 0.8
+
+# Weight of each line in SPAM_KEYWORDS_FILE that gives none
+DEFAULT_SPAM_KEYWORD_WEIGHT = 0.3
+
+@lru_cache()
+def spam_keywords() -> KeywordMatcher:
+    """The spam keyword dictionary, compiled once per process"""
+    weights = dict(settings.SPAM_KEYWORDS)
+    if settings.SPAM_KEYWORDS_FILE:
+        weights.update(load_keyword_weights(settings.SPAM_KEYWORDS_FILE, DEFAULT_SPAM_KEYWORD_WEIGHT))
+    return KeywordMatcher(weights)
+
+@lru_cache()
+def priority_keywords() -> KeywordMatcher:
+    """Subject keywords that make an inquiry high priority, compiled once per process"""
+    return KeywordMatcher(dict.fromkeys(settings.PRIORITY_KEYWORDS, 1.0))
+
+def heuristic_spam_score(contact) -> float:
+    """Rule-based spam score of a submission's content (a ContactCreate or stored inquiry)"""
+    score = 0.0
+    
+    # Check for spam keywords
+    score += spam_keywords().score(f"{contact.subject} {contact.message}")
+    
+    # Check for suspicious patterns
+    if len(contact.message) < 20:
+        score += 0.2
+    
+    if contact.message.count('http') > 2:
+        score += 0.4
+    
+    if len(contact.first_name.split()) or len(contact.last_name.split()) < 2:
+        score += 0.1
+    
+    return min(score, 1.0)
 
 class ContactService:
     """Service for managing contact inquiries"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
+        self.rollups = StatsRollupService(db)
+        self.spam_tokens = SpamTokenService(db)
     
-    def create_inquiry(
+    async def create_inquiry(
         self, 
         contact_data: ContactCreate, 
         ip_address: str = None,
@@ -29,115 +82,192 @@ class ContactService:
     ) -> ContactInquiry:
         """Create a new contact inquiry"""
         try:
-            # Calculate spam score
-            spam_score = self._calculate_spam_score(contact_data, ip_address)
-            
-            # Determine initial status
-            status = InquiryStatus.SPAM if spam_score > 0.8 else InquiryStatus.NEW
-            
-            inquiry = ContactInquiry(
-                first_name=contact_data.first_name,
-                last_name=contact_data.last_name,
-                email=contact_data.email,
-                phone=contact_data.phone,
-                company=contact_data.company,
-                subject=contact_data.subject,
-                message=contact_data.message,
-                inquiry_type=contact_data.inquiry_type,
-                status=status,
-                priority=self._determine_priority(contact_data),
-                spam_score=spam_score,
-                ip_address=ip_address,
-                user_agent=user_agent
-            )
+            inquiry = await self._new_inquiry(contact_data, ip_address, user_agent)
             
             self.db.add(inquiry)
-            self.db.commit()
-            self.db.refresh(inquiry)
+            await self.db.flush()
+            await self.rollups.record_contact(None, contact_contribution(inquiry))
+            await self.db.commit()
+            contact_counters.record_insert(inquiry.status, inquiry.inquiry_type)
+            await response_cache.invalidate(RECENT_CONTACTS_TAG, STATS_TAG)
             
             logger.info(f"Created contact inquiry {inquiry.id} from {inquiry.email}")
             return inquiry
             
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Error creating contact inquiry: {str(e)}")
             raise
     
-    def get_inquiries(
+    async def create_inquiries_bulk(self, contacts_data: List[ContactCreate]) -> List[ContactInquiry]:
+        """Create many inquiries in one transaction"""
+        try:
+            # Stamp timestamps up front so rollups don't need the rows read back
+            now = datetime.utcnow()
+            inquiries = [
+                await self._new_inquiry(contact_data, created_at=now) for contact_data in contacts_data
+            ]
+            
+            self.db.add_all(inquiries)
+            await self.db.flush()
+            await self.rollups.record_contacts((None, contact_contribution(inquiry)) for inquiry in inquiries)
+            await self.db.commit()
+            for inquiry in inquiries:
+                contact_counters.record_insert(inquiry.status, inquiry.inquiry_type)
+            await response_cache.invalidate(RECENT_CONTACTS_TAG, STATS_TAG)
+            
+            logger.info(f"Created {len(inquiries)} contact inquiries in bulk")
+            return inquiries
+            
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error creating contact inquiries in bulk: {str(e)}")
+            raise
+    
+    async def _new_inquiry(
+        self,
+        contact_data: ContactCreate,
+        ip_address: str = None,
+        user_agent: str = None,
+        created_at: datetime = None
+    ) -> ContactInquiry:
+        """Build a scored inquiry from submitted contact data"""
+        # Calculate spam score
+        spam_score = await self._calculate_spam_score(contact_data, ip_address)
+        
+        # Determine initial status
+        status = InquiryStatus.SPAM if spam_score > SPAM_THRESHOLD else InquiryStatus.NEW
+        
+        inquiry = ContactInquiry(
+            first_name=contact_data.first_name,
+            last_name=contact_data.last_name,
+            email=contact_data.email,
+            phone=contact_data.phone,
+            company=contact_data.company,
+            subject=contact_data.subject,
+            message=contact_data.message,
+            inquiry_type=contact_data.inquiry_type,
+            status=status,
+            priority=self._determine_priority(contact_data),
+            spam_score=spam_score,
+            ip_address=ip_address,
+            user_agent=user_agent,
+            is_active=True
+        )
+        if created_at:
+            inquiry.created_at = inquiry.updated_at = created_at
+        return inquiry
+    
+    async def get_inquiries(
         self,
         status: Optional[InquiryStatus] = None,
         inquiry_type: Optional[InquiryType] = None,
         limit: int = 50,
-        offset: int = 0
-    ) -> Tuple[List[ContactInquiry], int]:
-        """Get contact inquiries with filtering"""
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        include_total: TotalMode = TotalMode.EXACT
+    ) -> Tuple[List[ContactInquiry], Optional[int], Optional[str]]:
+        """Get contact inquiries with filtering and offset or cursor pagination"""
         try:
-            query = self.db.query(ContactInquiry).filter(ContactInquiry.is_active == True)
-            
-            # Apply filters
-            if status:
-                query = query.filter(ContactInquiry.status == status)
-            if inquiry_type:
-                query = query.filter(ContactInquiry.inquiry_type == inquiry_type)
+            total = await self.count_inquiries(status, inquiry_type, include_total)
             
-            # Get total count
-            total = query.count()
+            result = await self.db.scalars(
+                self._list_query(select(ContactInquiry), status, inquiry_type, offset, cursor).limit(limit + 1)
+            )
+            inquiries = list(result.all())
             
-            # Apply pagination
-            inquiries = query.order_by(desc(ContactInquiry.created_at)).offset(offset).limit(limit).all()
+            next_cursor = None
+            if len(inquiries) > limit:
+                inquiries = inquiries[:limit]
+                next_cursor = encode_cursor(inquiries[-1].created_at, inquiries[-1].id)
             
-            return inquiries, total
+            return inquiries, total, next_cursor
             
         except Exception as e:
             logger.error(f"Error getting contact inquiries: {str(e)}")
             raise
     
-    def _calculate_spam_score(self, contact_data: ContactCreate, ip_address: str = None) -> float:
-        """Calculate spam probability score"""
-        score = 0.0
-        
-        # Check for spam keywords
-        spam_keywords = [
-            'viagra', 'casino', 'lottery', 'prize', 'winner', 'congratulations',
-            'urgent', 'immediate', 'act now', 'limited time', 'free money'
-        ]
-        
-        text_to_check = f"{contact_data.subject} {contact_data.message}".lower()
-        
-        for keyword in spam_keywords:
-            if keyword in text_to_check:
-                score += 0.3
+    async def count_inquiries(
+        self,
+        status: Optional[InquiryStatus] = None,
+        inquiry_type: Optional[InquiryType] = None,
+        include_total: TotalMode = TotalMode.EXACT
+    ) -> Optional[int]:
+        """Total for an inquiry list, computed as include_total asks"""
+        if include_total == TotalMode.EXACT:
+            return await self.db.scalar(
+                self._filtered(select(func.count(ContactInquiry.id)), status, inquiry_type)
+            )
+        if include_total == TotalMode.APPROX:
+            return await contact_counters.total(self.db, status, inquiry_type)
+        return None
+    
+    async def get_page_versions(
+        self,
+        status: Optional[InquiryStatus] = None,
+        inquiry_type: Optional[InquiryType] = None,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> List[Tuple[int, datetime]]:
+        """(id, updated_at) of the rows get_inquiries would return, plus the next-page probe"""
+        result = await self.db.execute(
+            self._list_query(
+                select(ContactInquiry.id, ContactInquiry.updated_at), status, inquiry_type, offset, cursor
+            ).limit(limit + 1)
+        )
+        return [tuple(row) for row in result.all()]
+    
+    def _filtered(self, query, status: Optional[InquiryStatus], inquiry_type: Optional[InquiryType]):
+        query = query.where(ContactInquiry.is_active == True)
+        if status:
+            query = query.where(ContactInquiry.status == status)
+        if inquiry_type:
+            query = query.where(ContactInquiry.inquiry_type == inquiry_type)
+        return query
+    
+    def _list_query(
+        self,
+        query,
+        status: Optional[InquiryStatus],
+        inquiry_type: Optional[InquiryType],
+        offset: int,
+        cursor: Optional[str]
+    ):
+        query = self._filtered(query, status, inquiry_type)
         
-        # Check for suspicious patterns
-        if len(contact_data.message) < 20:
-            score += 0.2
+        # Apply pagination; a cursor seeks past the previous page
+        if cursor:
+            query = query.where(after_cursor(ContactInquiry, cursor, self.db.bind.dialect.name))
+        else:
+            query = query.offset(offset)
         
-        if contact_data.message.count('http') > 2:
-            score += 0.4
+        return query.order_by(desc(ContactInquiry.created_at), desc(ContactInquiry.id))
+    
+    async def _calculate_spam_score(self, contact_data: ContactCreate, ip_address: str = None) -> float:
+        """Calculate spam probability score"""
+        score = heuristic_spam_score(contact_data)
         
-        if len(contact_data.first_name.split()) or len(contact_data.last_name.split()) < 2:
-            score += 0.1
+        # Blend in the classifier once admins have judged enough inquiries
+        probability = await spam_classifier.probability(
+            self.db, contact_data.subject, contact_data.message, contact_data.email
+        )
+        if probability is not None:
+            weight = settings.SPAM_CLASSIFIER_WEIGHT
+            score = (1 - weight) * score + weight * probability
         
         # Check recent submissions from same IP
         if ip_address:
-            recent_count = self.db.query(ContactInquiry).filter(
-                and_(
-                    ContactInquiry.ip_address == ip_address,
-                    ContactInquiry.created_at > datetime.utcnow() - timedelta(hours=1)
-                )
-            ).count()
+            recent_count = await submission_velocity.record(ip_address)
             
-            if recent_count > 3:
+            if recent_count > settings.SPAM_VELOCITY_LIMIT:
                 score += 0.5
         
         return min(score, 1.0)
     
     def _determine_priority(self, contact_data: ContactCreate) -> str:
         """Determine inquiry priority"""
-        urgent_keywords = ['urgent', 'asap', 'immediate', 'emergency', 'critical']
-        subject_lower = contact_data.subject.lower()
-        
-        if any(keyword in subject_lower for keyword in urgent_keywords):
+        if priority_keywords().search(contact_data.subject):
             return "high"
         elif contact_data.inquiry_type == InquiryType.TECHNICAL:
             return "high"
@@ -146,181 +276,268 @@ class ContactService:
         else:
             return "normal"
     
-    def get_stats(self, start_date: datetime, end_date: datetime) -> dict:
-        """Get contact statistics"""
+    async def get_stats(self, start_date: datetime, end_date: datetime) -> dict:
+        """Get contact statistics for the days in a date range from the daily rollups"""
         try:
-            query = self.db.query(ContactInquiry).filter(
-                and_(
-                    ContactInquiry.created_at >= start_date,
-                    ContactInquiry.created_at <= end_date,
-                    ContactInquiry.is_active == True
-                )
+            result = await self.db.execute(
+                select(
+                    ContactDailyRollup.status,
+                    ContactDailyRollup.inquiry_type,
+                    func.sum(ContactDailyRollup.inquiry_count)
+                ).where(
+                    ContactDailyRollup.day >= rollup_day(start_date),
+                    ContactDailyRollup.day <= rollup_day(end_date)
+                ).group_by(
+                    ContactDailyRollup.status, ContactDailyRollup.inquiry_type
+                ).having(func.sum(ContactDailyRollup.inquiry_count) > 0)
             )
             
-            total_inquiries = query.count()
-            new_inquiries = query.filter(ContactInquiry.status == InquiryStatus.NEW).count()
-            resolved_inquiries = query.filter(ContactInquiry.status == InquiryStatus.RESOLVED).count()
-            spam_inquiries = query.filter(ContactInquiry.status == InquiryStatus.SPAM).count()
-            
-            # Type breakdown
-            inquiry_types = self.db.query(
-                ContactInquiry.inquiry_type,
-                func.count(ContactInquiry.id)
-            ).filter(
-                and_(
-                    ContactInquiry.created_at >= start_date,
-                    ContactInquiry.created_at <= end_date,
-                    ContactInquiry.is_active == True
-                )
-            ).group_by(ContactInquiry.inquiry_type).all()
-            
-            spam_rate = (spam_inquiries / total_inquiries * 100) if total_inquiries > 0 else 0
-            
-            return {
-                "total_inquiries": total_inquiries,
-                "new_inquiries": new_inquiries,
-                "resolved_inquiries": resolved_inquiries,
-                "by_type": dict(inquiry_types),
-                "spam_rate": round(spam_rate, 2)
-            }
+            return self._summarize_stats(result.all())
             
         except Exception as e:
             logger.error(f"Error getting contact stats: {str(e)}")
             raise
     
-    def get_recent_contacts(self, limit: int = 20) -> List[ContactInquiry]:
+    def _summarize_stats(self, groups) -> dict:
+        """Build contact stats from (status, inquiry_type, count) groups"""
+        by_status = {}
+        by_type = {}
+        
+        for status, inquiry_type, count in groups:
+            by_status[status] = by_status.get(status, 0) + count
+            by_type[inquiry_type] = by_type.get(inquiry_type, 0) + count
+        
+        total_inquiries = sum(by_status.values())
+        spam_inquiries = by_status.get(InquiryStatus.SPAM, 0)
+        spam_rate = (spam_inquiries / total_inquiries * 100) if total_inquiries > 0 else 0
+        
+        return {
+            "total_inquiries": total_inquiries,
+            "new_inquiries": by_status.get(InquiryStatus.NEW, 0),
+            "resolved_inquiries": by_status.get(InquiryStatus.RESOLVED, 0),
+            "by_type": by_type,
+            "by_status": by_status,
+            "spam_rate": round(spam_rate, 2)
+        }
+    
+    async def get_recent_contacts(self, limit: int = 20) -> List[ContactInquiry]:
         """Get recent contact inquiries"""
         try:
-            return self.db.query(ContactInquiry).filter(
-                ContactInquiry.is_active == True
-            ).order_by(desc(ContactInquiry.created_at)).limit(limit).all()
+            result = await self.db.scalars(
+                select(ContactInquiry).where(
+                    ContactInquiry.is_active == True
+                ).order_by(desc(ContactInquiry.created_at)).limit(limit)
+            )
+            return list(result.all())
         except Exception as e:
             logger.error(f"Error getting recent contacts: {str(e)}")
             raise
     
-    def subscribe_newsletter(self, email: str) -> NewsletterSubscription:
+    async def subscribe_newsletter(self, email: str) -> NewsletterSubscription:
         """Subscribe to newsletter"""
         try:
-            # Check if already subscribed
-            existing = self.db.query(NewsletterSubscription).filter(
-                NewsletterSubscription.email == email
-            ).first()
-            
-            if existing:
-                if existing.unsubscribed_at:
-                    # Resubscribe
-                    existing.unsubscribed_at = None
-                    existing.subscribed_at = datetime.utcnow()
-                    existing.confirmed = False
-                    self.db.commit()
-                    self.db.refresh(existing)
-                    return existing
-                else:
-                    # Already subscribed
-                    return existing
-            
-            # Create new subscription
-            subscription = NewsletterSubscription(email=email)
-            self.db.add(subscription)
-            self.db.commit()
-            self.db.refresh(subscription)
+            now = datetime.utcnow()
+            # New addresses are inserted and unsubscribed ones resubscribed in one
+            # upsert; an active subscription is left as it is and returns no row
+            dialect_insert = postgresql.insert if self.db.bind.dialect.name == "postgresql" else sqlite.insert
+            statement = dialect_insert(NewsletterSubscription).values(email=email)
+            subscription = await self.db.scalar(
+                statement.on_conflict_do_update(
+                    index_elements=[NewsletterSubscription.email],
+                    set_={
+                        "unsubscribed_at": None,
+                        "subscribed_at": now,
+                        "confirmed": False,
+                        "updated_at": now
+                    },
+                    where=NewsletterSubscription.unsubscribed_at.is_not(None)
+                ).returning(NewsletterSubscription),
+                execution_options={"populate_existing": True}
+            )
+            await self.db.commit()
             
-            return subscription
+            # Already subscribed
+            return subscription or await self.get_subscription(email)
             
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Error subscribing to newsletter: {str(e)}")
             raise
     
-    def get_subscription(self, email: str) -> Optional[NewsletterSubscription]:
+    async def get_subscription(self, email: str) -> Optional[NewsletterSubscription]:
         """Get newsletter subscription by email"""
         try:
-            return self.db.query(NewsletterSubscription).filter(
-                NewsletterSubscription.email == email
-            ).first()
+            return await self.db.scalar(
+                select(NewsletterSubscription).where(
+                    NewsletterSubscription.email == email
+                ).limit(1)
+            )
         except Exception as e:
             logger.error(f"Error getting subscription for {email}: {str(e)}")
             raise
 
-    def confirm_subscription(self, email: str) -> Optional[NewsletterSubscription]:
+    async def confirm_subscription(self, email: str) -> Optional[NewsletterSubscription]:
         """Confirm newsletter subscription"""
         try:
-            subscription = self.db.query(NewsletterSubscription).filter(
-                NewsletterSubscription.email == email,
-                NewsletterSubscription.unsubscribed_at == None
-            ).first()
-            
-            if subscription and not subscription.confirmed:
-                subscription.confirmed = True
-                subscription.confirmed_at = datetime.utcnow()
-                self.db.commit()
-                return subscription
-            
+            now = datetime.utcnow()
+            subscription = await self.db.scalar(
+                update(NewsletterSubscription)
+                .where(
+                    NewsletterSubscription.email == email,
+                    NewsletterSubscription.unsubscribed_at == None
+                )
+                .values(
+                    confirmed=True,
+                    # Keep the original confirmation time when confirming twice
+                    confirmed_at=func.coalesce(NewsletterSubscription.confirmed_at, now),
+                    updated_at=now
+                )
+                .returning(NewsletterSubscription),
+                execution_options={"populate_existing": True}
+            )
+            await self.db.commit()
             return subscription
             
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Error confirming subscription for {email}: {str(e)}")
             raise
 
-    def unsubscribe_newsletter(self, email: str) -> Optional[NewsletterSubscription]:
+    async def unsubscribe_newsletter(self, email: str) -> Optional[NewsletterSubscription]:
         """Unsubscribe from newsletter"""
         try:
-            subscription = self.db.query(NewsletterSubscription).filter(
-                NewsletterSubscription.email == email,
-                NewsletterSubscription.unsubscribed_at == None
-            ).first()
-            
-            if subscription:
-                subscription.confirmed = False
-                subscription.unsubscribed_at = datetime.utcnow()
-                self.db.commit()
-                return subscription
-            
+            now = datetime.utcnow()
+            subscription = await self.db.scalar(
+                update(NewsletterSubscription)
+                .where(
+                    NewsletterSubscription.email == email,
+                    NewsletterSubscription.unsubscribed_at == None
+                )
+                .values(confirmed=False, unsubscribed_at=now, updated_at=now)
+                .returning(NewsletterSubscription),
+                execution_options={"populate_existing": True}
+            )
+            await self.db.commit()
             return subscription
             
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Error unsubscribing {email} from newsletter: {str(e)}")
             raise
 
-    def submit_newsletter_feedback(self, email: str, feedback: str) -> Optional[NewsletterSubscription]:
+    async def submit_newsletter_feedback(self, email: str, feedback: str) -> Optional[NewsletterSubscription]:
         """Submit feedback for newsletter"""
         try:
-            subscription = self.db.query(NewsletterSubscription).filter(
-                NewsletterSubscription.email == email
-            ).first()
+            subscription = await self.db.scalar(
+                select(NewsletterSubscription).where(
+                    NewsletterSubscription.email == email
+                ).limit(1)
+            )
             
             if subscription:
                 subscription.feedback = feedback
                 subscription.feedback_at = datetime.utcnow()
-                self.db.commit()
+                await self.db.commit()
                 return True
             
             return False
             
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Error submitting newsletter feedback for {email}: {str(e)}")
             return False
         
-    def get_inquiry_by_id(self, contact_id: int) -> Optional[ContactInquiry]:
+    async def get_inquiry_by_id(self, contact_id: int) -> Optional[ContactInquiry]:
         """Get a single contact inquiry by ID"""
-        return self.db.query(ContactInquiry).filter(
-            ContactInquiry.id == contact_id,
-            ContactInquiry.is_active == True
-        ).first()
+        return await self.db.scalar(
+            select(ContactInquiry).where(
+                ContactInquiry.id == contact_id,
+                ContactInquiry.is_active == True
+            ).limit(1)
+        )
     
-    def update_inquiry_status(self, contact_id: int, new_status: str) -> Optional[ContactInquiry]:
+    async def get_inquiry_version(self, contact_id: int) -> Optional[Tuple[int, datetime]]:
+        """(id, updated_at) of an active inquiry, without loading the row"""
+        result = await self.db.execute(
+            select(ContactInquiry.id, ContactInquiry.updated_at).where(
+                ContactInquiry.id == contact_id,
+                ContactInquiry.is_active == True
+            ).limit(1)
+        )
+        row = result.first()
+        return tuple(row) if row else None
+    
+    async def update_inquiry_status(
+        self,
+        contact_id: int,
+        new_status: str,
+        actor: Optional[str] = None
+    ) -> Optional[ContactInquiry]:
         """Update contact inquiry status"""
-        contact = self.get_inquiry_by_id(contact_id)
-        if not contact:
-            return None
-        
-        contact.status = new_status
-        contact.updated_at = datetime.utcnow()
-        
-        self.db.commit()
-        self.db.refresh(contact)
+        contacts = await self.update_inquiry_statuses([contact_id], new_status, actor)
+        return contacts[0] if contacts else None
+    
+    async def update_inquiry_statuses(
+        self,
+        contact_ids: List[int],
+        new_status: str,
+        actor: Optional[str] = None
+    ) -> List[ContactInquiry]:
+        """Move inquiries to a status with one set-based UPDATE
         
-        return contact
+        Returns the updated inquiries; IDs with no active inquiry are skipped.
+        With an actor, each change is also written to the activity log and
+        trains the spam classifier; without one the inquiry is left unjudged.
+        """
+        status = InquiryStatus(new_status)
+        try:
+            active = and_(ContactInquiry.id.in_(contact_ids), ContactInquiry.is_active == True)
+            # Pre-images for the rollup, counter and spam token deltas, locked until commit where supported
+            current = await self.db.scalars(select(ContactInquiry).where(active).with_for_update())
+            before = {
+                contact.id: (contact.status, contact_contribution(contact), spam_features(contact))
+                for contact in current
+            }
+            if not before:
+                return []
+            
+            result = await self.db.scalars(
+                update(ContactInquiry)
+                .where(ContactInquiry.id.in_(list(before)))
+                .values(status=status, status_set_by=actor, updated_at=datetime.utcnow())
+                .returning(ContactInquiry),
+                execution_options={"populate_existing": True}
+            )
+            contacts = result.all()
+            
+            await self.rollups.record_contacts(
+                (before[contact.id][1], contact_contribution(contact)) for contact in contacts
+            )
+            # Only an admin's verdict trains the spam classifier; an anonymous change
+            # can withdraw an earlier verdict (as a rebuild would) but never add one
+            spam_deltas = await self.spam_tokens.record(
+                (before[contact.id][2], spam_features(contact)) for contact in contacts
+            )
+            if actor:
+                await ActivityService(self.db).record_many([
+                    {
+                        "action": "status_changed",
+                        "entity_type": "contact",
+                        "entity_id": str(contact.id),
+                        "actor": actor,
+                        "details": {"from": before[contact.id][0].value, "to": status.value}
+                    }
+                    for contact in contacts
+                ])
+            await self.db.commit()
+            for contact in contacts:
+                contact_counters.record_status_change(before[contact.id][0], status, contact.inquiry_type)
+            spam_classifier.apply(spam_deltas)
+            await response_cache.invalidate(RECENT_CONTACTS_TAG, STATS_TAG)
+            
+            return contacts
+            
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error updating status of {len(contact_ids)} contact inquiries: {str(e)}")
+            raise
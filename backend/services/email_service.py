@@ -9,7 +9,7 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
 import logging
-from typing import Optional
+from typing import List, Optional, Tuple
 from jinja2 import Environment, FileSystemLoader
 import os
 
@@ -46,32 +46,7 @@ class EmailService:
     ) -> bool:
         """Send an email"""
         try:
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = f"{self.from_name} <{self.from_email}>"
-            msg['To'] = to_email
-            
-            # Add text version
-            if text_content:
-                text_part = MIMEText(text_content, 'plain')
-                msg.attach(text_part)
-            
-            # Add HTML version
-            html_part = MIMEText(html_content, 'html')
-            msg.attach(html_part)
-            
-            # Add attachments
-            if attachments:
-                for attachment in attachments:
-                    with open(attachment['path'], 'rb') as file:
-                        part = MIMEBase('application', 'octet-stream')
-                        part.set_payload(file.read())
-                        encoders.encode_base64(part)
-                        part.add_header(
-                            'Content-Disposition',
-                            f'attachment; filename= {attachment["name"]}'
-                        )
-                        msg.attach(part)
+            msg = self._build_message(to_email, subject, html_content, text_content, attachments)
             
             # Send email
             with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
@@ -86,6 +61,69 @@ class EmailService:
             logger.error(f"Failed to send email to {to_email}: {str(e)}")
             return False
     
+    def send_batch(self, messages: List[MIMEMultipart]) -> int:
+        """Send several emails over one SMTP connection, returning how many were sent"""
+        if not messages:
+            return 0
+        
+        sent = 0
+        try:
+            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
+                server.starttls()
+                server.login(self.smtp_username, self.smtp_password)
+                for msg in messages:
+                    # One refused recipient should not stop the rest of the batch
+                    try:
+                        server.send_message(msg)
+                        sent += 1
+                    except smtplib.SMTPException as e:
+                        logger.error(f"Failed to send email to {msg['To']}: {str(e)}")
+            
+            logger.info(f"Sent {sent} of {len(messages)} batched emails")
+            
+        except Exception as e:
+            logger.error(f"Failed to send batch of {len(messages)} emails: {str(e)}")
+        
+        return sent
+    
+    def _build_message(
+        self,
+        to_email: str,
+        subject: str,
+        html_content: str,
+        text_content: str = None,
+        attachments: list = None
+    ) -> MIMEMultipart:
+        """Assemble the MIME message for one email"""
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = subject
+        msg['From'] = f"{self.from_name} <{self.from_email}>"
+        msg['To'] = to_email
+        
+        # Add text version
+        if text_content:
+            text_part = MIMEText(text_content, 'plain')
+            msg.attach(text_part)
+        
+        # Add HTML version
+        html_part = MIMEText(html_content, 'html')
+        msg.attach(html_part)
+        
+        # Add attachments
+        if attachments:
+            for attachment in attachments:
+                with open(attachment['path'], 'rb') as file:
+                    part = MIMEBase('application', 'octet-stream')
+                    part.set_payload(file.read())
+                    encoders.encode_base64(part)
+                    part.add_header(
+                        'Content-Disposition',
+                        f'attachment; filename= {attachment["name"]}'
+                    )
+                    msg.attach(part)
+        
+        return msg
+    
     def send_booking_confirmation(self, booking: ServiceBooking) -> bool:
         """Send booking confirmation to client"""
         try:
@@ -188,19 +226,34 @@ class EmailService:
     def send_status_update(self, booking: ServiceBooking, new_status: str) -> bool:
         """Send booking status update to client"""
         try:
-            template = self.jinja_env.get_template('status_update.html')
-            
-            html_content = template.render(
-                booking=booking,
-                new_status=new_status,
-                business_name=settings.BUSINESS_NAME,
-                business_email=settings.BUSINESS_EMAIL
-            )
-            
-            subject = f"Project Update: {booking.project_name} - {new_status.title()}"
-            
+            subject, html_content = self._render_status_update(booking, new_status)
             return self.send_email(booking.email, subject, html_content)
             
         except Exception as e:
             logger.error(f"Error sending status update: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+    
+    def send_status_updates(self, bookings: List[ServiceBooking], new_status: str) -> int:
+        """Send status updates for many bookings as one batch"""
+        messages = []
+        for booking in bookings:
+            try:
+                subject, html_content = self._render_status_update(booking, new_status)
+                messages.append(self._build_message(booking.email, subject, html_content))
+            except Exception as e:
+                logger.error(f"Error rendering status update for {booking.booking_id}: {str(e)}")
+        
+        return self.send_batch(messages)
+    
+    def _render_status_update(self, booking: ServiceBooking, new_status: str) -> Tuple[str, str]:
+        template = self.jinja_env.get_template('status_update.html')
+        
+        html_content = template.render(
+            booking=booking,
+            new_status=new_status,
+            business_name=settings.BUSINESS_NAME,
+            business_email=settings.BUSINESS_EMAIL
+        )
+        
+        subject = f"Project Update: {booking.project_name} - {new_status.title()}"
+        return subject, html_content
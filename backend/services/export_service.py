@@ -0,0 +1,138 @@
+# backend/services/export_service.py
+"""
+Streaming bulk export of bookings, contact inquiries and newsletter subscriptions
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Table, null, select
+from typing import AsyncIterator, Callable, Optional
+from datetime import datetime
+import logging
+
+from core.config import get_settings
+from models.archive import ARCHIVE_MODELS
+from models.booking import ServiceBooking, ServiceType, ProjectStatus
+from models.contact import ContactInquiry, InquiryType, InquiryStatus
+from models.newsletter import NewsletterSubscription
+from utils.bulk_io import BulkFormat, encode_partitions
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+class ExportService:
+    """
+    Service for streaming rows out as NDJSON or CSV.
+
+    Rows are read as plain column mappings through a server-side cursor
+    (yield_per), so memory stays flat however many rows match.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def export_bookings(
+        self,
+        format: BulkFormat,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        status: Optional[ProjectStatus] = None,
+        service_type: Optional[ServiceType] = None,
+        include_archived: bool = False
+    ) -> AsyncIterator[str]:
+        """Stream active bookings matching the filters"""
+        def criteria(table) -> list:
+            criteria = self._period(table, start_date, end_date)
+            if status:
+                criteria.append(table.c.status == status)
+            if service_type:
+                criteria.append(table.c.service_type == service_type)
+            return criteria
+        return self._export(ServiceBooking, criteria, format, include_archived)
+
+    def export_contacts(
+        self,
+        format: BulkFormat,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        status: Optional[InquiryStatus] = None,
+        inquiry_type: Optional[InquiryType] = None,
+        include_archived: bool = False
+    ) -> AsyncIterator[str]:
+        """Stream active contact inquiries matching the filters"""
+        def criteria(table) -> list:
+            criteria = self._period(table, start_date, end_date)
+            if status:
+                criteria.append(table.c.status == status)
+            if inquiry_type:
+                criteria.append(table.c.inquiry_type == inquiry_type)
+            return criteria
+        return self._export(ContactInquiry, criteria, format, include_archived)
+
+    def export_subscriptions(
+        self,
+        format: BulkFormat,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        confirmed: Optional[bool] = None
+    ) -> AsyncIterator[str]:
+        """Stream active newsletter subscriptions matching the filters"""
+        def criteria(table) -> list:
+            criteria = self._period(table, start_date, end_date)
+            if confirmed is not None:
+                criteria.append(table.c.confirmed == confirmed)
+            return criteria
+        return self._export(NewsletterSubscription, criteria, format)
+
+    def _period(self, table, start_date: Optional[datetime], end_date: Optional[datetime]) -> list:
+        criteria = [table.c.is_active == True]
+        if start_date:
+            criteria.append(table.c.created_at >= start_date)
+        if end_date:
+            criteria.append(table.c.created_at <= end_date)
+        return criteria
+
+    def _statements(self, model, criteria: Callable[[Table], list], include_archived: bool) -> list:
+        table = model.__table__
+        if not include_archived:
+            return [select(table).where(*criteria(table)).order_by(table.c.id)]
+
+        # Hot rows, then archived ones, each streamed in id order with an archived_at column
+        archive = ARCHIVE_MODELS[model].__table__
+        archived_at = null().cast(archive.c.archived_at.type).label("archived_at")
+        return [
+            select(table, archived_at).where(*criteria(table)).order_by(table.c.id),
+            select(archive).where(*criteria(archive)).order_by(archive.c.id)
+        ]
+
+    async def _export(
+        self,
+        model,
+        criteria: Callable[[Table], list],
+        format: BulkFormat,
+        include_archived: bool = False
+    ) -> AsyncIterator[str]:
+        table = model.__table__
+        columns = [column.name for column in table.columns]
+        if include_archived:
+            columns.append("archived_at")
+        exported = 0
+
+        try:
+            async def partitions():
+                nonlocal exported
+                for statement in self._statements(model, criteria, include_archived):
+                    result = await self.db.stream(
+                        statement.execution_options(yield_per=settings.EXPORT_CHUNK_SIZE)
+                    )
+                    async for rows in result.mappings().partitions():
+                        exported += len(rows)
+                        yield rows
+
+            async for chunk in encode_partitions(partitions(), columns, format):
+                yield chunk
+
+        except Exception as e:
+            logger.error(f"Error exporting {table.name} after {exported} rows: {str(e)}")
+            raise
+
+        logger.info(f"Exported {exported} {table.name} rows as {format.value}")
@@ -0,0 +1,190 @@
+# backend/services/idempotency.py
+"""
+Idempotency-Key bookkeeping: claim a key, store its response, replay it
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Optional
+import hashlib
+import json
+import logging
+import time
+
+from core.config import get_settings
+from models.idempotency import IdempotencyRecord
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Expired keys are deleted at most this often per process
+PURGE_INTERVAL = 300
+
+class IdempotencyKeyReused(Exception):
+    """The key was already used for a request with a different body"""
+
+class IdempotencyInProgress(Exception):
+    """The first request with this key has not finished yet"""
+
+@dataclass
+class StoredResponse:
+    """Response recorded for a completed idempotent request"""
+    status_code: int
+    body: Any
+
+def request_fingerprint(payload: Any) -> str:
+    """Stable hash of a request body, used to spot keys reused for other requests"""
+    encoded = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+class IdempotencyService:
+    """Service for claiming idempotency keys and replaying stored responses"""
+
+    _last_purge: float = 0.0
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def begin(self, scope: str, key: str, request_hash: str) -> Optional[StoredResponse]:
+        """
+        Claim a key for a new request, or return the response stored for it.
+
+        Returns None when the caller now owns the key and must run the request,
+        then call complete() or release(). Raises IdempotencyInProgress while
+        another request holds the key and IdempotencyKeyReused if the key was
+        used with a different body.
+        """
+        try:
+            await self._purge_expired()
+            now = datetime.utcnow()
+
+            # A replay costs one primary-key lookup
+            record = await self._get(scope, key)
+            if record is None and await self._insert_claim(scope, key, request_hash, now):
+                return None
+            if record is None:
+                # Lost the race to a concurrent first request
+                record = await self._get(scope, key)
+
+            if self._is_reclaimable(record, now):
+                if await self._reclaim(scope, key, request_hash, record, now):
+                    return None
+                record = await self._get(scope, key)
+
+            if record is None:
+                # Released by its owner between our reads; the client can simply retry
+                raise IdempotencyInProgress(f"A request with idempotency key {key!r} is in progress")
+            if record.request_hash != request_hash:
+                raise IdempotencyKeyReused(f"Idempotency key {key!r} was used for a different request")
+            if record.status_code is None:
+                raise IdempotencyInProgress(f"A request with idempotency key {key!r} is in progress")
+            return StoredResponse(record.status_code, record.response_body)
+        except (IdempotencyKeyReused, IdempotencyInProgress):
+            raise
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error claiming idempotency key: {str(e)}")
+            raise
+
+    async def complete(self, scope: str, key: str, status_code: int, body: Any):
+        """Store the response to replay for the rest of the key's TTL"""
+        try:
+            now = datetime.utcnow()
+            await self.db.execute(
+                update(IdempotencyRecord)
+                .where(IdempotencyRecord.scope == scope, IdempotencyRecord.key == key)
+                .values(
+                    status_code=status_code,
+                    response_body=body,
+                    expires_at=now + timedelta(seconds=settings.IDEMPOTENCY_TTL)
+                )
+            )
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error storing idempotent response: {str(e)}")
+            raise
+
+    async def release(self, scope: str, key: str):
+        """Give up an unfinished claim so the request can be retried"""
+        try:
+            await self.db.rollback()
+            await self.db.execute(
+                delete(IdempotencyRecord).where(
+                    IdempotencyRecord.scope == scope,
+                    IdempotencyRecord.key == key,
+                    IdempotencyRecord.status_code.is_(None)
+                )
+            )
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error releasing idempotency key: {str(e)}")
+
+    async def _get(self, scope: str, key: str):
+        # Plain columns, not entities, so the identity map never serves stale state
+        result = await self.db.execute(
+            select(
+                IdempotencyRecord.request_hash,
+                IdempotencyRecord.status_code,
+                IdempotencyRecord.response_body,
+                IdempotencyRecord.created_at,
+                IdempotencyRecord.expires_at
+            ).where(IdempotencyRecord.scope == scope, IdempotencyRecord.key == key)
+        )
+        return result.first()
+
+    async def _insert_claim(self, scope: str, key: str, request_hash: str, now: datetime) -> bool:
+        dialect_insert = postgresql.insert if self.db.bind.dialect.name == "postgresql" else sqlite.insert
+        result = await self.db.execute(
+            dialect_insert(IdempotencyRecord).values(
+                scope=scope,
+                key=key,
+                request_hash=request_hash,
+                created_at=now,
+                expires_at=now + timedelta(seconds=settings.IDEMPOTENCY_TTL)
+            ).on_conflict_do_nothing()
+        )
+        await self.db.commit()
+        return result.rowcount == 1
+
+    def _is_reclaimable(self, record, now: datetime) -> bool:
+        if record.expires_at <= now:
+            return True
+        # The first request died before completing or releasing its claim
+        lock_timeout = timedelta(seconds=settings.IDEMPOTENCY_LOCK_TIMEOUT)
+        return record.status_code is None and record.created_at <= now - lock_timeout
+
+    async def _reclaim(self, scope: str, key: str, request_hash: str, record, now: datetime) -> bool:
+        # Matching on the old created_at makes concurrent reclaims race safely
+        result = await self.db.execute(
+            update(IdempotencyRecord)
+            .where(
+                IdempotencyRecord.scope == scope,
+                IdempotencyRecord.key == key,
+                IdempotencyRecord.created_at == record.created_at
+            )
+            .values(
+                request_hash=request_hash,
+                status_code=None,
+                response_body=None,
+                created_at=now,
+                expires_at=now + timedelta(seconds=settings.IDEMPOTENCY_TTL)
+            )
+        )
+        await self.db.commit()
+        return result.rowcount == 1
+
+    async def _purge_expired(self):
+        if time.monotonic() - IdempotencyService._last_purge < PURGE_INTERVAL:
+            return
+        IdempotencyService._last_purge = time.monotonic()
+        result = await self.db.execute(
+            delete(IdempotencyRecord).where(IdempotencyRecord.expires_at <= datetime.utcnow())
+        )
+        await self.db.commit()
+        if result.rowcount:
+            logger.info(f"Purged {result.rowcount} expired idempotency keys")
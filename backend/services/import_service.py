@@ -0,0 +1,142 @@
+# backend/services/import_service.py
+"""
+Streaming bulk import of bookings and contact inquiries
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel, ValidationError
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Tuple
+import json
+import logging
+
+from core.config import get_settings
+from schemas.booking import BookingCreate
+from schemas.contact import ContactCreate
+from services.booking_service import BookingService
+from services.contact_service import ContactService
+from utils.bulk_io import BulkFormat, iter_lines, iter_records
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# CSV cells for list fields hold a JSON array or semicolon-separated values
+LIST_FIELDS = {
+    "bookings": ("technologies", "features"),
+    "contacts": ()
+}
+
+class ImportService:
+    """Service for importing bookings and inquiries from NDJSON/CSV streams"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def import_bookings(
+        self,
+        chunks: AsyncIterator[bytes],
+        format: BulkFormat,
+        batch_size: int = None,
+        on_created: Callable[[list], None] = None
+    ) -> dict:
+        """Import bookings, committing each batch of valid rows separately"""
+        return await self._import(
+            "bookings", BookingCreate, BookingService(self.db).create_bookings_bulk,
+            chunks, format, batch_size, on_created
+        )
+
+    async def import_contacts(
+        self,
+        chunks: AsyncIterator[bytes],
+        format: BulkFormat,
+        batch_size: int = None,
+        on_created: Callable[[list], None] = None
+    ) -> dict:
+        """Import contact inquiries, committing each batch of valid rows separately"""
+        return await self._import(
+            "contacts", ContactCreate, ContactService(self.db).create_inquiries_bulk,
+            chunks, format, batch_size, on_created
+        )
+
+    async def _import(
+        self,
+        entity: str,
+        schema: type,
+        create_bulk: Callable[[List[BaseModel]], Awaitable[list]],
+        chunks: AsyncIterator[bytes],
+        format: BulkFormat,
+        batch_size: Optional[int],
+        on_created: Optional[Callable[[list], None]]
+    ) -> dict:
+        batch_size = batch_size or settings.IMPORT_BATCH_SIZE
+        report = {
+            "entity": entity,
+            "processed": 0,
+            "imported": 0,
+            "failed": 0,
+            "errors": [],
+            "errors_truncated": False
+        }
+        batch: List[Tuple[int, BaseModel]] = []
+
+        def fail(line: int, errors: List[str]):
+            report["failed"] += 1
+            if len(report["errors"]) < settings.IMPORT_MAX_ERRORS:
+                report["errors"].append({"line": line, "errors": errors})
+            else:
+                report["errors_truncated"] = True
+
+        async def flush():
+            try:
+                created = await create_bulk([item for _, item in batch])
+            except Exception as e:
+                # The service rolled the batch back; report every row in it
+                for line, _ in batch:
+                    fail(line, [f"Database error: {e.__class__.__name__}"])
+            else:
+                report["imported"] += len(created)
+                if on_created:
+                    on_created(created)
+            batch.clear()
+
+        async for line, record, error in iter_records(iter_lines(chunks), format):
+            report["processed"] += 1
+            if error:
+                fail(line, [error])
+                continue
+
+            if format == BulkFormat.CSV:
+                record = self._split_list_fields(record, LIST_FIELDS[entity])
+
+            try:
+                batch.append((line, schema(**record)))
+            except ValidationError as e:
+                fail(line, [
+                    f"{'.'.join(str(part) for part in error['loc']) or 'record'}: {error['msg']}"
+                    for error in e.errors()
+                ])
+
+            if len(batch) >= batch_size:
+                await flush()
+
+        if batch:
+            await flush()
+
+        logger.info(
+            f"Imported {report['imported']} of {report['processed']} {entity} "
+            f"({report['failed']} failed)"
+        )
+        return report
+
+    def _split_list_fields(self, record: dict, fields: tuple) -> dict:
+        for field in fields:
+            value = record.get(field)
+            if not isinstance(value, str):
+                continue
+            if value.lstrip().startswith("["):
+                try:
+                    record[field] = json.loads(value)
+                    continue
+                except json.JSONDecodeError:
+                    pass
+            record[field] = [item.strip() for item in value.split(";") if item.strip()]
+        return record
@@ -0,0 +1,80 @@
+# backend/services/list_counters.py
+"""
+Cached per-filter row counts for paginated list totals
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select
+from typing import Dict, Optional, Tuple
+import logging
+import time
+
+from core.config import get_settings
+from models.booking import ServiceBooking
+from models.contact import ContactInquiry
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+class ListCounters:
+    """
+    Active row counts bucketed by (status, type) for one list table.
+
+    Services adjust the buckets as they insert rows or change statuses, and the
+    whole table is recounted with a single GROUP BY once the cache is older than
+    LIST_COUNT_CACHE_TTL, which also corrects drift between worker processes.
+    """
+
+    def __init__(self, model, type_column: str, ttl: int = None):
+        self.model = model
+        self.type_column = getattr(model, type_column)
+        self.ttl = ttl if ttl is not None else settings.LIST_COUNT_CACHE_TTL
+        self.reset()
+
+    def reset(self):
+        """Drop all cached counts"""
+        self.buckets: Dict[Tuple, int] = {}
+        self.loaded_at: Optional[float] = None
+
+    @property
+    def is_stale(self) -> bool:
+        return self.loaded_at is None or time.monotonic() - self.loaded_at > self.ttl
+
+    async def refresh(self, db: AsyncSession):
+        """Recount active rows per (status, type) in one grouped query"""
+        result = await db.execute(
+            select(self.model.status, self.type_column, func.count(self.model.id))
+            .where(self.model.is_active == True)
+            .group_by(self.model.status, self.type_column)
+        )
+        self.buckets = {(status, kind): count for status, kind, count in result.all()}
+        self.loaded_at = time.monotonic()
+
+    async def total(self, db: AsyncSession, status=None, kind=None) -> int:
+        """Approximate number of active rows matching the filters"""
+        if self.is_stale:
+            await self.refresh(db)
+
+        return sum(
+            count for (bucket_status, bucket_kind), count in self.buckets.items()
+            if (status is None or bucket_status == status)
+            and (kind is None or bucket_kind == kind)
+        )
+
+    def record_insert(self, status, kind):
+        """Count a newly created row"""
+        if self.loaded_at is not None:
+            self._adjust(status, kind, 1)
+
+    def record_status_change(self, old_status, new_status, kind):
+        """Move a row between status buckets"""
+        if self.loaded_at is not None and old_status != new_status:
+            self._adjust(old_status, kind, -1)
+            self._adjust(new_status, kind, 1)
+
+    def _adjust(self, status, kind, delta: int):
+        key = (status, kind)
+        self.buckets[key] = max(self.buckets.get(key, 0) + delta, 0)
+
+booking_counters = ListCounters(ServiceBooking, "service_type")
+contact_counters = ListCounters(ContactInquiry, "inquiry_type")
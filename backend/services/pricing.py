@@ -0,0 +1,300 @@
+# backend/services/pricing.py
+"""
+Versioned pricing rules and bulk re-estimation of bookings
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import desc, func, or_, select, update
+from typing import List, Optional, Tuple
+from types import SimpleNamespace
+from datetime import datetime
+import logging
+import time
+
+from core.config import get_settings
+from models.booking import ServiceBooking, ServiceType, ProjectStatus, ProjectComplexity
+from models.pricing import PricingRuleSet
+from services.response_cache import BOOKINGS_TAG, RECENT_BOOKINGS_TAG, STATS_TAG, response_cache
+from services.stats_rollups import StatsRollupService, booking_contribution
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# The rules estimates were hard-coded with before pricing was versioned
+DEFAULT_VERSION = 1
+DEFAULT_RULES = {
+    "hourly_rate": 75,
+    "hours_per_feature": 3,
+    "base_hours": {
+        ServiceType.BUSINESS_WEBSITES.value: 20,
+        ServiceType.WEB_APPLICATIONS.value: 40,
+        ServiceType.DATA_AUTOMATION.value: 24,
+        ServiceType.DIGITAL_TRANSFROMATION.value: 50,
+        ServiceType.CONSULTATION.value: 8
+    },
+    "complexity_multipliers": {
+        ProjectComplexity.SIMPLE.value: 1.0,
+        ProjectComplexity.MEDIUM.value: 1.5,
+        ProjectComplexity.COMPLEX.value: 2.5
+    },
+    "technology_points": 2,
+    "feature_points": 2,
+    "complex_feature_points": 5,
+    "complex_features": [
+        "Real-time Features", "Payment Processing", "Data Analytics",
+        "Third-party Integrations", "File Upload/Storage"
+    ],
+    # [min description length, points]; the longest matching length wins
+    "description_points": [[500, 10], [200, 5]],
+    # Scores below these are simple / medium, anything else is complex
+    "simple_below": 20,
+    "medium_below": 40
+}
+
+# Bookings that haven't been quoted yet are re-priced by default
+OPEN_STATUSES = [ProjectStatus.PENDING, ProjectStatus.REVIEWED]
+
+class PricingRules:
+    """A pricing rules version compiled into lookup tables"""
+
+    def __init__(self, version: int, rules: dict):
+        self.version = version
+        self.rules = rules
+
+        try:
+            self.hourly_rate = float(rules["hourly_rate"])
+            self.hours_per_feature = float(rules["hours_per_feature"])
+            multipliers = {
+                ProjectComplexity(level): float(multiplier)
+                for level, multiplier in rules["complexity_multipliers"].items()
+            }
+            # Base hours already scaled by complexity: one dict lookup per estimate
+            self.hours_table = {
+                (ServiceType(service_type), level): float(hours) * multiplier
+                for service_type, hours in rules["base_hours"].items()
+                for level, multiplier in multipliers.items()
+            }
+            self.technology_points = rules["technology_points"]
+            self.feature_points = rules["feature_points"]
+            self.complex_feature_points = rules["complex_feature_points"]
+            self.complex_features = frozenset(rules["complex_features"])
+            self.description_points = sorted(
+                ((int(length), points) for length, points in rules["description_points"]), reverse=True
+            )
+            self.simple_below = rules["simple_below"]
+            self.medium_below = rules["medium_below"]
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid pricing rules: {e}") from e
+
+        missing = {
+            (service_type, level) for service_type in ServiceType for level in ProjectComplexity
+        } - self.hours_table.keys()
+        if missing:
+            raise ValueError("Invalid pricing rules: every service type and complexity needs hours")
+
+    def complexity(self, technologies: List[str], features: List[str], description: str) -> ProjectComplexity:
+        """Classify a project from its requirements"""
+        technologies = technologies or []
+        features = features or []
+
+        score = len(technologies) * self.technology_points
+        score += len(features) * self.feature_points
+        score += self.complex_feature_points * sum(1 for feature in features if feature in self.complex_features)
+
+        # Description complexity (longer = more complex)
+        for length, points in self.description_points:
+            if len(description or "") > length:
+                score += points
+                break
+
+        if score < self.simple_below:
+            return ProjectComplexity.SIMPLE
+        elif score < self.medium_below:
+            return ProjectComplexity.MEDIUM
+        else:
+            return ProjectComplexity.COMPLEX
+
+    def estimate(self, service_type: ServiceType, complexity: ProjectComplexity, feature_count: int) -> Tuple[float, float]:
+        """Estimate project hours and cost"""
+        hours = self.hours_table[(service_type, complexity)] + feature_count * self.hours_per_feature
+        return round(hours, 1), round(hours * self.hourly_rate, 2)
+
+    def score(
+        self,
+        service_type: ServiceType,
+        technologies: List[str],
+        features: List[str],
+        description: str
+    ) -> Tuple[ProjectComplexity, float, float]:
+        """Complexity, hours and cost for one booking"""
+        complexity = self.complexity(technologies, features, description)
+        return (complexity, *self.estimate(service_type, complexity, len(features or [])))
+
+DEFAULT_PRICING = PricingRules(DEFAULT_VERSION, DEFAULT_RULES)
+
+class PricingRegistry:
+    """
+    Process-wide cache of the current pricing rules.
+
+    Workers reload the latest published version once the cache is older than
+    PRICING_CACHE_TTL; publishing through this process swaps it immediately.
+    """
+
+    def __init__(self, ttl: int = None):
+        self.ttl = ttl if ttl is not None else settings.PRICING_CACHE_TTL
+        self.reset()
+
+    def reset(self):
+        """Forget the cached rules"""
+        self.rules: PricingRules = DEFAULT_PRICING
+        self.loaded_at: Optional[float] = None
+
+    @property
+    def is_stale(self) -> bool:
+        return self.loaded_at is None or time.monotonic() - self.loaded_at > self.ttl
+
+    async def current(self, db: AsyncSession) -> PricingRules:
+        """The latest published rules, falling back to the built-in defaults"""
+        if self.is_stale:
+            await self.refresh(db)
+        return self.rules
+
+    async def refresh(self, db: AsyncSession):
+        rule_set = await db.scalar(
+            select(PricingRuleSet).where(
+                PricingRuleSet.is_active == True
+            ).order_by(desc(PricingRuleSet.version)).limit(1)
+        )
+        self.set(PricingRules(rule_set.version, rule_set.rules) if rule_set else DEFAULT_PRICING)
+
+    def set(self, rules: PricingRules):
+        self.rules = rules
+        self.loaded_at = time.monotonic()
+
+pricing_registry = PricingRegistry()
+
+class PricingService:
+    """Service for publishing pricing rules and re-pricing bookings"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.rollups = StatsRollupService(db)
+
+    async def get_current_rules(self) -> PricingRules:
+        """Get the pricing rules new estimates use"""
+        return await pricing_registry.current(self.db)
+
+    async def publish_rules(self, rules: dict, notes: str = None) -> PricingRuleSet:
+        """Publish a new pricing rules version"""
+        try:
+            latest = await self.db.scalar(select(func.max(PricingRuleSet.version)))
+            compiled = PricingRules(max(latest or 0, DEFAULT_VERSION) + 1, rules)
+
+            rule_set = PricingRuleSet(version=compiled.version, rules=rules, notes=notes)
+            self.db.add(rule_set)
+            await self.db.commit()
+            await self.db.refresh(rule_set)
+            pricing_registry.set(compiled)
+
+            logger.info(f"Published pricing rules v{rule_set.version}")
+            return rule_set
+
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error publishing pricing rules: {str(e)}")
+            raise
+
+    async def reestimate_bookings(
+        self,
+        statuses: List[ProjectStatus] = None,
+        chunk_size: int = None
+    ) -> dict:
+        """
+        Re-price bookings whose estimate came from an older rules version.
+
+        Bookings are read in primary-key order a chunk at a time (only the
+        columns scoring needs), scored against the compiled rules and written
+        back with one bulk UPDATE per chunk. Each chunk commits on its own so
+        no write lock is held for longer than one batch.
+        """
+        statuses = statuses or OPEN_STATUSES
+        chunk_size = chunk_size or settings.REESTIMATE_CHUNK_SIZE
+        started = time.perf_counter()
+
+        await pricing_registry.refresh(self.db)
+        rules = pricing_registry.rules
+        last_id = 0
+        scanned = changed = chunks = 0
+
+        try:
+            while True:
+                rows = (await self.db.execute(
+                    select(
+                        ServiceBooking.id,
+                        ServiceBooking.service_type,
+                        ServiceBooking.technologies,
+                        ServiceBooking.features,
+                        ServiceBooking.description,
+                        ServiceBooking.estimated_cost,
+                        ServiceBooking.quote_amount,
+                        ServiceBooking.status,
+                        ServiceBooking.created_at,
+                        ServiceBooking.is_active
+                    ).where(
+                        ServiceBooking.id > last_id,
+                        ServiceBooking.is_active == True,
+                        ServiceBooking.status.in_(statuses),
+                        or_(
+                            ServiceBooking.pricing_version.is_(None),
+                            ServiceBooking.pricing_version != rules.version
+                        )
+                    ).order_by(ServiceBooking.id).limit(chunk_size)
+                )).all()
+
+                if not rows:
+                    break
+
+                updates = []
+                rollup_changes = []
+                now = datetime.utcnow()
+                for row in rows:
+                    complexity, hours, cost = rules.score(
+                        row.service_type, row.technologies, row.features, row.description
+                    )
+                    updates.append({
+                        "id": row.id,
+                        "complexity": complexity,
+                        "estimated_hours": hours,
+                        "estimated_cost": cost,
+                        "pricing_version": rules.version,
+                        # Changes the booking's ETag even within the same second
+                        "updated_at": now
+                    })
+                    if cost != row.estimated_cost:
+                        repriced = SimpleNamespace(**{**row._mapping, "estimated_cost": cost})
+                        rollup_changes.append((booking_contribution(row), booking_contribution(repriced)))
+
+                await self.db.execute(update(ServiceBooking), updates)
+                await self.rollups.record_bookings(rollup_changes)
+                await self.db.commit()
+                await response_cache.invalidate(BOOKINGS_TAG, RECENT_BOOKINGS_TAG, STATS_TAG)
+
+                last_id = rows[-1].id
+                scanned += len(rows)
+                changed += len(rollup_changes)
+                chunks += 1
+
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error re-estimating bookings after id {last_id}: {str(e)}")
+            raise
+
+        elapsed = time.perf_counter() - started
+        logger.info(f"Re-estimated {scanned} bookings against pricing v{rules.version} in {elapsed:.2f}s")
+        return {
+            "pricing_version": rules.version,
+            "bookings_repriced": scanned,
+            "estimates_changed": changed,
+            "chunks": chunks,
+            "duration_seconds": round(elapsed, 3)
+        }
@@ -0,0 +1,127 @@
+# backend/services/quote_expiry.py
+"""
+Expiry of quotes that passed quote_valid_until without being accepted
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, select
+from datetime import datetime
+from typing import Optional
+import asyncio
+import logging
+import time
+
+from core.config import get_settings
+from core.database import AsyncSessionLocal
+from models.booking import ServiceBooking, ProjectStatus
+from services.booking_service import BookingService
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Actor recorded in the activity log for sweeper changes
+SWEEPER_ACTOR = "quote-expiry"
+
+def lapsed_quote(now: datetime):
+    """Criterion for quoted bookings whose quote window has closed"""
+    return and_(
+        ServiceBooking.status == ProjectStatus.QUOTED,
+        ServiceBooking.quote_valid_until < now
+    )
+
+class QuoteExpiryService:
+    """Moves lapsed quotes to EXPIRED in bounded batches"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.bookings = BookingService(db)
+
+    async def expire_quotes(
+        self,
+        batch_size: Optional[int] = None,
+        max_batches: Optional[int] = None,
+        pause: Optional[float] = None
+    ) -> dict:
+        """
+        Expire every lapsed quote, one short transaction per batch.
+
+        Each batch is found through ix_service_bookings_status_quote_valid_until
+        and applied with BookingService.update_statuses, so rollups, counters,
+        caches and the activity log stay in step. The pause between batches lets
+        other writers take SQLite's single write lock; a sweep stops after
+        max_batches and the next one picks up the rest.
+        """
+        batch_size = batch_size or settings.QUOTE_EXPIRY_BATCH_SIZE
+        max_batches = max_batches or settings.QUOTE_EXPIRY_MAX_BATCHES
+        pause = settings.QUOTE_EXPIRY_BATCH_PAUSE if pause is None else pause
+
+        started = time.perf_counter()
+        now = datetime.utcnow()
+        expired = 0
+        batches = 0
+
+        while batches < max_batches:
+            booking_ids = (await self.db.scalars(
+                select(ServiceBooking.booking_id)
+                .where(lapsed_quote(now), ServiceBooking.is_active == True)
+                .order_by(ServiceBooking.quote_valid_until)
+                .limit(batch_size)
+            )).all()
+            # End the read transaction before the write one starts
+            await self.db.commit()
+            if not booking_ids:
+                break
+
+            # The criterion is re-checked under the write, so a quote extended or
+            # accepted since the read above is left alone
+            bookings = await self.bookings.update_statuses(
+                booking_ids, ProjectStatus.EXPIRED, lapsed_quote(now), actor=SWEEPER_ACTOR
+            )
+            expired += len(bookings)
+            batches += 1
+            if len(booking_ids) < batch_size:
+                break
+            await asyncio.sleep(pause)
+
+        result = {
+            "expired": expired,
+            "batches": batches,
+            "duration_seconds": round(time.perf_counter() - started, 3)
+        }
+        if expired:
+            logger.info(f"Expired {expired} lapsed quotes in {batches} batches")
+        return result
+
+class QuoteExpirySweeper:
+    """Runs QuoteExpiryService every QUOTE_EXPIRY_INTERVAL seconds in the background"""
+
+    def __init__(self):
+        self.task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+    async def _run(self):
+        while True:
+            try:
+                async with AsyncSessionLocal() as db:
+                    await QuoteExpiryService(db).expire_quotes()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Whatever was left is retried on the next sweep
+                logger.error(f"Quote expiry sweep failed: {str(e)}")
+            await asyncio.sleep(settings.QUOTE_EXPIRY_INTERVAL)
+
+# Process-wide background sweeper
+quote_expiry_sweeper = QuoteExpirySweeper()
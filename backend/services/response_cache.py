@@ -0,0 +1,237 @@
+# backend/services/response_cache.py
+"""
+Two-tier cache for hot read endpoints: in-process LRU in front of Redis
+"""
+
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Tuple
+import asyncio
+import json
+import logging
+import time
+import uuid
+
+from core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Tags that writes invalidate; entries list the ones their content depends on
+BOOKINGS_TAG = "bookings"  # every single-booking entry
+RECENT_BOOKINGS_TAG = "bookings:recent"
+RECENT_CONTACTS_TAG = "contacts:recent"
+STATS_TAG = "stats"
+
+def booking_tag(booking_id: str) -> str:
+    """Tag of the cached entries for one booking (UUIDs in canonical form)"""
+    try:
+        booking_id = str(uuid.UUID(str(booking_id)))
+    except ValueError:
+        pass
+    return f"booking:{booking_id}"
+
+class LocalCache:
+    """Bounded LRU of JSON-ready values, each with an expiry and a set of tags"""
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.entries: "OrderedDict[str, Tuple[float, Any, frozenset]]" = OrderedDict()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        entry = self.entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value, _ = entry
+        if expires_at <= time.monotonic():
+            del self.entries[key]
+            return False, None
+        self.entries.move_to_end(key)
+        return True, value
+
+    def set(self, key: str, value: Any, tags: Iterable[str]):
+        self.entries[key] = (time.monotonic() + self.ttl, value, frozenset(tags))
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def invalidate(self, tags: Iterable[str]):
+        tags = set(tags)
+        for key in [key for key, (_, _, entry_tags) in self.entries.items() if entry_tags & tags]:
+            del self.entries[key]
+
+class ResponseCache:
+    """
+    Read-through cache keyed per endpoint and filter set.
+
+    Lookups try the process-local LRU, then Redis (shared by all workers), then
+    the loader. Concurrent misses on a key share one loader call. Writes call
+    invalidate() with the tags they affect, which clears matching entries here
+    and in Redis; other workers' local copies expire within CACHE_LOCAL_TTL.
+    Loads from a lagging replica are served but not stored until the replica
+    has had time to see the last invalidating write.
+    """
+
+    def __init__(self):
+        self.redis = None
+        self.reset()
+
+    def reset(self):
+        """Drop every local entry and in-flight load"""
+        self.local = LocalCache(settings.CACHE_MAX_ENTRIES, settings.CACHE_LOCAL_TTL)
+        self.inflight: Dict[str, asyncio.Future] = {}
+        # Bumped by invalidate() so loads that started before a write are not stored
+        self.generation = 0
+        # Wall-clock time of the last invalidation of each tag in this process
+        self.invalidated_at: Dict[str, float] = {}
+
+    async def connect(self, redis_url: str, db: int = 2):
+        """Enable the shared Redis tier"""
+        import redis.asyncio as redis
+
+        client = redis.from_url(redis_url, db=db, decode_responses=True)
+        await client.ping()
+        self.redis = client
+        logger.info(f"Response cache using Redis: {redis_url}")
+
+    async def close(self):
+        if self.redis is not None:
+            await self.redis.aclose()
+            self.redis = None
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        tags: Iterable[str] = (),
+        replica_lag: float = 0
+    ) -> Any:
+        """Return the cached value for key, loading and storing it on a miss
+
+        The loader must return something JSON-serialisable; None is returned
+        as-is and never cached. A loader that may trail the primary by up to
+        replica_lag seconds is not stored while any tag was invalidated more
+        recently than that, since it may predate the write.
+        """
+        if not settings.CACHE_ENABLED:
+            return await loader()
+
+        hit, value = self.local.get(key)
+        if hit:
+            return value
+
+        # Single flight: later misses wait for the load already under way
+        pending = self.inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self.inflight[key] = future
+        try:
+            value = await self._load(key, loader, tuple(tags), replica_lag)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unobserved failure is not logged again
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            self.inflight.pop(key, None)
+
+    async def invalidate(self, *tags: str):
+        """Drop every entry carrying any of the tags, locally and in Redis"""
+        self.generation += 1
+        self.local.invalidate(tags)
+        now = time.time()
+        for tag in tags:
+            self.invalidated_at[tag] = now
+        if self.redis is None or not tags:
+            return
+        try:
+            tag_keys = [self._tag_key(tag) for tag in tags]
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for tag_key in tag_keys:
+                    pipe.smembers(tag_key)
+                members = await pipe.execute()
+            keys = set().union(*members)
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.delete(*keys, *tag_keys)
+                for tag in tags:
+                    pipe.set(self._invalidated_key(tag), now, ex=settings.CACHE_TTL)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Response cache invalidation failed in Redis: {e}")
+
+    async def _load(self, key: str, loader, tags: tuple, replica_lag: float = 0) -> Any:
+        generation = self.generation
+
+        shared = await self._redis_get(key)
+        if shared is not None:
+            self.local.set(key, shared, tags)
+            return shared
+
+        value = await loader()
+        if value is None or generation != self.generation:
+            return value
+        if replica_lag and await self._invalidated_since(tags, time.time() - replica_lag):
+            return value
+
+        self.local.set(key, value, tags)
+        await self._redis_set(key, value, tags)
+        return value
+
+    async def _invalidated_since(self, tags: tuple, since: float) -> bool:
+        """Whether this or any worker invalidated one of the tags after `since`"""
+        if any(self.invalidated_at.get(tag, 0) > since for tag in tags):
+            return True
+        if self.redis is None or not tags:
+            return False
+        try:
+            stamps = await self.redis.mget([self._invalidated_key(tag) for tag in tags])
+            return any(stamp is not None and float(stamp) > since for stamp in stamps)
+        except Exception as e:
+            logger.warning(f"Response cache read failed in Redis: {e}")
+            # Unknown, so don't risk storing stale data
+            return True
+
+    async def _redis_get(self, key: str) -> Any:
+        if self.redis is None:
+            return None
+        try:
+            raw = await self.redis.get(self._entry_key(key))
+            return json.loads(raw) if raw is not None else None
+        except Exception as e:
+            logger.warning(f"Response cache read failed in Redis: {e}")
+            return None
+
+    async def _redis_set(self, key: str, value: Any, tags: tuple):
+        if self.redis is None:
+            return
+        try:
+            entry_key = self._entry_key(key)
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.set(entry_key, json.dumps(value), ex=settings.CACHE_TTL)
+                for tag in tags:
+                    # Tag sets outlive their entries so invalidation always finds them
+                    pipe.sadd(self._tag_key(tag), entry_key)
+                    pipe.expire(self._tag_key(tag), settings.CACHE_TTL * 2)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Response cache write failed in Redis: {e}")
+
+    def _entry_key(self, key: str) -> str:
+        return f"response_cache:{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"response_cache_tag:{tag}"
+
+    def _invalidated_key(self, tag: str) -> str:
+        return f"response_cache_invalidated:{tag}"
+
+# Process-wide response cache
+response_cache = ResponseCache()
@@ -0,0 +1,96 @@
+# backend/services/search_service.py
+"""
+Ranked full-text search over bookings and contact inquiries
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import column, desc, func, literal_column, select, table
+from typing import List, Tuple
+import logging
+import re
+
+from models.booking import ServiceBooking
+from models.contact import ContactInquiry
+from models.search import SEARCH_COLUMNS, SEARCH_CONFIG, fts_table_name, search_vector_sql
+
+logger = logging.getLogger(__name__)
+
+# Per-column bm25 weights (SQLite), in SEARCH_COLUMNS order
+SEARCH_WEIGHTS = {
+    "service_bookings": (4.0, 1.0, 2.0, 1.0),
+    "contact_inquiries": (3.0, 1.0)
+}
+
+SearchHits = Tuple[List[Tuple[object, float]], bool]
+
+def fts5_match_query(query: str) -> str:
+    """Turn free text into an FTS5 query matching every word
+
+    Words are quoted so FTS5 operators in user input are taken literally, and
+    the last word matches as a prefix so partially typed terms still hit.
+    """
+    words = re.findall(r"\w+", query)
+    if not words:
+        raise ValueError("Search query must contain at least one word")
+    return " ".join(f'"{word}"' for word in words) + "*"
+
+class SearchService:
+    """Service for full-text search backed by FTS5 or PostgreSQL tsvector indexes"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def search_bookings(self, query: str, limit: int = 20, offset: int = 0) -> SearchHits:
+        """Search active bookings by project name, description, company and client notes"""
+        return await self._search(ServiceBooking, query, limit, offset)
+
+    async def search_inquiries(self, query: str, limit: int = 20, offset: int = 0) -> SearchHits:
+        """Search active contact inquiries by subject and message"""
+        return await self._search(ContactInquiry, query, limit, offset)
+
+    async def _search(self, model, query: str, limit: int, offset: int) -> SearchHits:
+        """Return (row, rank) pairs best match first, and whether more pages follow"""
+        try:
+            dialect = self.db.bind.dialect.name
+            if dialect == "sqlite":
+                statement = self._fts5_statement(model, query)
+            elif dialect == "postgresql":
+                statement = self._tsvector_statement(model, query)
+            else:
+                raise NotImplementedError(f"Full-text search is not supported on {dialect}")
+
+            # Fetch one extra row to learn whether another page exists
+            result = await self.db.execute(
+                statement.where(model.is_active == True).limit(limit + 1).offset(offset)
+            )
+            hits = [(row, float(rank)) for row, rank in result.all()]
+            return hits[:limit], len(hits) > limit
+        except Exception as e:
+            logger.error(f"Error searching {model.__tablename__}: {str(e)}")
+            raise
+
+    def _fts5_statement(self, model, query: str):
+        table_name = model.__tablename__
+        fts_name = fts_table_name(table_name)
+        fts = table(fts_name, column("rowid"))
+        # bm25 is lower for better matches; negate it so rank reads higher-is-better
+        bm25 = func.bm25(literal_column(fts_name), *SEARCH_WEIGHTS[table_name])
+        return (
+            select(model, (-bm25).label("rank"))
+            .join(fts, fts.c.rowid == model.id)
+            .where(literal_column(fts_name).op("MATCH")(fts5_match_query(query)))
+            .order_by(bm25, model.id)
+        )
+
+    def _tsvector_statement(self, model, query: str):
+        if not re.search(r"\w", query):
+            raise ValueError("Search query must contain at least one word")
+        # Same expression as the GIN index so the planner can use it
+        vector = literal_column(search_vector_sql(model.__tablename__))
+        tsquery = func.websearch_to_tsquery(literal_column(f"'{SEARCH_CONFIG}'"), query)
+        rank = func.ts_rank(vector, tsquery)
+        return (
+            select(model, rank.label("rank"))
+            .where(vector.op("@@")(tsquery))
+            .order_by(desc(rank), model.id)
+        )
@@ -0,0 +1,279 @@
+# backend/services/spam_classifier.py
+"""
+Naive Bayes spam classifier for contact inquiries, trained on their statuses
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
+import logging
+import math
+import re
+import time
+
+from core.config import get_settings
+from models.archive import ArchivedContactInquiry
+from models.contact import ContactInquiry, InquiryStatus
+from models.spam import SpamTokenCount
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Token of the spam_token_counts row holding the number of spam/non-spam inquiries
+DOCUMENTS_TOKEN = ""
+
+# Words, numbers, prices and host names ("cheap-pills.example.com")
+TOKEN_PATTERN = re.compile(r"[a-z0-9$£€]+(?:['._-][a-z0-9]+)*")
+MAX_TOKEN_LENGTH = 40
+# Distinct tokens taken from one inquiry; later ones rarely change the verdict
+MAX_TOKENS = 300
+
+# Inquiries in these statuses are training examples; NEW ones have no verdict yet
+SPAM_STATUSES = frozenset([InquiryStatus.SPAM])
+HAM_STATUSES = frozenset([InquiryStatus.READ, InquiryStatus.REPLIED, InquiryStatus.RESOLVED])
+
+# (is spam, tokens) for one inquiry, or None when it isn't a training example
+Features = Optional[Tuple[bool, frozenset]]
+
+def inquiry_tokens(subject: str, message: str, email: Optional[str] = None) -> frozenset:
+    """The distinct tokens of an inquiry, plus the sender's email domain"""
+    tokens = {}
+    for match in TOKEN_PATTERN.finditer(f"{subject}\n{message}".lower()):
+        tokens[match.group()[:MAX_TOKEN_LENGTH]] = None
+        if len(tokens) >= MAX_TOKENS:
+            break
+    if email and "@" in email:
+        tokens[f"from:{email.rsplit('@', 1)[1].lower()}"[:MAX_TOKEN_LENGTH]] = None
+    return frozenset(tokens)
+
+def training_label(status: InquiryStatus) -> Optional[bool]:
+    """True for spam, False for genuine inquiries, None while there is no verdict"""
+    if status in SPAM_STATUSES:
+        return True
+    if status in HAM_STATUSES:
+        return False
+    return None
+
+def spam_features(inquiry) -> Features:
+    """What an inquiry (or archived inquiry) adds to the token counts
+
+    Only statuses a person set count; a status scored on arrival would train
+    the classifier on its own verdicts.
+    """
+    label = training_label(inquiry.status)
+    if label is None or inquiry.status_set_by is None:
+        return None
+    return label, inquiry_tokens(inquiry.subject, inquiry.message, inquiry.email)
+
+def token_deltas(changes: Iterable[Tuple[Features, Features]]) -> Dict[str, List[int]]:
+    """Net [spam, ham] count change per token for many (before, after) changes"""
+    deltas: Dict[str, List[int]] = {}
+    for before, after in changes:
+        for features, sign in ((before, -1), (after, 1)):
+            if features is None:
+                continue
+            is_spam, tokens = features
+            column = 0 if is_spam else 1
+            for token in (DOCUMENTS_TOKEN, *tokens):
+                deltas.setdefault(token, [0, 0])[column] += sign
+    return {token: delta for token, delta in deltas.items() if any(delta)}
+
+class SpamModel:
+    """
+    Token counts compiled for scoring.
+
+    Each known token carries log((spam + 1) / (ham + 1)); the per-class
+    denominators are added once per message, so scoring is one dict lookup
+    per token and updating touches only the tokens that changed.
+    """
+
+    def __init__(self, counts: Optional[Dict[str, Tuple[int, int]]] = None):
+        self.spam_documents = 0
+        self.ham_documents = 0
+        self.counts: Dict[str, Tuple[int, int]] = {}
+        self.weights: Dict[str, float] = {}
+        self.apply(counts or {})
+
+    def apply(self, deltas: Dict[str, Iterable[int]]):
+        """Add [spam, ham] count changes per token"""
+        for token, (spam, ham) in deltas.items():
+            if token == DOCUMENTS_TOKEN:
+                self.spam_documents += spam
+                self.ham_documents += ham
+                continue
+            current_spam, current_ham = self.counts.get(token, (0, 0))
+            spam, ham = current_spam + spam, current_ham + ham
+            if spam or ham:
+                self.counts[token] = (spam, ham)
+                self.weights[token] = math.log(spam + 1) - math.log(ham + 1)
+            else:
+                self.counts.pop(token, None)
+                self.weights.pop(token, None)
+
+    @property
+    def is_trained(self) -> bool:
+        minimum = settings.SPAM_CLASSIFIER_MIN_DOCUMENTS
+        return self.spam_documents >= minimum and self.ham_documents >= minimum
+
+    def probability(self, tokens: Iterable[str]) -> float:
+        """Probability that an inquiry with these tokens is spam
+
+        Tokens never seen in training are ignored rather than smoothed, so a
+        message full of new words is judged on the words that are known.
+        """
+        # An empty class would make the prior infinite
+        spam, ham = max(self.spam_documents, 1), max(self.ham_documents, 1)
+        known = 0
+        log_odds = math.log(spam / ham)
+        for token in tokens:
+            weight = self.weights.get(token)
+            if weight is not None:
+                log_odds += weight
+                known += 1
+        # Laplace-smoothed P(token | class) = (count + 1) / (documents + 2)
+        log_odds += known * (math.log(ham + 2) - math.log(spam + 2))
+        log_odds = max(-30.0, min(30.0, log_odds))
+        return 1 / (1 + math.exp(-log_odds))
+
+class SpamClassifier:
+    """
+    Process-wide trained model.
+
+    Workers reload the token counts once the model is older than
+    SPAM_CLASSIFIER_CACHE_TTL; changes committed through this process apply
+    immediately.
+    """
+
+    def __init__(self, ttl: int = None):
+        self.ttl = ttl if ttl is not None else settings.SPAM_CLASSIFIER_CACHE_TTL
+        self.reset()
+
+    def reset(self):
+        """Forget the loaded model"""
+        self.model = SpamModel()
+        self.loaded_at: Optional[float] = None
+
+    @property
+    def is_stale(self) -> bool:
+        return self.loaded_at is None or time.monotonic() - self.loaded_at > self.ttl
+
+    async def current(self, db: AsyncSession) -> SpamModel:
+        if self.is_stale:
+            await self.refresh(db)
+        return self.model
+
+    async def refresh(self, db: AsyncSession):
+        rows = await db.execute(
+            select(SpamTokenCount.token, SpamTokenCount.spam_count, SpamTokenCount.ham_count)
+        )
+        self.set(SpamModel({token: (spam, ham) for token, spam, ham in rows}))
+
+    def set(self, model: SpamModel):
+        self.model = model
+        self.loaded_at = time.monotonic()
+
+    def apply(self, deltas: Dict[str, List[int]]):
+        """Apply committed count changes to the loaded model"""
+        if deltas:
+            self.model.apply(deltas)
+
+    async def probability(
+        self,
+        db: AsyncSession,
+        subject: str,
+        message: str,
+        email: Optional[str] = None
+    ) -> Optional[float]:
+        """Spam probability of a submission, or None when disabled or not yet trained"""
+        if not settings.SPAM_CLASSIFIER_ENABLED:
+            return None
+        model = await self.current(db)
+        if not model.is_trained:
+            return None
+        return model.probability(inquiry_tokens(subject, message, email))
+
+# Process-wide spam model
+spam_classifier = SpamClassifier()
+
+class SpamTokenService:
+    """Keeps spam_token_counts in step with inquiry verdicts"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def record(self, changes: Iterable[Tuple[Features, Features]]) -> Dict[str, List[int]]:
+        """Apply (before, after) changes in the caller's transaction
+
+        Returns the deltas written; pass them to spam_classifier.apply() once
+        the transaction commits.
+        """
+        deltas = token_deltas(changes)
+        if deltas:
+            await self._upsert([
+                {"token": token, "spam_count": spam, "ham_count": ham}
+                for token, (spam, ham) in deltas.items()
+            ])
+        return deltas
+
+    async def _upsert(self, rows: list):
+        dialect_insert = postgresql.insert if self.db.bind.dialect.name == "postgresql" else sqlite.insert
+        statement = dialect_insert(SpamTokenCount)
+        statement = statement.on_conflict_do_update(
+            index_elements=["token"],
+            set_={
+                "spam_count": SpamTokenCount.spam_count + statement.excluded.spam_count,
+                "ham_count": SpamTokenCount.ham_count + statement.excluded.ham_count
+            }
+        )
+        await self.db.execute(statement, rows)
+
+    async def labelled_inquiries(self, chunk_size: int = 1000) -> AsyncIterator:
+        """Every inquiry a person has judged, hot and archived, a chunk at a time"""
+        labelled = [*SPAM_STATUSES, *HAM_STATUSES]
+        for model in (ContactInquiry, ArchivedContactInquiry):
+            result = await self.db.stream(
+                select(
+                    model.subject, model.message, model.email, model.first_name,
+                    model.last_name, model.status, model.status_set_by, model.created_at
+                ).where(
+                    model.status.in_(labelled),
+                    model.status_set_by.isnot(None)
+                ).execution_options(yield_per=chunk_size)
+            )
+            async for row in result:
+                yield row
+
+    async def rebuild(self, chunk_size: int = 1000) -> dict:
+        """Recount spam_token_counts from every inquiry a person has judged"""
+        try:
+            counts: Dict[str, List[int]] = {}
+            async for row in self.labelled_inquiries(chunk_size):
+                for token, (spam, ham) in token_deltas([(None, spam_features(row))]).items():
+                    total = counts.setdefault(token, [0, 0])
+                    total[0] += spam
+                    total[1] += ham
+
+            await self.db.execute(delete(SpamTokenCount))
+            rows = [
+                {"token": token, "spam_count": spam, "ham_count": ham}
+                for token, (spam, ham) in counts.items()
+            ]
+            for start in range(0, len(rows), chunk_size):
+                await self.db.execute(insert(SpamTokenCount), rows[start:start + chunk_size])
+            await self.db.commit()
+
+            model = SpamModel(counts)
+            spam_classifier.set(model)
+            result = {
+                "spam_documents": model.spam_documents,
+                "ham_documents": model.ham_documents,
+                "tokens": len(model.counts)
+            }
+            logger.info(f"Rebuilt spam token counts: {result}")
+            return result
+
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error rebuilding spam token counts: {str(e)}")
+            raise
@@ -0,0 +1,182 @@
+# backend/services/stats_rollups.py
+"""
+Daily rollups for admin statistics: incremental upkeep, reads and rebuilds
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, func, insert, select, union_all
+from sqlalchemy.dialects import postgresql, sqlite
+from typing import Dict, Iterable, Optional, Tuple
+from datetime import date, datetime, timezone
+import logging
+
+from models.archive import ArchivedContactInquiry, ArchivedServiceBooking
+from models.booking import ServiceBooking
+from models.contact import ContactInquiry
+from models.rollup import BookingDailyRollup, ContactDailyRollup
+
+logger = logging.getLogger(__name__)
+
+BOOKING_MEASURES = (
+    "booking_count", "quoted_sum", "estimate_sum", "estimate_count", "value_sum", "value_count"
+)
+
+# (rollup key, {measure: amount}) for one row, or None when it isn't counted
+Contribution = Optional[Tuple[tuple, Dict[str, float]]]
+
+def rollup_day(value: datetime) -> date:
+    """Calendar day (UTC) a timestamp is rolled up under"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.date()
+
+def rollup_day_sql(column, dialect_name: str):
+    """SQL expression for rollup_day() of a timestamp column
+
+    PostgreSQL's date() of a timestamptz follows the session time zone, so the
+    value is converted to UTC first.
+    """
+    if dialect_name == "postgresql":
+        column = func.timezone("UTC", column)
+    return func.date(column)
+
+def booking_contribution(booking: ServiceBooking) -> Contribution:
+    """What a booking adds to its (day, service_type, status) rollup"""
+    if not booking.is_active:
+        return None
+
+    value = booking.quote_amount if booking.quote_amount is not None else booking.estimated_cost
+    return (rollup_day(booking.created_at), booking.service_type, booking.status), {
+        "booking_count": 1,
+        "quoted_sum": booking.quote_amount or 0.0,
+        "estimate_sum": booking.estimated_cost or 0.0,
+        "estimate_count": int(booking.estimated_cost is not None),
+        "value_sum": value or 0.0,
+        "value_count": int(value is not None)
+    }
+
+def contact_contribution(inquiry: ContactInquiry) -> Contribution:
+    """What an inquiry adds to its (day, inquiry_type, status) rollup"""
+    if not inquiry.is_active:
+        return None
+
+    return (rollup_day(inquiry.created_at), inquiry.inquiry_type, inquiry.status), {"inquiry_count": 1}
+
+class StatsRollupService:
+    """Keeps the daily rollup tables in step with booking and contact writes"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def record_booking(self, before: Contribution, after: Contribution):
+        """Move a booking's contribution between rollups in the caller's transaction"""
+        await self.record_bookings([(before, after)])
+
+    async def record_bookings(self, changes: Iterable[Tuple[Contribution, Contribution]]):
+        """Apply many (before, after) booking changes with one upsert per affected rollup"""
+        await self._apply(BookingDailyRollup, ("day", "service_type", "status"), changes)
+
+    async def record_contact(self, before: Contribution, after: Contribution):
+        """Move an inquiry's contribution between rollups in the caller's transaction"""
+        await self.record_contacts([(before, after)])
+
+    async def record_contacts(self, changes: Iterable[Tuple[Contribution, Contribution]]):
+        """Apply many (before, after) inquiry changes with one upsert per affected rollup"""
+        await self._apply(ContactDailyRollup, ("day", "inquiry_type", "status"), changes)
+
+    async def _apply(self, model, key_columns: tuple, changes: Iterable[Tuple[Contribution, Contribution]]):
+        deltas: Dict[tuple, Dict[str, float]] = {}
+        for before, after in changes:
+            for contribution, sign in ((before, -1), (after, 1)):
+                if contribution is None:
+                    continue
+                key, measures = contribution
+                bucket = deltas.setdefault(key, {})
+                for measure, amount in measures.items():
+                    bucket[measure] = bucket.get(measure, 0) + sign * amount
+
+        rows = [
+            {**dict(zip(key_columns, key)), **measures}
+            for key, measures in deltas.items() if any(measures.values())
+        ]
+        if rows:
+            await self._upsert(model, key_columns, rows)
+
+    async def _upsert(self, model, key_columns: tuple, rows: list):
+        """Add each row's measures to its rollup, creating missing ones, in one executemany"""
+        dialect_insert = postgresql.insert if self.db.bind.dialect.name == "postgresql" else sqlite.insert
+        statement = dialect_insert(model)
+        statement = statement.on_conflict_do_update(
+            index_elements=list(key_columns),
+            set_={
+                measure: getattr(model, measure) + statement.excluded[measure]
+                for measure in rows[0] if measure not in key_columns
+            }
+        )
+        await self.db.execute(statement, rows)
+
+    async def rebuild(self) -> dict:
+        """Regenerate both rollup tables from the raw rows, hot and archived
+
+        Archiving leaves the rollups alone, so archived rows are counted here too.
+        """
+        try:
+            await self.db.execute(delete(BookingDailyRollup))
+            await self.db.execute(delete(ContactDailyRollup))
+            dialect_name = self.db.bind.dialect.name
+
+            bookings = union_all(*(
+                select(
+                    model.created_at, model.service_type, model.status, model.quote_amount, model.estimated_cost
+                ).where(model.is_active == True)
+                for model in (ServiceBooking, ArchivedServiceBooking)
+            )).subquery()
+            project_value = func.coalesce(bookings.c.quote_amount, bookings.c.estimated_cost)
+            booking_day = rollup_day_sql(bookings.c.created_at, dialect_name)
+            await self.db.execute(
+                insert(BookingDailyRollup).from_select(
+                    ["day", "service_type", "status", *BOOKING_MEASURES],
+                    select(
+                        booking_day,
+                        bookings.c.service_type,
+                        bookings.c.status,
+                        func.count(),
+                        func.coalesce(func.sum(bookings.c.quote_amount), 0.0),
+                        func.coalesce(func.sum(bookings.c.estimated_cost), 0.0),
+                        func.count(bookings.c.estimated_cost),
+                        func.coalesce(func.sum(project_value), 0.0),
+                        func.count(project_value)
+                    ).group_by(booking_day, bookings.c.service_type, bookings.c.status)
+                )
+            )
+
+            inquiries = union_all(*(
+                select(model.created_at, model.inquiry_type, model.status).where(model.is_active == True)
+                for model in (ContactInquiry, ArchivedContactInquiry)
+            )).subquery()
+            contact_day = rollup_day_sql(inquiries.c.created_at, dialect_name)
+            await self.db.execute(
+                insert(ContactDailyRollup).from_select(
+                    ["day", "inquiry_type", "status", "inquiry_count"],
+                    select(
+                        contact_day,
+                        inquiries.c.inquiry_type,
+                        inquiries.c.status,
+                        func.count()
+                    ).group_by(contact_day, inquiries.c.inquiry_type, inquiries.c.status)
+                )
+            )
+
+            await self.db.commit()
+
+            counts = {
+                "booking_rollups": await self.db.scalar(select(func.count()).select_from(BookingDailyRollup)),
+                "contact_rollups": await self.db.scalar(select(func.count()).select_from(ContactDailyRollup))
+            }
+            logger.info(f"Rebuilt statistics rollups: {counts}")
+            return counts
+
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error rebuilding statistics rollups: {str(e)}")
+            raise
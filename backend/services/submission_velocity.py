@@ -0,0 +1,109 @@
+# backend/services/submission_velocity.py
+"""
+Per-IP submission velocity: sliding-window counters in Redis with an in-process fallback
+"""
+
+from collections import OrderedDict
+from typing import List, Optional
+import logging
+import time
+
+from core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+def window_position(now: float, window: int):
+    """The current fixed window and how far through it `now` is (0 to 1)"""
+    bucket, offset = divmod(now, window)
+    return int(bucket), offset / window
+
+def sliding_estimate(current: int, previous: int, elapsed: float) -> float:
+    """Events in the last window, weighting the previous bucket by how much of it still overlaps"""
+    return current + previous * (1 - elapsed)
+
+class LocalWindowCounter:
+    """Bounded LRU of per-key [bucket, current count, previous count]"""
+
+    def __init__(self, max_entries: int, window: int):
+        self.max_entries = max_entries
+        self.window = window
+        self.entries: "OrderedDict[str, List[int]]" = OrderedDict()
+
+    def record(self, key: str, now: float) -> float:
+        bucket, elapsed = window_position(now, self.window)
+        entry = self.entries.get(key)
+        if entry is None or entry[0] < bucket - 1:
+            current, previous = 0, 0
+        elif entry[0] == bucket - 1:
+            current, previous = 0, entry[1]
+        else:
+            current, previous = entry[1], entry[2]
+
+        estimate = sliding_estimate(current, previous, elapsed)
+        self.entries[key] = [bucket, current + 1, previous]
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return estimate
+
+class SubmissionVelocity:
+    """
+    How often each IP address has submitted recently.
+
+    Each IP has a counter for the current fixed window and the previous one;
+    the sliding count weights the previous window by its overlap with the last
+    SPAM_VELOCITY_WINDOW seconds. Recording and reading is one Redis round trip
+    (shared by all workers) or, without Redis, a lookup in a per-process LRU
+    of at most SPAM_VELOCITY_MAX_IPS addresses.
+    """
+
+    def __init__(self):
+        self.redis = None
+        self.reset()
+
+    def reset(self):
+        """Forget every locally counted address"""
+        self.local = LocalWindowCounter(settings.SPAM_VELOCITY_MAX_IPS, settings.SPAM_VELOCITY_WINDOW)
+
+    async def connect(self, redis_url: str, db: int = 3):
+        """Count in Redis so every worker sees the same totals"""
+        import redis.asyncio as redis
+
+        client = redis.from_url(redis_url, db=db, decode_responses=True)
+        await client.ping()
+        self.redis = client
+        logger.info(f"Submission velocity using Redis: {redis_url}")
+
+    async def close(self):
+        if self.redis is not None:
+            await self.redis.aclose()
+            self.redis = None
+
+    async def record(self, ip_address: str, now: Optional[float] = None) -> float:
+        """Count a submission from the address and return how many came before it in the window"""
+        now = time.time() if now is None else now
+        if self.redis is not None:
+            try:
+                return await self._redis_record(ip_address, now)
+            except Exception as e:
+                logger.warning(f"Submission velocity failed in Redis: {e}")
+        return self.local.record(ip_address, now)
+
+    async def _redis_record(self, ip_address: str, now: float) -> float:
+        window = settings.SPAM_VELOCITY_WINDOW
+        bucket, elapsed = window_position(now, window)
+        current_key = self._key(ip_address, bucket)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.incr(current_key)
+            # Kept through the next window, where it is the previous bucket
+            pipe.expire(current_key, window * 2)
+            pipe.get(self._key(ip_address, bucket - 1))
+            current, _, previous = await pipe.execute()
+        return sliding_estimate(current - 1, int(previous or 0), elapsed)
+
+    def _key(self, ip_address: str, bucket: int) -> str:
+        return f"submission_velocity:{ip_address}:{bucket}"
+
+# Process-wide submission counters
+submission_velocity = SubmissionVelocity()
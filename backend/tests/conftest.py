@@ -0,0 +1,38 @@
+# backend/tests/conftest.py
+"""
+Shared fixtures for service-level tests
+"""
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+import models
+from models.base import Base
+from services.list_counters import booking_counters, contact_counters
+from services.pricing import pricing_registry
+from services.response_cache import response_cache
+from services.spam_classifier import spam_classifier
+from services.submission_velocity import submission_velocity
+
+@pytest_asyncio.fixture
+async def db_engine(tmp_path):
+    """Async engine bound to a throwaway SQLite database"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    # Process-wide caches must not leak counts between test databases
+    booking_counters.reset()
+    contact_counters.reset()
+    pricing_registry.reset()
+    response_cache.reset()
+    submission_velocity.reset()
+    spam_classifier.reset()
+    yield engine
+    await engine.dispose()
+
+@pytest_asyncio.fixture
+async def db(db_engine):
+    """Async session for exercising services directly"""
+    session_factory = async_sessionmaker(bind=db_engine, autoflush=False, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
@@ -0,0 +1,133 @@
+# backend/tests/test_archive_service.py
+"""
+Test cases for hot/cold archival
+"""
+
+import json
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import Delete, select, update
+
+from models.archive import ArchivedServiceBooking
+from models.booking import ServiceBooking, ProjectStatus
+from models.contact import ContactInquiry, InquiryStatus
+from models.rollup import BookingDailyRollup, ContactDailyRollup
+from schemas.contact import ContactCreate
+from services.archive_service import ArchiveService
+from services.booking_service import BookingService
+from services.contact_service import ContactService
+from services.export_service import ExportService
+from services.stats_rollups import StatsRollupService
+from utils.bulk_io import BulkFormat
+from tests.test_booking_service import make_booking_data
+from tests.test_export_service import collect
+from tests.test_query_plans import StatementRecorder, assert_no_full_scans
+from tests.test_stats_rollups import rollup_rows
+
+async def age(db, model, row_id: int, days: int, **values):
+    """Backdate a row (and apply other changes) outside the services"""
+    then = datetime.utcnow() - timedelta(days=days)
+    await db.execute(
+        update(model).where(model.id == row_id).values(created_at=then, updated_at=then, **values)
+    )
+    await db.commit()
+
+@pytest.mark.asyncio
+async def test_archive_moves_matching_rows_out_of_hot_tables(db, db_engine):
+    """Test each rule moves only aged matching rows and the rollups keep counting them"""
+    bookings = BookingService(db)
+    contacts = ContactService(db)
+    old_completed = await bookings.create_booking(make_booking_data(project_name="Old Project"))
+    recent_completed = await bookings.create_booking(make_booking_data())
+    deleted = await bookings.create_booking(make_booking_data())
+    await bookings.update_statuses(
+        [old_completed.booking_id, recent_completed.booking_id], ProjectStatus.COMPLETED
+    )
+    spam = await contacts.create_inquiry(ContactCreate(
+        first_name="Spam",
+        last_name="Bot",
+        email="bot@example.com",
+        subject="Cheap offers",
+        message="Buy now buy now buy now buy now"
+    ), "10.0.0.1")
+    await contacts.update_inquiry_status(spam.id, InquiryStatus.SPAM.value)
+
+    await age(db, ServiceBooking, old_completed.id, 800)
+    await age(db, ServiceBooking, deleted.id, 60, is_active=False)
+    await age(db, ContactInquiry, spam.id, 60)
+    await StatsRollupService(db).rebuild()
+    before = (await rollup_rows(db, BookingDailyRollup), await rollup_rows(db, ContactDailyRollup))
+
+    service = ArchiveService(db)
+    assert (await service.count_matching())["closed bookings"] == 1
+
+    with StatementRecorder(db_engine) as recorder:
+        result = await service.archive(batch_size=1, pause=0)
+    await assert_no_full_scans(db_engine, recorder.statements)
+
+    assert result["archived"] == {
+        "inactive bookings": 1,
+        "inactive inquiries": 0,
+        "spam inquiries": 1,
+        "closed bookings": 1,
+        "resolved inquiries": 0
+    }
+    assert await bookings.get_booking_by_id(str(old_completed.booking_id)) is None
+    assert await bookings.get_booking_by_id(str(recent_completed.booking_id)) is not None
+    archived = await service.get_booking(str(old_completed.booking_id))
+    assert archived.status == ProjectStatus.COMPLETED
+    assert archived.archived_at is not None
+    assert (await service.get_inquiry(spam.id)).status == InquiryStatus.SPAM
+
+    # Archiving leaves the rollups alone and a rebuild reads the archive too
+    assert before == (await rollup_rows(db, BookingDailyRollup), await rollup_rows(db, ContactDailyRollup))
+    await StatsRollupService(db).rebuild()
+    assert before == (await rollup_rows(db, BookingDailyRollup), await rollup_rows(db, ContactDailyRollup))
+
+    # Nothing matches any more
+    assert sum((await service.archive(pause=0))["archived"].values()) == 0
+
+@pytest.mark.asyncio
+async def test_interrupted_batch_leaves_rows_in_both_tables(db, monkeypatch):
+    """Test the archive copy commits before the hot delete, and a rerun finishes the move"""
+    bookings = BookingService(db)
+    old = await bookings.create_booking(make_booking_data())
+    await bookings.update_status(str(old.booking_id), ProjectStatus.COMPLETED)
+    await age(db, ServiceBooking, old.id, 800)
+
+    execute = db.execute
+    async def crash_on_delete(statement, *args, **kwargs):
+        if isinstance(statement, Delete):
+            raise RuntimeError("crashed mid-batch")
+        return await execute(statement, *args, **kwargs)
+
+    monkeypatch.setattr(db, "execute", crash_on_delete)
+    with pytest.raises(RuntimeError):
+        await ArchiveService(db).archive(pause=0)
+    monkeypatch.undo()
+
+    assert await db.scalar(select(ServiceBooking.id).where(ServiceBooking.id == old.id)) == old.id
+    assert await db.scalar(select(ArchivedServiceBooking.id).where(ArchivedServiceBooking.id == old.id)) == old.id
+
+    assert (await ArchiveService(db).archive(pause=0))["archived"]["closed bookings"] == 1
+    assert await db.scalar(select(ServiceBooking.id).where(ServiceBooking.id == old.id)) is None
+    assert await ArchiveService(db).get_booking(str(old.booking_id)) is not None
+
+@pytest.mark.asyncio
+async def test_export_includes_archived_rows_on_request(db):
+    """Test exports skip archived rows unless include_archived is set"""
+    bookings = BookingService(db)
+    old = await bookings.create_booking(make_booking_data(project_name="Old Project"))
+    await bookings.create_booking(make_booking_data(project_name="New Project"))
+    await bookings.update_status(str(old.booking_id), ProjectStatus.COMPLETED)
+    await age(db, ServiceBooking, old.id, 800)
+    await ArchiveService(db).archive(pause=0)
+
+    hot = await collect(ExportService(db).export_bookings(BulkFormat.NDJSON))
+    assert [json.loads(line)["project_name"] for line in "".join(hot).splitlines()] == ["New Project"]
+
+    both = await collect(ExportService(db).export_bookings(BulkFormat.NDJSON, include_archived=True))
+    rows = [json.loads(line) for line in "".join(both).splitlines()]
+    assert [row["project_name"] for row in rows] == ["New Project", "Old Project"]
+    assert rows[0]["archived_at"] is None
+    assert rows[1]["archived_at"] is not None
@@ -0,0 +1,193 @@
+# backend/tests/test_booking_service.py
+"""
+Test cases for the booking service
+"""
+
+import asyncio
+import pytest
+import uuid
+from datetime import datetime, timedelta
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from models.booking import ServiceType, ProjectStatus
+from schemas.booking import BookingCreate, BookingUpdate
+from services.booking_service import BookingService
+from utils.pagination import TotalMode
+
+def make_booking_data(**overrides) -> BookingCreate:
+    data = {
+        "service_type": ServiceType.WEB_APPLICATIONS,
+        "project_name": "Test Application",
+        "description": "A test application for unit testing purposes with detailed requirements",
+        "timeline": "Within 1 month",
+        "budget_range": "£2,500 - £5,000",
+        "technologies": ["Python", "Vue.js"],
+        "features": ["User Authentication"],
+        "first_name": "Jane",
+        "last_name": "Doe",
+        "email": "jane.doe@example.com",
+    }
+    data.update(overrides)
+    return BookingCreate(**data)
+
+@pytest.mark.asyncio
+async def test_create_and_fetch_booking(db):
+    """Test creating a booking and reading it back"""
+    service = BookingService(db)
+    booking = await service.create_booking(make_booking_data(), "127.0.0.1")
+
+    fetched = await service.get_booking_by_id(str(booking.booking_id))
+    assert fetched is not None
+    assert fetched.project_name == "Test Application"
+    assert fetched.status == ProjectStatus.PENDING
+    assert fetched.estimated_cost > 0
+
+@pytest.mark.asyncio
+async def test_update_status_sets_quote_window(db):
+    """Test quoting a booking stamps the quote dates"""
+    service = BookingService(db)
+    booking = await service.create_booking(make_booking_data())
+
+    updated = await service.update_status(str(booking.booking_id), ProjectStatus.QUOTED)
+    assert updated.status == ProjectStatus.QUOTED
+    assert updated.quote_sent_at is not None
+    assert updated.quote_valid_until > updated.quote_sent_at
+
+@pytest.mark.asyncio
+async def test_concurrent_sessions(db_engine):
+    """Test several sessions can create bookings concurrently"""
+    session_factory = async_sessionmaker(bind=db_engine, expire_on_commit=False)
+
+    async def create(index: int):
+        async with session_factory() as session:
+            return await BookingService(session).create_booking(
+                make_booking_data(project_name=f"Concurrent Project {index}")
+            )
+
+    created = await asyncio.gather(*(create(i) for i in range(10)))
+    assert len({booking.booking_id for booking in created}) == 10
+
+    async with session_factory() as session:
+        bookings, total, _ = await BookingService(session).get_bookings(limit=5)
+        assert total == 10
+        assert len(bookings) == 5
+
+@pytest.mark.asyncio
+async def test_cursor_pagination_walks_every_booking_once(db):
+    """Test following next_cursor returns each booking exactly once, newest first"""
+    service = BookingService(db)
+    for index in range(7):
+        await service.create_booking(make_booking_data(project_name=f"Paged Project {index}"))
+
+    seen = []
+    bookings, total, cursor = await service.get_bookings(limit=3)
+    seen.extend(bookings)
+    while cursor:
+        bookings, _, cursor = await service.get_bookings(limit=3, cursor=cursor)
+        seen.extend(bookings)
+
+    assert total == 7
+    assert len({booking.id for booking in seen}) == 7
+    assert [booking.id for booking in seen] == sorted((b.id for b in seen), reverse=True)
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_is_rejected(db):
+    """Test a malformed cursor raises ValueError"""
+    with pytest.raises(ValueError):
+        await BookingService(db).get_bookings(cursor="not-a-cursor")
+
+@pytest.mark.asyncio
+async def test_approximate_totals_track_inserts_and_status_changes(db):
+    """Test cached list totals follow writes without recounting"""
+    service = BookingService(db)
+    first = await service.create_booking(make_booking_data())
+    _, total, _ = await service.get_bookings(include_total=TotalMode.APPROX)
+    assert total == 1
+
+    await service.create_booking(make_booking_data(service_type=ServiceType.CONSULTATION))
+    await service.update_status(str(first.booking_id), ProjectStatus.QUOTED)
+
+    _, total, _ = await service.get_bookings(include_total=TotalMode.APPROX)
+    _, quoted, _ = await service.get_bookings(status=ProjectStatus.QUOTED, include_total=TotalMode.APPROX)
+    _, pending, _ = await service.get_bookings(status=ProjectStatus.PENDING, include_total=TotalMode.APPROX)
+    _, skipped, _ = await service.get_bookings(include_total=TotalMode.NONE)
+    assert (total, quoted, pending, skipped) == (2, 1, 1, None)
+
+@pytest.mark.asyncio
+async def test_stats_single_aggregate(db, db_engine):
+    """Test booking stats are computed in one query and fill every field"""
+    from tests.test_query_plans import StatementRecorder
+
+    service = BookingService(db)
+    first = await service.create_booking(make_booking_data())
+    await service.create_booking(make_booking_data(service_type=ServiceType.CONSULTATION))
+    await service.create_booking(make_booking_data())
+    await service.update_status(str(first.booking_id), ProjectStatus.COMPLETED)
+
+    end_date = datetime.utcnow() + timedelta(days=1)
+    with StatementRecorder(db_engine) as recorder:
+        stats = await service.get_stats(end_date - timedelta(days=30), end_date)
+
+    assert len(recorder.statements) == 1
+    assert stats["total_bookings"] == 3
+    assert stats["new_bookings"] == 2
+    assert stats["completed_bookings"] == 1
+    assert stats["pending_bookings"] == 2
+    assert stats["by_status"] == {ProjectStatus.PENDING: 2, ProjectStatus.COMPLETED: 1}
+    assert stats["by_service_type"] == {ServiceType.WEB_APPLICATIONS: 2, ServiceType.CONSULTATION: 1}
+    assert stats["average_project_value"] > 0
+    assert stats["conversion_rate"] == round(1 / 3 * 100, 2)
+
+@pytest.mark.asyncio
+async def test_revenue_stats_single_scan_with_monthly_breakdown(db, db_engine):
+    """Test revenue stats run as one query and monthly groups add up to the totals"""
+    from tests.test_query_plans import StatementRecorder
+
+    service = BookingService(db)
+    accepted = await service.create_booking(make_booking_data())
+    completed = await service.create_booking(make_booking_data())
+    await service.create_booking(make_booking_data())
+    await service.update_status(str(accepted.booking_id), ProjectStatus.ACCEPTED)
+    await service.update_status(str(completed.booking_id), ProjectStatus.COMPLETED)
+    await service.update_booking(str(accepted.booking_id), BookingUpdate(quote_amount=1000))
+    await service.update_booking(str(completed.booking_id), BookingUpdate(quote_amount=500))
+
+    end_date = datetime.utcnow() + timedelta(days=1)
+    start_date = end_date - timedelta(days=90)
+    with StatementRecorder(db_engine) as recorder:
+        stats = await service.get_revenue_stats(start_date, end_date)
+        monthly = await service.get_revenue_stats(start_date, end_date, monthly=True)
+
+    assert len(recorder.statements) == 2
+    assert stats["total_quoted"] == 1500
+    assert stats["total_accepted"] == 1500
+    assert stats["total_completed"] == 500
+    assert stats["average_project_size"] > 0
+    assert "monthly" not in stats
+
+    assert len(monthly["monthly"]) == 1
+    assert monthly["monthly"][0]["month"] == datetime.utcnow().strftime("%Y-%m")
+    assert monthly["monthly"][0]["total_quoted"] == stats["total_quoted"]
+    assert {key: monthly[key] for key in stats} == stats
+
+@pytest.mark.asyncio
+async def test_notes_update_is_single_statement(db, db_engine):
+    """Test updates that need no pre-image run as one UPDATE ... RETURNING"""
+    service = BookingService(db)
+    booking = await service.create_booking(make_booking_data())
+
+    statements = []
+    record = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        updated = await service.update_booking(str(booking.booking_id), BookingUpdate(notes="Call on Friday"))
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+    assert len(statements) == 1
+    assert statements[0].lstrip().upper().startswith("UPDATE")
+    assert updated.notes == "Call on Friday"
+    assert updated.updated_at >= booking.updated_at
+    assert updated.estimated_cost == booking.estimated_cost
+    assert await service.update_booking(str(uuid.uuid4()), BookingUpdate(notes="Nobody")) is None
@@ -6,7 +6,7 @@ Test cases for booking endpoints
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 import tempfile
 import os
 
@@ -17,21 +17,19 @@ from models.base import Base
 # Create test database
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
 engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+async_engine = create_async_engine("sqlite+aiosqlite:///./test.db")
+TestingSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
 
-def override_get_db():
-    try:
-        db = TestingSessionLocal()
+async def override_get_db():
+    async with TestingSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 app.dependency_overrides[get_db] = override_get_db
 
 @pytest.fixture(scope="module")
 def client():
     Base.metadata.create_all(bind=engine)
-    with TestClient(app) as c:
+    with TestClient(app, base_url="http://localhost") as c:
         yield c
     Base.metadata.drop_all(bind=engine)
 
@@ -57,7 +55,7 @@ def test_create_booking(client):
     
     data = response.json()
     assert data["project_name"] == "Test Website"
-    assert data["service_type"] == "webDevelopment"
+    assert data["service_type"] == "businessWebsites"
     assert data["email"] == "john.doe@example.com"
     assert "booking_id" in data
 
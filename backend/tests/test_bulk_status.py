@@ -0,0 +1,125 @@
+# backend/tests/test_bulk_status.py
+"""
+Test cases for bulk status changes and batched status emails
+"""
+
+import uuid
+import pytest
+from sqlalchemy import event
+
+from models.booking import ProjectStatus
+from models.contact import InquiryStatus
+from models.rollup import BookingDailyRollup, ContactDailyRollup
+from schemas.contact import ContactCreate
+from services import email_service as email_module
+from services.booking_service import BookingService
+from services.contact_service import ContactService
+from services.email_service import EmailService
+from services.stats_rollups import StatsRollupService
+from tests.test_booking_service import make_booking_data
+from tests.test_stats_rollups import rollup_rows
+
+@pytest.mark.asyncio
+async def test_bulk_booking_status_is_set_based(db, db_engine):
+    """Test a bulk change runs a fixed number of statements and keeps existing quote windows"""
+    service = BookingService(db)
+    bookings = [await service.create_booking(make_booking_data()) for _ in range(5)]
+    quoted = await service.update_status(str(bookings[0].booking_id), ProjectStatus.QUOTED)
+    quote_sent_at, quote_valid_until = quoted.quote_sent_at, quoted.quote_valid_until
+
+    statements = []
+    record = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        updated = await service.update_statuses(
+            [booking.booking_id for booking in bookings] + [uuid.uuid4()],
+            ProjectStatus.QUOTED
+        )
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+    # Pre-image SELECT, the UPDATE and one rollup upsert, however many rows
+    assert len(statements) == 3
+    assert len(updated) == 5
+    by_id = {booking.booking_id: booking for booking in updated}
+    assert by_id[bookings[0].booking_id].quote_sent_at == quote_sent_at
+    assert by_id[bookings[0].booking_id].quote_valid_until == quote_valid_until
+    for booking in bookings[1:]:
+        fresh = by_id[booking.booking_id]
+        assert fresh.status == ProjectStatus.QUOTED
+        assert fresh.quote_valid_until > fresh.quote_sent_at
+
+    incremental = await rollup_rows(db, BookingDailyRollup)
+    await StatsRollupService(db).rebuild()
+    assert incremental == await rollup_rows(db, BookingDailyRollup)
+
+    assert await service.update_statuses([uuid.uuid4()], ProjectStatus.REVIEWED) == []
+
+@pytest.mark.asyncio
+async def test_bulk_contact_status(db):
+    """Test inquiries move together and unknown IDs are skipped"""
+    service = ContactService(db)
+    inquiries = [
+        await service.create_inquiry(ContactCreate(
+            first_name="Jane",
+            last_name="Doe",
+            email=f"jane{index}@example.com",
+            subject="Website question",
+            message="I would like to know more about your services"
+        ), "10.0.0.1")
+        for index in range(3)
+    ]
+
+    updated = await service.update_inquiry_statuses(
+        [inquiry.id for inquiry in inquiries] + [10_000], InquiryStatus.RESOLVED.value
+    )
+    assert sorted(contact.id for contact in updated) == [inquiry.id for inquiry in inquiries]
+    assert {contact.status for contact in updated} == {InquiryStatus.RESOLVED}
+
+    incremental = await rollup_rows(db, ContactDailyRollup)
+    await StatsRollupService(db).rebuild()
+    assert incremental == await rollup_rows(db, ContactDailyRollup)
+
+    with pytest.raises(ValueError):
+        await service.update_inquiry_statuses([inquiries[0].id], "archived")
+
+@pytest.mark.asyncio
+async def test_status_updates_share_one_smtp_connection(db, monkeypatch):
+    """Test batched status emails open one connection and skip refused recipients"""
+    connections = []
+
+    class FakeSMTP:
+        def __init__(self, host, port):
+            self.sent = []
+            connections.append(self)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+        def starttls(self):
+            pass
+
+        def login(self, username, password):
+            pass
+
+        def send_message(self, msg):
+            if msg["To"] == "refused@example.com":
+                raise email_module.smtplib.SMTPRecipientsRefused({msg["To"]: (550, b"No such user")})
+            self.sent.append(msg["To"])
+
+    monkeypatch.setattr(email_module.smtplib, "SMTP", FakeSMTP)
+
+    service = BookingService(db)
+    bookings = [
+        await service.create_booking(make_booking_data(email=email))
+        for email in ("one@example.com", "refused@example.com", "two@example.com")
+    ]
+
+    sent = EmailService().send_status_updates(bookings, ProjectStatus.REVIEWED)
+
+    assert sent == 2
+    assert len(connections) == 1
+    assert connections[0].sent == ["one@example.com", "two@example.com"]
@@ -0,0 +1,16 @@
+# backend/tests/test_config.py
+"""
+Test cases for settings loaded from the environment
+"""
+
+from core.config import Settings
+
+def test_comma_separated_list_settings(monkeypatch):
+    """Test list settings take the comma-separated form .env.example uses"""
+    monkeypatch.setenv("PRIORITY_KEYWORDS", "urgent, asap")
+    monkeypatch.setenv("ARCHIVE_CLOSED_BOOKING_STATUSES", "completed,cancelled,expired")
+
+    settings = Settings()
+
+    assert settings.PRIORITY_KEYWORDS == ["urgent", "asap"]
+    assert settings.ARCHIVE_CLOSED_BOOKING_STATUSES == ["completed", "cancelled", "expired"]
@@ -0,0 +1,77 @@
+# backend/tests/test_contact_service.py
+"""
+Test cases for the contact service
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+from models.contact import InquiryStatus, InquiryType
+from schemas.admin import ContactStats
+from schemas.contact import ContactCreate
+from services.contact_service import ContactService
+from tests.test_query_plans import StatementRecorder
+
+@pytest.mark.asyncio
+async def test_newsletter_subscription_lifecycle(db):
+    """Test subscribe, confirm, unsubscribe and resubscribe each return the current row"""
+    service = ContactService(db)
+    email = "reader@example.com"
+
+    subscription = await service.subscribe_newsletter(email)
+    assert subscription.id is not None
+    assert subscription.confirmed is False
+    assert subscription.weekly_updates is True
+
+    # Subscribing again returns the existing subscription untouched
+    again = await service.subscribe_newsletter(email)
+    assert again.id == subscription.id
+
+    confirmed = await service.confirm_subscription(email)
+    assert confirmed.confirmed is True
+    first_confirmed_at = confirmed.confirmed_at
+    assert first_confirmed_at is not None
+    assert (await service.confirm_subscription(email)).confirmed_at == first_confirmed_at
+
+    unsubscribed = await service.unsubscribe_newsletter(email)
+    assert unsubscribed.unsubscribed_at is not None
+    assert unsubscribed.confirmed is False
+    assert await service.unsubscribe_newsletter(email) is None
+    assert await service.confirm_subscription(email) is None
+
+    resubscribed = await service.subscribe_newsletter(email)
+    assert resubscribed.id == subscription.id
+    assert resubscribed.unsubscribed_at is None
+    assert resubscribed.confirmed is False
+
+@pytest.mark.asyncio
+async def test_stats_come_from_one_grouped_query(db, db_engine):
+    """Test every contact figure, including by_status, is derived from a single aggregate"""
+    service = ContactService(db)
+    inquiries = [
+        await service.create_inquiry(ContactCreate(
+            first_name="Jane",
+            last_name="Doe",
+            email="jane@example.com",
+            subject="Website question",
+            message="I would like to know more about your services",
+            inquiry_type=inquiry_type
+        ))
+        for inquiry_type in (InquiryType.GENERAL, InquiryType.GENERAL, InquiryType.TECHNICAL, InquiryType.SUPPORT)
+    ]
+    await service.update_inquiry_status(inquiries[1].id, InquiryStatus.RESOLVED.value)
+    await service.update_inquiry_status(inquiries[3].id, InquiryStatus.SPAM.value)
+
+    end_date = datetime.utcnow() + timedelta(days=1)
+    with StatementRecorder(db_engine) as recorder:
+        stats = await service.get_stats(end_date - timedelta(days=30), end_date)
+
+    assert len(recorder.statements) == 1
+    assert ContactStats(**stats).model_dump() == {
+        "total_inquiries": 4,
+        "new_inquiries": 2,
+        "resolved_inquiries": 1,
+        "by_type": {InquiryType.GENERAL: 2, InquiryType.TECHNICAL: 1, InquiryType.SUPPORT: 1},
+        "by_status": {InquiryStatus.NEW: 2, InquiryStatus.RESOLVED: 1, InquiryStatus.SPAM: 1},
+        "spam_rate": 25.0
+    }
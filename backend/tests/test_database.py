@@ -0,0 +1,80 @@
+# backend/tests/test_database.py
+"""
+Test cases for engine configuration
+"""
+
+import time
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from starlette.requests import Request
+
+from core import database
+from core.database import create_db_engine, create_async_db_engine
+
+def test_sqlite_production_mode_pragmas(tmp_path):
+    """Test production mode applies WAL and tuned pragmas on connect"""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'prod.db'}", "test_prod", production_mode=True)
+
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() > 0
+        assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 0
+
+    engine.dispose()
+
+def test_sqlite_foreign_keys_are_opt_in(tmp_path, monkeypatch):
+    """Test SQLITE_FOREIGN_KEYS turns on foreign key enforcement"""
+    monkeypatch.setattr(database.settings, "SQLITE_FOREIGN_KEYS", True)
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'fk.db'}", "test_fk", production_mode=True)
+
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+
+    engine.dispose()
+
+@pytest.mark.asyncio
+async def test_sqlite_production_mode_allows_concurrent_connections(tmp_path):
+    """Test the async engine hands out separate connections in production mode"""
+    engine = create_async_db_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'prod.db'}", "test_prod_async", production_mode=True
+    )
+
+    async with engine.connect() as first, engine.connect() as second:
+        assert first.sync_connection.connection.dbapi_connection is not \
+            second.sync_connection.connection.dbapi_connection
+        assert (await first.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+
+    await engine.dispose()
+
+@pytest.mark.asyncio
+async def test_read_sessions_route_to_replica(tmp_path, monkeypatch):
+    """Test reads use the replica unless the client has just written"""
+    primary = create_async_db_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}", "test_primary")
+    replica = create_async_db_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}", "test_replica")
+    monkeypatch.setattr(database, "async_engine", primary)
+    monkeypatch.setattr(database, "read_async_engine", replica)
+    monkeypatch.setattr(database, "AsyncSessionLocal", async_sessionmaker(bind=primary))
+    monkeypatch.setattr(database, "ReadSessionLocal", async_sessionmaker(
+        bind=replica, sync_session_class=database.ReadOnlySession
+    ))
+
+    def make_request(cookie: str = None) -> Request:
+        headers = [(b"cookie", cookie.encode())] if cookie else []
+        return Request({"type": "http", "headers": headers})
+
+    async def bound_engine(request: Request):
+        async for session in database.get_read_db(request):
+            return session.bind
+
+    assert await bound_engine(make_request()) is replica
+    assert await bound_engine(
+        make_request(f"{database.PRIMARY_STICKY_COOKIE}={time.time() + 30}")
+    ) is primary
+    assert await bound_engine(
+        make_request(f"{database.PRIMARY_STICKY_COOKIE}={time.time() - 30}")
+    ) is replica
+
+    await primary.dispose()
+    await replica.dispose()
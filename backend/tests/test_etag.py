@@ -0,0 +1,68 @@
+# backend/tests/test_etag.py
+"""
+Test cases for ETags and conditional GETs
+"""
+
+import pytest
+from fastapi import Request, Response
+
+from models.booking import ProjectStatus
+from services.booking_service import BookingService
+from tests.test_booking_service import make_booking_data
+from utils.etag import etag_matches, make_etag, not_modified, page_etag, set_etag
+from utils.pagination import TotalMode
+
+def make_request(if_none_match: str = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+def test_if_none_match_parsing():
+    """Test list, weak and wildcard If-None-Match values"""
+    etag = make_etag("booking", 1, "2026-01-01")
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+    assert not_modified(make_request(etag), etag).status_code == 304
+    assert not_modified(make_request('"other"'), etag) is None
+    response = Response()
+    set_etag(response, etag)
+    assert response.headers["etag"] == etag
+
+@pytest.mark.asyncio
+async def test_booking_etag_changes_with_every_write(db):
+    """Test the version probe matches the loaded row and moves on each update"""
+    service = BookingService(db)
+    booking = await service.create_booking(make_booking_data())
+    booking_id = str(booking.booking_id)
+
+    version = await service.get_booking_version(booking_id)
+    assert version == (booking.id, booking.updated_at)
+
+    # Two writes within the same second still produce distinct ETags
+    await service.update_status(booking_id, ProjectStatus.REVIEWED)
+    reviewed = await service.get_booking_version(booking_id)
+    await service.update_status(booking_id, ProjectStatus.QUOTED)
+    quoted = await service.get_booking_version(booking_id)
+    assert len({make_etag("booking", *v) for v in (version, reviewed, quoted)}) == 3
+
+@pytest.mark.asyncio
+async def test_page_etag_probe_matches_loaded_page(db):
+    """Test the cheap page probe and the full list produce the same ETag"""
+    service = BookingService(db)
+    for index in range(3):
+        await service.create_booking(make_booking_data(project_name=f"Project {index}"))
+
+    total = await service.count_bookings(include_total=TotalMode.APPROX)
+    versions = await service.get_page_versions(limit=2)
+    bookings, _, next_cursor = await service.get_bookings(limit=2, include_total=TotalMode.NONE)
+
+    probe = page_etag("bookings", (), total, versions[:2], len(versions) > 2)
+    loaded = page_etag("bookings", (), total, [(b.id, b.updated_at) for b in bookings], next_cursor is not None)
+    assert probe == loaded
+
+    await service.update_status(str(bookings[0].booking_id), ProjectStatus.REVIEWED)
+    versions = await service.get_page_versions(limit=2)
+    assert page_etag("bookings", (), total, versions[:2], len(versions) > 2) != probe
@@ -0,0 +1,60 @@
+# backend/tests/test_export_service.py
+"""
+Test cases for streaming bulk export
+"""
+
+import csv
+import io
+import json
+import pytest
+
+from models.booking import ServiceType, ProjectStatus
+from services import export_service
+from services.booking_service import BookingService
+from services.export_service import ExportService
+from services.import_service import ImportService
+from utils.bulk_io import BulkFormat
+from tests.test_booking_service import make_booking_data
+
+async def collect(chunks) -> list:
+    return [chunk async for chunk in chunks]
+
+@pytest.mark.asyncio
+async def test_ndjson_export_streams_in_chunks_with_filters(db, monkeypatch):
+    """Test NDJSON exports arrive one chunk per yield_per batch and honour filters"""
+    monkeypatch.setattr(export_service.settings, "EXPORT_CHUNK_SIZE", 2)
+    service = BookingService(db)
+    for index in range(5):
+        await service.create_booking(make_booking_data(project_name=f"Export Project {index}"))
+    consultation = await service.create_booking(make_booking_data(service_type=ServiceType.CONSULTATION))
+    await service.update_status(str(consultation.booking_id), ProjectStatus.QUOTED)
+
+    chunks = await collect(ExportService(db).export_bookings(BulkFormat.NDJSON))
+    rows = [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+    assert len(chunks) == 3
+    assert [row["project_name"] for row in rows[:5]] == [f"Export Project {index}" for index in range(5)]
+    assert rows[0]["service_type"] == ServiceType.WEB_APPLICATIONS.value
+    assert rows[0]["technologies"] == ["Python", "Vue.js"]
+
+    quoted = await collect(ExportService(db).export_bookings(
+        BulkFormat.NDJSON, status=ProjectStatus.QUOTED, service_type=ServiceType.CONSULTATION
+    ))
+    assert [json.loads(line)["id"] for line in "".join(quoted).splitlines()] == [consultation.id]
+
+@pytest.mark.asyncio
+async def test_csv_export_round_trips_through_import(db):
+    """Test a CSV export can be fed straight back into the importer"""
+    service = BookingService(db)
+    await service.create_booking(make_booking_data(description="Multi-line brief,\nwith a comma and \"quotes\""))
+
+    exported = "".join(await collect(ExportService(db).export_bookings(BulkFormat.CSV)))
+    rows = list(csv.DictReader(io.StringIO(exported)))
+    assert len(rows) == 1
+    assert rows[0]["description"] == "Multi-line brief,\nwith a comma and \"quotes\""
+    assert json.loads(rows[0]["features"]) == ["User Authentication"]
+
+    async def body():
+        yield exported.encode()
+
+    result = await ImportService(db).import_bookings(body(), BulkFormat.CSV)
+    assert (result["imported"], result["failed"]) == (1, 0)
@@ -0,0 +1,97 @@
+# backend/tests/test_idempotency.py
+"""
+Test cases for Idempotency-Key handling on create endpoints
+"""
+
+import json
+import pytest
+from datetime import datetime, timedelta
+from fastapi import HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import update
+
+from models.idempotency import IdempotencyRecord
+from schemas.booking import BookingResponse
+from services.booking_service import BookingService
+from services.idempotency import (
+    IdempotencyInProgress, IdempotencyKeyReused, IdempotencyService, request_fingerprint
+)
+from tests.test_booking_service import make_booking_data
+from utils.idempotency import REPLAYED_HEADER, idempotent
+
+def make_request(key: str = None) -> Request:
+    headers = [(b"idempotency-key", key.encode())] if key else []
+    return Request({"type": "http", "method": "POST", "path": "/api/bookings/", "headers": headers})
+
+@pytest.mark.asyncio
+async def test_retry_replays_stored_response_without_rerunning(db):
+    """Test a retried create returns the first response and creates nothing new"""
+    calls = []
+
+    @idempotent(scope="bookings", status_code=201)
+    async def create_booking(request, booking_data, db):
+        calls.append(booking_data)
+        booking = await BookingService(db).create_booking(booking_data)
+        return BookingResponse.from_orm(booking)
+
+    booking_data = make_booking_data()
+    first = await create_booking(make_request("retry-1"), booking_data, db)
+    retry = await create_booking(make_request("retry-1"), booking_data, db)
+
+    assert len(calls) == 1
+    assert retry.status_code == 201
+    assert retry.headers[REPLAYED_HEADER] == "true"
+    assert json.loads(retry.body) == jsonable_encoder(first)
+
+    # No key means no idempotency: every call runs
+    await create_booking(make_request(), booking_data, db)
+    assert len(calls) == 2
+
+    with pytest.raises(HTTPException) as excinfo:
+        await create_booking(make_request("retry-1"), make_booking_data(project_name="Other"), db)
+    assert excinfo.value.status_code == 422
+
+@pytest.mark.asyncio
+async def test_failed_request_releases_its_key(db):
+    """Test a request that errors can be retried with the same key"""
+    attempts = []
+
+    @idempotent(scope="bookings", status_code=201)
+    async def flaky(request, booking_data, db):
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise HTTPException(status_code=500, detail="Failed to create booking")
+        return BookingResponse.from_orm(await BookingService(db).create_booking(booking_data))
+
+    with pytest.raises(HTTPException):
+        await flaky(make_request("flaky"), make_booking_data(), db)
+    await flaky(make_request("flaky"), make_booking_data(), db)
+    assert len(attempts) == 2
+
+@pytest.mark.asyncio
+async def test_in_flight_and_expired_keys(db):
+    """Test concurrent use of a key is refused until it finishes or times out"""
+    service = IdempotencyService(db)
+    fingerprint = request_fingerprint({"email": "jane.doe@example.com"})
+
+    assert await service.begin("contact", "key", fingerprint) is None
+    with pytest.raises(IdempotencyInProgress):
+        await service.begin("contact", "key", fingerprint)
+
+    # An abandoned claim past the lock timeout is taken over
+    await db.execute(
+        update(IdempotencyRecord).values(created_at=datetime.utcnow() - timedelta(hours=1))
+    )
+    await db.commit()
+    assert await service.begin("contact", "key", fingerprint) is None
+
+    await service.complete("contact", "key", 201, {"id": 1})
+    with pytest.raises(IdempotencyKeyReused):
+        await service.begin("contact", "key", request_fingerprint({"email": "other@example.com"}))
+
+    # Once expired the key is free for any request again
+    await db.execute(
+        update(IdempotencyRecord).values(expires_at=datetime.utcnow() - timedelta(seconds=1))
+    )
+    await db.commit()
+    assert await service.begin("contact", "key", request_fingerprint({"email": "other@example.com"})) is None
@@ -0,0 +1,87 @@
+# backend/tests/test_import_service.py
+"""
+Test cases for streaming bulk import
+"""
+
+import json
+import pytest
+from datetime import datetime, timedelta
+
+from models.contact import InquiryStatus
+from services.booking_service import BookingService
+from services.contact_service import ContactService
+from services.import_service import ImportService
+from utils.bulk_io import BulkFormat
+
+BOOKING = {
+    "service_type": "webApplications",
+    "project_name": "Imported Application",
+    "description": "An application migrated from the old CRM with detailed requirements",
+    "timeline": "Within 1 month",
+    "budget_range": "£2,500 - £5,000",
+    "technologies": ["Python"],
+    "features": ["User Authentication"],
+    "first_name": "Jane",
+    "last_name": "Doe",
+    "email": "jane.doe@example.com"
+}
+
+async def stream(payload: str, chunk_size: int = 7):
+    """Yield the payload in small chunks that split lines mid-way"""
+    data = payload.encode()
+    for start in range(0, len(data), chunk_size):
+        yield data[start:start + chunk_size]
+
+@pytest.mark.asyncio
+async def test_ndjson_booking_import_reports_bad_lines(db):
+    """Test valid NDJSON rows are imported in batches and bad lines are reported"""
+    lines = [
+        json.dumps(BOOKING),
+        "{not json",
+        json.dumps({**BOOKING, "email": "not-an-email"}),
+        "",
+        json.dumps({**BOOKING, "project_name": "Second Import"}),
+        json.dumps({**BOOKING, "project_name": "Third Import"}),
+    ]
+    batches = []
+
+    result = await ImportService(db).import_bookings(
+        stream("\n".join(lines) + "\n"), BulkFormat.NDJSON, batch_size=2, on_created=batches.append
+    )
+
+    assert (result["processed"], result["imported"], result["failed"]) == (5, 3, 2)
+    assert [error["line"] for error in result["errors"]] == [2, 3]
+    assert result["errors"][1]["errors"][0].startswith("email:")
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert all(booking.estimated_cost > 0 for batch in batches for booking in batch)
+
+    end_date = datetime.utcnow() + timedelta(days=1)
+    stats = await BookingService(db).get_stats(end_date - timedelta(days=1), end_date)
+    assert stats["total_bookings"] == 3
+
+@pytest.mark.asyncio
+async def test_csv_contact_import_handles_quoted_newlines(db):
+    """Test CSV rows are keyed by the header and quoted fields may span lines"""
+    payload = (
+        "first_name,last_name,email,subject,message\r\n"
+        'Jane,Doe,jane.doe@example.com,Website question,"Hello,\r\nI would like a quote for a new site"\r\n'
+        "John,Smith,john@example.com,Too few columns\r\n"
+        "John,Smith,john@example.com,Redesign enquiry,Could you redesign our existing website?\r\n"
+    )
+
+    result = await ImportService(db).import_contacts(stream(payload), BulkFormat.CSV)
+
+    assert (result["processed"], result["imported"], result["failed"]) == (3, 2, 1)
+    assert result["errors"][0]["line"] == 4
+
+    contacts, total, _ = await ContactService(db).get_inquiries()
+    assert total == 2
+    messages = {contact.message for contact in contacts}
+    assert "Hello,\nI would like a quote for a new site" in messages
+    assert all(contact.status == InquiryStatus.NEW for contact in contacts)
+
+def test_format_from_content_type():
+    """Test the import format follows the Content-Type header"""
+    assert BulkFormat.from_content_type("text/csv; charset=utf-8") == BulkFormat.CSV
+    assert BulkFormat.from_content_type("application/x-ndjson") == BulkFormat.NDJSON
+    assert BulkFormat.from_content_type(None) == BulkFormat.NDJSON
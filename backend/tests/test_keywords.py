@@ -0,0 +1,42 @@
+# backend/tests/test_keywords.py
+"""
+Test cases for weighted keyword matching
+"""
+
+import pytest
+import random
+import string
+
+from utils.keywords import KeywordMatcher, load_keyword_weights
+
+def test_matcher_finds_every_keyword_in_one_pass():
+    """Test overlapping, prefix and case-insensitive matches each count once"""
+    matcher = KeywordMatcher({"free": 0.1, "Free Money": 0.3, "act now": 0.3, "now": 0.2, "a.b": 1.0})
+    text = "ACT NOW for free money, free money now!"
+
+    assert matcher.find(text) == {"free", "free money", "act now", "now"}
+    assert matcher.score(text) == pytest.approx(0.9)
+    assert matcher.search("Is it FREE?")
+    assert not matcher.search("axb")
+    assert not KeywordMatcher({}).search("anything")
+
+def test_matcher_agrees_with_substring_checks():
+    """Test random keyword lists find exactly what `keyword in text` finds"""
+    rng = random.Random(7)
+    for _ in range(20):
+        keywords = {"".join(rng.choices("abc ", k=rng.randint(1, 5))).strip() or "a" for _ in range(30)}
+        text = "".join(rng.choices("abc " + string.ascii_uppercase[:3], k=200))
+        assert KeywordMatcher(dict.fromkeys(keywords, 1.0)).find(text) == {
+            keyword for keyword in keywords if keyword in text.lower()
+        }
+
+def test_load_keyword_weights(tmp_path):
+    """Test keyword files with and without weights"""
+    path = tmp_path / "keywords.txt"
+    path.write_text("# spam terms\ncasino,0.5\n\nact now\nhello, world\n")
+
+    assert load_keyword_weights(str(path), 0.3) == {
+        "casino": 0.5,
+        "act now": 0.3,
+        "hello, world": 0.3
+    }
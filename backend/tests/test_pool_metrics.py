@@ -0,0 +1,56 @@
+# backend/tests/test_pool_metrics.py
+"""
+Test cases for connection pool metrics
+"""
+
+import pytest
+from sqlalchemy import create_engine, exc
+
+from core.pool_metrics import InstrumentedQueuePool, describe_pool, get_pool_metrics
+
+def test_pool_records_checkouts_and_timeouts():
+    """Test checkouts are counted and an exhausted pool records a timeout"""
+    engine = create_engine(
+        "sqlite://",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+        pool_logging_name="test_exhausted"
+    )
+    get_pool_metrics("test_exhausted").reset()
+
+    held = engine.connect()
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+
+    stats = describe_pool(engine.pool, "test_exhausted")
+    assert stats["checked_out"] == 1
+    assert stats["checkouts"] == 1
+    assert stats["waits"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["checkout_latency_ms"]["histogram"]["le_inf"] == 2
+
+    held.close()
+    engine.dispose()
+
+def test_unlimited_overflow_never_waits():
+    """Test checkouts from a pool with max_overflow=-1 are not counted as waits"""
+    engine = create_engine(
+        "sqlite://",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=-1,
+        pool_logging_name="test_unlimited"
+    )
+    get_pool_metrics("test_unlimited").reset()
+
+    held = [engine.connect() for _ in range(3)]
+
+    stats = describe_pool(engine.pool, "test_unlimited")
+    assert stats["checkouts"] == 3
+    assert stats["waits"] == 0
+
+    for connection in held:
+        connection.close()
+    engine.dispose()
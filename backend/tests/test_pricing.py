@@ -0,0 +1,77 @@
+# backend/tests/test_pricing.py
+"""
+Test cases for versioned pricing rules and bulk re-estimation
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+from models.booking import ServiceType, ProjectStatus, ProjectComplexity
+from services.booking_service import BookingService
+from services.pricing import DEFAULT_PRICING, DEFAULT_RULES, PricingRules, PricingService
+from services.stats_rollups import StatsRollupService
+from tests.test_booking_service import make_booking_data
+
+def test_default_rules_match_original_estimates():
+    """Test the built-in rules price bookings as the hard-coded tables did"""
+    complexity, hours, cost = DEFAULT_PRICING.score(
+        ServiceType.WEB_APPLICATIONS, ["Python", "Vue.js"], ["User Authentication"], "Short description"
+    )
+    assert complexity == ProjectComplexity.SIMPLE
+    assert (hours, cost) == (43.0, 3225.0)
+
+    complexity, hours, cost = DEFAULT_PRICING.score(
+        ServiceType.DIGITAL_TRANSFROMATION,
+        ["Python", "Vue.js", "PostgreSQL", "Redis", "Docker"],
+        ["Payment Processing", "Real-time Features", "Data Analytics"],
+        "x" * 600
+    )
+    # 5 technologies * 2 + 3 features * 2 + 3 complex * 5 + long description 10 = 41
+    assert complexity == ProjectComplexity.COMPLEX
+    assert (hours, cost) == (134.0, 10050.0)
+
+def test_rules_missing_a_service_type_are_rejected():
+    """Test incomplete pricing rules fail to compile"""
+    rules = {**DEFAULT_RULES, "base_hours": {ServiceType.CONSULTATION.value: 8}}
+    with pytest.raises(ValueError):
+        PricingRules(2, rules)
+
+@pytest.mark.asyncio
+async def test_publish_and_bulk_reestimate(db):
+    """Test publishing new rules re-prices open bookings in chunks and updates stats"""
+    bookings = BookingService(db)
+    created = [await bookings.create_booking(make_booking_data()) for _ in range(5)]
+    await bookings.update_status(str(created[0].booking_id), ProjectStatus.QUOTED)
+    assert {booking.pricing_version for booking in created} == {DEFAULT_PRICING.version}
+
+    pricing = PricingService(db)
+    rule_set = await pricing.publish_rules({**DEFAULT_RULES, "hourly_rate": 100}, "Rate rise")
+    assert rule_set.version == DEFAULT_PRICING.version + 1
+
+    result = await pricing.reestimate_bookings(chunk_size=2)
+    assert result["pricing_version"] == rule_set.version
+    assert result["bookings_repriced"] == 4
+    assert result["estimates_changed"] == 4
+    assert result["chunks"] == 2
+
+    # Already on the current version, so nothing left to do
+    again = await pricing.reestimate_bookings(chunk_size=2)
+    assert again["bookings_repriced"] == 0
+
+    quoted_id, repriced_id = str(created[0].booking_id), str(created[1].booking_id)
+    db.expire_all()
+    quoted = await bookings.get_booking_by_id(quoted_id)
+    repriced = await bookings.get_booking_by_id(repriced_id)
+    assert (quoted.estimated_cost, quoted.pricing_version) == (3225.0, DEFAULT_PRICING.version)
+    assert (repriced.estimated_cost, repriced.pricing_version) == (4300.0, result["pricing_version"])
+
+    # New bookings pick up the published rules without a restart
+    fresh = await bookings.create_booking(make_booking_data())
+    assert fresh.estimated_cost == 4300.0
+
+    end_date = datetime.utcnow() + timedelta(days=1)
+    start_date = end_date - timedelta(days=30)
+    revenue = await bookings.get_revenue_stats(start_date, end_date)
+    await StatsRollupService(db).rebuild()
+    assert revenue == await bookings.get_revenue_stats(start_date, end_date)
+    assert revenue["average_project_size"] == pytest.approx((3225.0 + 5 * 4300.0) / 6)
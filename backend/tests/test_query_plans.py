@@ -0,0 +1,107 @@
+# backend/tests/test_query_plans.py
+"""
+Query plan checks: every service query must be served by an index
+"""
+
+import re
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import event
+
+from models.booking import ServiceType, ProjectStatus
+from models.contact import InquiryType, InquiryStatus
+from schemas.contact import ContactCreate
+from services.booking_service import BookingService
+from services.contact_service import ContactService
+from services.search_service import SearchService
+from tests.test_booking_service import make_booking_data
+from utils.pagination import encode_cursor
+
+HOT_TABLES = ("service_bookings", "contact_inquiries", "newsletter_subscriptions")
+
+# SQLite reports an unindexed read as "SCAN <table>" with no "USING ... INDEX"
+FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+
+class StatementRecorder:
+    """Collects the SELECT statements an engine executes"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+
+    def __enter__(self):
+        event.listen(self.engine.sync_engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine.sync_engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            self.statements.append((statement, parameters))
+
+async def assert_no_full_scans(engine, statements):
+    assert statements, "no queries were recorded"
+    async with engine.connect() as conn:
+        for statement, parameters in statements:
+            result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            for row in result:
+                match = FULL_SCAN.match(row.detail)
+                assert not (match and match.group(1) in HOT_TABLES), \
+                    f"Full table scan of {match.group(1)}:\n{statement}"
+
+@pytest.mark.asyncio
+async def test_booking_queries_use_indexes(db, db_engine):
+    """Test booking list, lookup, search and stats queries avoid full table scans"""
+    service = BookingService(db)
+    booking = await service.create_booking(make_booking_data())
+    end_date = datetime.utcnow() + timedelta(days=1)
+    start_date = end_date - timedelta(days=30)
+
+    with StatementRecorder(db_engine) as recorder:
+        await service.get_bookings()
+        await service.get_bookings(status=ProjectStatus.PENDING)
+        await service.get_bookings(service_type=ServiceType.WEB_APPLICATIONS)
+        await service.get_bookings(status=ProjectStatus.PENDING, service_type=ServiceType.WEB_APPLICATIONS)
+        await service.get_bookings(cursor=encode_cursor(booking.created_at, booking.id))
+        await service.get_bookings(status=ProjectStatus.PENDING, cursor=encode_cursor(booking.created_at, booking.id))
+        await service.get_booking_by_id(str(booking.booking_id))
+        await service.get_booking_version(str(booking.booking_id))
+        await service.get_page_versions(status=ProjectStatus.PENDING)
+        await service.get_recent_bookings()
+        await service.get_stats(start_date, end_date)
+        await service.get_revenue_stats(start_date, end_date)
+        await SearchService(db).search_bookings("test application")
+
+    await assert_no_full_scans(db_engine, recorder.statements)
+
+@pytest.mark.asyncio
+async def test_contact_queries_use_indexes(db, db_engine):
+    """Test contact list, lookup, search, spam and stats queries avoid full table scans"""
+    service = ContactService(db)
+    end_date = datetime.utcnow() + timedelta(days=1)
+    start_date = end_date - timedelta(days=30)
+    contact_data = ContactCreate(
+        first_name="Jane",
+        last_name="Doe",
+        email="jane.doe@example.com",
+        subject="Website question",
+        message="I would like to know more about your services"
+    )
+
+    with StatementRecorder(db_engine) as recorder:
+        inquiry = await service.create_inquiry(contact_data, "10.0.0.1")
+        await service.get_inquiries()
+        await service.get_inquiries(status=InquiryStatus.NEW)
+        await service.get_inquiries(inquiry_type=InquiryType.GENERAL)
+        await service.get_inquiries(cursor=encode_cursor(inquiry.created_at, inquiry.id))
+        await service.get_inquiry_by_id(inquiry.id)
+        await service.get_inquiry_version(inquiry.id)
+        await service.get_page_versions(inquiry_type=InquiryType.GENERAL)
+        await service.get_recent_contacts()
+        await service.get_stats(start_date, end_date)
+        await SearchService(db).search_inquiries("website")
+        await service.subscribe_newsletter("jane.doe@example.com")
+        await service.get_subscription("jane.doe@example.com")
+
+    await assert_no_full_scans(db_engine, recorder.statements)
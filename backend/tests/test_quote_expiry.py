@@ -0,0 +1,74 @@
+# backend/tests/test_quote_expiry.py
+"""
+Test cases for the quote-expiry sweeper
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+from models.booking import ProjectStatus
+from models.rollup import BookingDailyRollup
+from schemas.booking import BookingUpdate
+from services.activity_service import ActivityService
+from services.booking_service import BookingService
+from services.quote_expiry import SWEEPER_ACTOR, QuoteExpiryService
+from services.stats_rollups import StatsRollupService
+from tests.test_booking_service import make_booking_data
+from tests.test_query_plans import StatementRecorder, assert_no_full_scans
+from tests.test_stats_rollups import rollup_rows
+
+async def quoted_bookings(service: BookingService, lapsed: int, current: int) -> list:
+    """Quote lapsed + current bookings, backdating the first lapsed ones"""
+    bookings = []
+    for index in range(lapsed + current):
+        booking = await service.create_booking(make_booking_data())
+        await service.update_status(str(booking.booking_id), ProjectStatus.QUOTED)
+        if index < lapsed:
+            booking = await service.update_booking(
+                str(booking.booking_id),
+                BookingUpdate(quote_valid_until=datetime.utcnow() - timedelta(days=index + 1))
+            )
+        bookings.append(booking)
+    return bookings
+
+@pytest.mark.asyncio
+async def test_sweep_expires_lapsed_quotes_in_batches(db, db_engine):
+    """Test lapsed quotes expire batch by batch and each change is logged"""
+    service = BookingService(db)
+    bookings = await quoted_bookings(service, lapsed=3, current=1)
+
+    with StatementRecorder(db_engine) as recorder:
+        result = await QuoteExpiryService(db).expire_quotes(batch_size=2, pause=0)
+    await assert_no_full_scans(db_engine, recorder.statements)
+
+    assert (result["expired"], result["batches"]) == (3, 2)
+    statuses = [
+        (await service.get_booking_by_id(str(booking.booking_id))).status
+        for booking in bookings
+    ]
+    assert statuses == [ProjectStatus.EXPIRED] * 3 + [ProjectStatus.QUOTED]
+
+    entries = await ActivityService(db).get_recent(entity_type="booking")
+    assert len(entries) == 3
+    assert {entry.actor for entry in entries} == {SWEEPER_ACTOR}
+    assert entries[0].details == {"from": "quoted", "to": "expired"}
+
+    incremental = await rollup_rows(db, BookingDailyRollup)
+    await StatsRollupService(db).rebuild()
+    assert incremental == await rollup_rows(db, BookingDailyRollup)
+
+    # Nothing left to do on the next sweep
+    assert (await QuoteExpiryService(db).expire_quotes(pause=0))["expired"] == 0
+
+@pytest.mark.asyncio
+async def test_sweep_stops_after_max_batches(db):
+    """Test a sweep is bounded and the next one continues where it stopped"""
+    service = BookingService(db)
+    await quoted_bookings(service, lapsed=3, current=0)
+    sweeper = QuoteExpiryService(db)
+
+    first = await sweeper.expire_quotes(batch_size=1, max_batches=2, pause=0)
+    second = await sweeper.expire_quotes(batch_size=1, max_batches=2, pause=0)
+
+    assert (first["expired"], first["batches"]) == (2, 2)
+    assert (second["expired"], second["batches"]) == (1, 1)
@@ -0,0 +1,114 @@
+# backend/tests/test_response_cache.py
+"""
+Test cases for the two-tier response cache
+"""
+
+import asyncio
+import pytest
+
+from models.booking import ProjectStatus
+from services.booking_service import BookingService
+from services.response_cache import (
+    BOOKINGS_TAG, RECENT_BOOKINGS_TAG, STATS_TAG, LocalCache, ResponseCache, booking_tag, response_cache
+)
+from tests.test_booking_service import make_booking_data
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load():
+    """Test single flight: simultaneous misses on a key run the loader once"""
+    cache = ResponseCache()
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"value": 42}
+
+    results = await asyncio.gather(*(cache.get_or_load("stats:30:False", load) for _ in range(10)))
+    assert results == [{"value": 42}] * 10
+    assert len(calls) == 1
+
+    # Now a plain local hit
+    assert await cache.get_or_load("stats:30:False", load) == {"value": 42}
+    assert len(calls) == 1
+
+@pytest.mark.asyncio
+async def test_failed_load_is_shared_but_not_cached():
+    """Test a loader error reaches every waiter and the next call retries"""
+    cache = ResponseCache()
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        if len(calls) == 1:
+            raise RuntimeError("database unavailable")
+        return []
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("bookings:recent:20", load) for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert await cache.get_or_load("bookings:recent:20", load) == []
+    assert len(calls) == 2
+
+@pytest.mark.asyncio
+async def test_replica_loads_are_not_stored_right_after_a_write():
+    """Test a load that may trail the primary is served but not cached after an invalidation"""
+    cache = ResponseCache()
+    calls = []
+
+    async def load():
+        calls.append(1)
+        return {"total": len(calls)}
+
+    await cache.invalidate(STATS_TAG)
+    assert await cache.get_or_load("stats:30:False", load, tags=(STATS_TAG,), replica_lag=10) == {"total": 1}
+    assert await cache.get_or_load("stats:30:False", load, tags=(STATS_TAG,), replica_lag=10) == {"total": 2}
+
+    # A primary read is stored, and so is a replica read once the lag has passed
+    assert await cache.get_or_load("stats:30:False", load, tags=(STATS_TAG,)) == {"total": 3}
+    assert await cache.get_or_load("stats:30:False", load, tags=(STATS_TAG,), replica_lag=10) == {"total": 3}
+    cache.local.invalidate([STATS_TAG])
+    cache.invalidated_at[STATS_TAG] -= 60
+    assert await cache.get_or_load("stats:30:False", load, tags=(STATS_TAG,), replica_lag=10) == {"total": 4}
+    assert await cache.get_or_load("stats:30:False", load, tags=(STATS_TAG,), replica_lag=10) == {"total": 4}
+
+def test_local_tier_evicts_least_recently_used():
+    """Test the LRU bound and tag invalidation of the in-process tier"""
+    local = LocalCache(max_entries=2, ttl=60)
+    local.set("a", 1, ["x"])
+    local.set("b", 2, ["y"])
+    local.get("a")
+    local.set("c", 3, ["y"])
+    assert local.get("b") == (False, None)
+    assert local.get("a") == (True, 1)
+
+    local.invalidate(["y"])
+    assert local.get("c") == (False, None)
+    assert local.get("a") == (True, 1)
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_precisely(db):
+    """Test a status change drops that booking's entry, summaries and stats only"""
+    service = BookingService(db)
+    first = await service.create_booking(make_booking_data(project_name="First"))
+    second = await service.create_booking(make_booking_data(project_name="Second"))
+
+    async def load(value):
+        return value
+
+    for key, tags in [
+        (booking_tag(first.booking_id), (booking_tag(first.booking_id), BOOKINGS_TAG)),
+        (booking_tag(second.booking_id), (booking_tag(second.booking_id), BOOKINGS_TAG)),
+        ("bookings:recent:20", (RECENT_BOOKINGS_TAG,)),
+        ("stats:30:False", (STATS_TAG,)),
+    ]:
+        await response_cache.get_or_load(key, lambda: load("cached"), tags=tags)
+
+    await service.update_status(str(first.booking_id).upper(), ProjectStatus.REVIEWED)
+
+    assert response_cache.local.get(booking_tag(first.booking_id)) == (False, None)
+    assert response_cache.local.get(booking_tag(second.booking_id)) == (True, "cached")
+    assert response_cache.local.get("bookings:recent:20") == (False, None)
+    assert response_cache.local.get("stats:30:False") == (False, None)
@@ -0,0 +1,75 @@
+# backend/tests/test_search_service.py
+"""
+Test cases for full-text search over bookings and inquiries
+"""
+
+import pytest
+
+from schemas.booking import BookingUpdate
+from schemas.contact import ContactCreate
+from services.booking_service import BookingService
+from services.contact_service import ContactService
+from services.search_service import SearchService, fts5_match_query
+from tests.test_booking_service import make_booking_data
+
+@pytest.mark.asyncio
+async def test_booking_search_ranks_and_paginates(db):
+    """Test matches are ranked by relevance and pages report whether more follow"""
+    service = BookingService(db)
+    title_match = await service.create_booking(make_booking_data(project_name="Shopify storefront"))
+    body_match = await service.create_booking(make_booking_data(
+        project_name="Retail rebuild",
+        description="Replace the ageing Shopify theme with a custom headless storefront"
+    ))
+    await service.create_booking(make_booking_data(project_name="Analytics dashboard"))
+
+    search = SearchService(db)
+    hits, has_more = await search.search_bookings("shopify")
+    assert [booking.id for booking, _ in hits] == [title_match.id, body_match.id]
+    assert hits[0][1] > hits[1][1]
+    assert not has_more
+
+    first_page, has_more = await search.search_bookings("storefront", limit=1)
+    second_page, last_has_more = await search.search_bookings("storefront", limit=1, offset=1)
+    assert (len(first_page), has_more, len(second_page), last_has_more) == (1, True, 1, False)
+
+    # Stemming and prefix matching on the last word
+    hits, _ = await search.search_bookings("storefronts")
+    assert len(hits) == 2
+    hits, _ = await search.search_bookings("analyt")
+    assert [booking.project_name for booking, _ in hits] == ["Analytics dashboard"]
+
+@pytest.mark.asyncio
+async def test_search_index_follows_edits(db):
+    """Test the index is kept in sync when searchable text changes"""
+    service = BookingService(db)
+    booking = await service.create_booking(make_booking_data(project_name="Legacy portal"))
+    await service.update_booking(str(booking.booking_id), BookingUpdate(project_name="Customer portal"))
+
+    search = SearchService(db)
+    assert (await search.search_bookings("legacy"))[0] == []
+    assert [b.id for b, _ in (await search.search_bookings("customer portal"))[0]] == [booking.id]
+
+@pytest.mark.asyncio
+async def test_inquiry_search_treats_operators_as_text(db):
+    """Test inquiry search and that FTS syntax in user input cannot break the query"""
+    await ContactService(db).create_inquiry(ContactCreate(
+        first_name="Jane",
+        last_name="Doe",
+        email="jane.doe@example.com",
+        subject="Mobile app quote",
+        message="We need an iOS and Android app for our NEAR-field payments"
+    ), "10.0.0.1")
+
+    search = SearchService(db)
+    hits, _ = await search.search_inquiries('android OR "near')
+    assert [inquiry.subject for inquiry, _ in hits] == []
+    hits, _ = await search.search_inquiries('android "near')
+    assert [inquiry.subject for inquiry, _ in hits] == ["Mobile app quote"]
+
+    with pytest.raises(ValueError):
+        await search.search_inquiries('"*"')
+
+def test_match_query_quotes_every_word():
+    """Test free text becomes quoted words with a prefix on the last one"""
+    assert fts5_match_query("web  app-") == '"web" "app"*'
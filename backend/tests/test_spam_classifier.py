@@ -0,0 +1,122 @@
+# backend/tests/test_spam_classifier.py
+"""
+Test cases for the trainable spam classifier
+"""
+
+import pytest
+from sqlalchemy import select
+
+from core.config import get_settings
+from models.contact import InquiryStatus
+from models.spam import SpamTokenCount
+from schemas.contact import ContactCreate
+from services.contact_service import ContactService
+from services.spam_classifier import (
+    DOCUMENTS_TOKEN, SpamTokenService, inquiry_tokens, spam_classifier, token_deltas
+)
+
+SPAM_MESSAGES = [
+    "Guaranteed crypto returns, invest today with our trading bot",
+    "Our crypto trading bot doubles your investment, guaranteed",
+    "Invest in crypto now: guaranteed daily returns from our bot"
+]
+GENUINE_MESSAGES = [
+    "Could you redesign the website for my bakery and add online ordering?",
+    "We need a booking system for our dental practice website",
+    "Looking for help moving our bakery website to a faster host"
+]
+
+ADMIN = "admin@example.com"
+
+def contact(message: str, email: str = "someone@example.com") -> ContactCreate:
+    return ContactCreate(
+        first_name="Sam",
+        last_name="Taylor",
+        email=email,
+        subject="Hello",
+        message=message
+    )
+
+async def token_rows(db) -> dict:
+    rows = await db.execute(select(SpamTokenCount.token, SpamTokenCount.spam_count, SpamTokenCount.ham_count))
+    return {token: (spam, ham) for token, spam, ham in rows if spam or ham}
+
+def test_tokens_and_deltas():
+    """Test tokenising and that a change between two non-spam statuses nets to nothing"""
+    tokens = inquiry_tokens("Cheap SEO", "Visit cheap-seo.example.com for £99 deals!", "bot@spam.example")
+    assert tokens == {"cheap", "seo", "visit", "cheap-seo.example.com", "for", "£99", "deals", "from:spam.example"}
+
+    read = (False, frozenset(["hello"]))
+    assert token_deltas([(read, read)]) == {}
+    assert token_deltas([(read, (True, frozenset(["hello"])))]) == {
+        DOCUMENTS_TOKEN: [1, -1],
+        "hello": [1, -1]
+    }
+
+@pytest.mark.asyncio
+async def test_verdicts_train_the_classifier_incrementally(db, monkeypatch):
+    """Test status changes keep the token counts equal to a rebuild and shift new scores"""
+    monkeypatch.setattr(get_settings(), "SPAM_CLASSIFIER_MIN_DOCUMENTS", 2)
+    service = ContactService(db)
+    before = await service.create_inquiry(contact("Is anyone reading this? I want crypto advice"))
+
+    spam = [await service.create_inquiry(contact(message)) for message in SPAM_MESSAGES]
+    genuine = [await service.create_inquiry(contact(message)) for message in GENUINE_MESSAGES]
+    assert await token_rows(db) == {}
+    assert before.spam_score == genuine[0].spam_score
+
+    await service.update_inquiry_statuses([inquiry.id for inquiry in spam], InquiryStatus.SPAM.value, ADMIN)
+    await service.update_inquiry_statuses([inquiry.id for inquiry in genuine], InquiryStatus.READ.value, ADMIN)
+    await service.update_inquiry_status(genuine[0].id, InquiryStatus.REPLIED.value, ADMIN)
+    # A mistaken verdict moves the inquiry's tokens back out
+    await service.update_inquiry_status(genuine[1].id, InquiryStatus.SPAM.value, ADMIN)
+    await service.update_inquiry_status(genuine[1].id, InquiryStatus.RESOLVED.value, ADMIN)
+
+    incremental = await token_rows(db)
+    assert incremental[DOCUMENTS_TOKEN] == (3, 3)
+    assert incremental["crypto"] == (3, 0)
+    assert incremental["bakery"] == (0, 2)
+    assert spam_classifier.model.counts["crypto"] == (3, 0)
+
+    assert await SpamTokenService(db).rebuild() == {
+        "spam_documents": 3,
+        "ham_documents": 3,
+        "tokens": len(incremental) - 1
+    }
+    assert await token_rows(db) == incremental
+
+    flagged = await service.create_inquiry(contact("Guaranteed crypto bot returns", "new@example.com"))
+    welcome = await service.create_inquiry(contact("A website for my bakery please", "new@example.com"))
+    assert flagged.status == InquiryStatus.SPAM
+    assert welcome.status == InquiryStatus.NEW
+    assert welcome.spam_score < before.spam_score < flagged.spam_score
+
+    # Spam filed on arrival is not a verdict: neither the write nor a rebuild trains on it
+    assert flagged.status_set_by is None
+    assert await token_rows(db) == incremental
+    await SpamTokenService(db).rebuild()
+    assert await token_rows(db) == incremental
+
+    # Until a person confirms it
+    await service.update_inquiry_statuses([flagged.id], InquiryStatus.SPAM.value, ADMIN)
+    assert (await token_rows(db))[DOCUMENTS_TOKEN] == (4, 3)
+
+@pytest.mark.asyncio
+async def test_anonymous_status_changes_do_not_train(db):
+    """Test a status change without an admin (the public PATCH route) adds no training example"""
+    service = ContactService(db)
+    judged = await service.create_inquiry(contact(SPAM_MESSAGES[0]))
+    unjudged = await service.create_inquiry(contact(GENUINE_MESSAGES[0]))
+    await service.update_inquiry_status(judged.id, InquiryStatus.SPAM.value, ADMIN)
+    counts = await token_rows(db)
+    assert counts[DOCUMENTS_TOKEN] == (1, 0)
+
+    for status in (InquiryStatus.SPAM, InquiryStatus.RESOLVED):
+        changed = await service.update_inquiry_status(unjudged.id, status.value)
+        assert changed.status_set_by is None
+        assert await token_rows(db) == counts
+
+    # Overriding an admin's verdict anonymously only withdraws it, as a rebuild would
+    await service.update_inquiry_status(judged.id, InquiryStatus.RESOLVED.value)
+    assert await token_rows(db) == {}
+    assert (await SpamTokenService(db).rebuild())["spam_documents"] == 0
@@ -0,0 +1,56 @@
+# backend/tests/test_submission_velocity.py
+"""
+Test cases for per-IP submission velocity
+"""
+
+import pytest
+from sqlalchemy import event
+
+from schemas.contact import ContactCreate
+from services.contact_service import ContactService
+from services.submission_velocity import LocalWindowCounter, submission_velocity
+
+def test_local_counter_slides_and_stays_bounded():
+    """Test the previous window fades out and the least recent addresses are dropped"""
+    counter = LocalWindowCounter(max_entries=2, window=100)
+
+    assert [counter.record("a", 1000 + second) for second in range(4)] == [0, 1, 2, 3]
+    # Halfway into the next window half of the previous one still counts
+    assert counter.record("a", 1150) == 2
+    assert counter.record("a", 1160) == 1 + 4 * 0.4
+    # A whole window later nothing is left
+    assert counter.record("a", 1300) == 0
+
+    counter.record("b", 1300)
+    counter.record("c", 1300)
+    assert list(counter.entries) == ["b", "c"]
+
+@pytest.mark.asyncio
+async def test_flood_from_one_address_raises_spam_score_without_counting_rows(db, db_engine):
+    """Test the velocity signal comes from the counters, not a query over inquiries"""
+    service = ContactService(db)
+    contact = ContactCreate(
+        first_name="Jane",
+        last_name="Doe",
+        email="jane@example.com",
+        subject="Website quote",
+        message="I would like a quote for a small business website"
+    )
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        scores = [(await service.create_inquiry(contact, "10.0.0.9")).spam_score for _ in range(5)]
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+    assert scores[:4] == [scores[0]] * 4
+    assert scores[4] == pytest.approx(scores[0] + 0.5)
+    assert not any("count(" in statement.lower() for statement in statements)
+
+    # Other addresses are unaffected
+    assert (await service.create_inquiry(contact, "10.0.0.10")).spam_score == scores[0]
+    assert await submission_velocity.record("10.0.0.9") == 5
@@ -0,0 +1,147 @@
+# backend/utils/bulk_io.py
+"""
+Streaming NDJSON/CSV helpers for bulk import and export
+"""
+
+from typing import Any, AsyncIterator, List, Optional, Sequence, Tuple
+from datetime import date, datetime
+import csv
+import enum
+import io
+import json
+import uuid
+
+class BulkFormat(str, enum.Enum):
+    """Wire formats for bulk import and export"""
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    @classmethod
+    def from_content_type(cls, content_type: Optional[str]) -> "BulkFormat":
+        """Pick a format from a Content-Type header, defaulting to NDJSON"""
+        if content_type and "csv" in content_type.lower():
+            return cls.CSV
+        return cls.NDJSON
+
+    @property
+    def media_type(self) -> str:
+        return "text/csv" if self == BulkFormat.CSV else "application/x-ndjson"
+
+# (line number, record or None, error or None)
+ParsedRecord = Tuple[int, Optional[dict], Optional[str]]
+
+async def iter_lines(chunks: AsyncIterator[bytes], encoding: str = "utf-8") -> AsyncIterator[str]:
+    """Split a byte stream into text lines without buffering more than one line"""
+    buffer = b""
+    first = True
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            text = line.decode(encoding, errors="replace").rstrip("\r")
+            if first:
+                text, first = text.lstrip("\ufeff"), False
+            yield text
+    if buffer:
+        text = buffer.decode(encoding, errors="replace").rstrip("\r")
+        yield text.lstrip("\ufeff") if first else text
+
+async def iter_records(lines: AsyncIterator[str], format: BulkFormat) -> AsyncIterator[ParsedRecord]:
+    """Parse NDJSON objects or CSV rows (keyed by the header) one at a time"""
+    if format == BulkFormat.CSV:
+        async for parsed in _iter_csv(lines):
+            yield parsed
+        return
+
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, None, f"Invalid JSON: {e.msg}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "Expected a JSON object"
+            continue
+        yield line_number, record, None
+
+async def _iter_csv(lines: AsyncIterator[str]) -> AsyncIterator[ParsedRecord]:
+    header = None
+    pending = []
+    start_line = line_number = 0
+
+    async for line in lines:
+        line_number += 1
+        if not pending:
+            start_line = line_number
+            if not line.strip():
+                continue
+        pending.append(line)
+
+        # An odd number of quotes means a quoted field continues on the next line
+        text = "\n".join(pending)
+        if text.count('"') % 2:
+            continue
+        pending = []
+
+        try:
+            row = next(csv.reader([text]))
+        except csv.Error as e:
+            yield start_line, None, f"Invalid CSV: {e}"
+            continue
+
+        if header is None:
+            header = [name.strip() for name in row]
+            continue
+        if len(row) != len(header):
+            yield start_line, None, f"Expected {len(header)} columns, got {len(row)}"
+            continue
+        # Empty cells are treated as missing so schema defaults apply
+        yield start_line, {name: value for name, value in zip(header, row) if value != ""}, None
+
+    if pending:
+        yield start_line, None, "Unterminated quoted field"
+
+def _plain(value: Any) -> Any:
+    """Convert a column value to something json/csv can write"""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+async def encode_partitions(
+    partitions: AsyncIterator[Sequence[dict]],
+    columns: List[str],
+    format: BulkFormat
+) -> AsyncIterator[str]:
+    """Serialise batches of row mappings, yielding one text chunk per batch"""
+    if format == BulkFormat.CSV:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        yield buffer.getvalue()
+
+        async for rows in partitions:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            for row in rows:
+                writer.writerow([
+                    # Lists and dicts are written as JSON, which the importer accepts back
+                    json.dumps(value) if isinstance(value, (list, dict)) else
+                    "" if value is None else _plain(value)
+                    for value in (row[column] for column in columns)
+                ])
+            yield buffer.getvalue()
+        return
+
+    async for rows in partitions:
+        yield "".join(
+            json.dumps({column: _plain(row[column]) for column in columns}) + "\n"
+            for row in rows
+        )
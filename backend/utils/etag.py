@@ -0,0 +1,40 @@
+# backend/utils/etag.py
+"""
+Strong ETags and If-None-Match handling for conditional GETs
+"""
+
+from fastapi import Request, Response
+from typing import Any, List, Optional, Tuple
+import hashlib
+
+# Responses hold client details, so only the browser may cache them and it must revalidate
+CACHE_CONTROL = "private, no-cache"
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag over the values that determine a response's content"""
+    digest = hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+    return f'"{digest}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison, per RFC 9110)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """A 304 response if the client already holds this version, otherwise None"""
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+    return None
+
+def set_etag(response: Response, etag: str):
+    """Tag a full response so the client can revalidate it later"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+def page_etag(scope: str, params: tuple, total: Optional[int], versions: List[Tuple], has_more: bool) -> str:
+    """ETag for a list page from the (id, updated_at) of its rows"""
+    return make_etag(scope, params, total, versions, has_more)
@@ -0,0 +1,88 @@
+# backend/utils/idempotency.py
+"""
+Idempotency-Key decorator for create endpoints
+"""
+
+from functools import wraps
+from fastapi import HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+import logging
+
+from services.idempotency import (
+    IdempotencyInProgress, IdempotencyKeyReused, IdempotencyService, request_fingerprint
+)
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+def idempotent(scope: str, status_code: int = 200):
+    """
+    Replay the stored response when a request is retried with the same Idempotency-Key
+
+    Args:
+        scope: Name the keys are stored under, one per endpoint
+        status_code: Status code the endpoint returns on success
+
+    Retries return before the endpoint runs, so nothing is written and no
+    background tasks (emails) are queued again. Requests without the header
+    are passed straight through. Apply it outside @rate_limit so retries do
+    not use up the client's allowance.
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            values = list(args) + list(kwargs.values())
+            request: Optional[Request] = next((v for v in values if isinstance(v, Request)), None)
+            key = request.headers.get(IDEMPOTENCY_HEADER) if request else None
+            if not key:
+                return await func(*args, **kwargs)
+
+            if len(key) > MAX_KEY_LENGTH:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"{IDEMPOTENCY_HEADER} must be at most {MAX_KEY_LENGTH} characters"
+                )
+
+            db = next((v for v in values if isinstance(v, AsyncSession)), None)
+            payload = next((v for v in values if isinstance(v, BaseModel)), None)
+            service = IdempotencyService(db)
+            fingerprint = request_fingerprint(jsonable_encoder(payload))
+
+            try:
+                stored = await service.begin(scope, key, fingerprint)
+            except IdempotencyKeyReused as e:
+                raise HTTPException(status_code=422, detail=str(e))
+            except IdempotencyInProgress as e:
+                raise HTTPException(status_code=409, detail=str(e), headers={"Retry-After": "1"})
+
+            if stored:
+                logger.info(f"Replaying stored response for {scope} idempotency key {key}")
+                return JSONResponse(
+                    status_code=stored.status_code,
+                    content=stored.body,
+                    headers={REPLAYED_HEADER: "true"}
+                )
+
+            try:
+                response = await func(*args, **kwargs)
+            except Exception:
+                # Let the client retry a request that did not go through
+                await service.release(scope, key)
+                raise
+
+            try:
+                await service.complete(scope, key, status_code, jsonable_encoder(response))
+            except Exception:
+                # The write succeeded, so answer it; retries see the claim until it times out
+                logger.warning(f"Could not store response for {scope} idempotency key {key}")
+            return response
+
+        return wrapper
+    return decorator
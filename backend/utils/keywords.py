@@ -0,0 +1,100 @@
+# backend/utils/keywords.py
+"""
+Weighted keyword matching in a single pass over the text
+"""
+
+from typing import Dict, Mapping, Set, Tuple
+import re
+
+# Marks the end of a keyword in the trie
+_END = ""
+
+def _trie_pattern(node: dict) -> str:
+    """Regex for a trie node, factoring shared prefixes so each position tries one branch per character"""
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char != _END]
+    if not branches:
+        return ""
+    pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    if _END in node:
+        # Greedy, so the longest keyword at a position wins; shorter ones are prefixes of it
+        pattern = f"(?:{pattern})?" if len(branches) == 1 else f"{pattern}?"
+    return pattern
+
+class KeywordMatcher:
+    """
+    A weighted keyword dictionary compiled into one regex.
+
+    Keywords go into a trie that becomes a single pattern, so finding every
+    keyword costs one scan of the text however many keywords there are.
+    Matching is case-insensitive on substrings, like `keyword in text`, and
+    overlapping keywords are all found.
+    """
+
+    def __init__(self, weights: Mapping[str, float]):
+        self.weights: Dict[str, float] = {}
+        for keyword, weight in weights.items():
+            keyword = keyword.strip().lower()
+            if keyword:
+                self.weights[keyword] = weight
+
+        trie: dict = {}
+        for keyword in self.weights:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[_END] = {}
+
+        # The keywords ending along each keyword's path, i.e. those it contains as a prefix
+        self._prefixes: Dict[str, Tuple[str, ...]] = {}
+        for keyword in self.weights:
+            node = trie
+            found = []
+            for index, char in enumerate(keyword):
+                node = node[char]
+                if _END in node:
+                    found.append(keyword[:index + 1])
+            self._prefixes[keyword] = tuple(found)
+
+        # The lookahead matches at every position, so overlapping keywords are not skipped
+        body = _trie_pattern(trie) if trie else "(?!)"
+        self._any = re.compile(body)
+        self._all = re.compile(f"(?=({body}))")
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+    def find(self, text: str) -> Set[str]:
+        """Every keyword that occurs in the text"""
+        found = set()
+        for match in self._all.finditer(text.lower()):
+            found.update(self._prefixes[match.group(1)])
+        return found
+
+    def score(self, text: str) -> float:
+        """Sum of the weights of the keywords in the text, each counted once"""
+        return sum(self.weights[keyword] for keyword in self.find(text))
+
+    def search(self, text: str) -> bool:
+        """Whether any keyword occurs in the text"""
+        return self._any.search(text.lower()) is not None
+
+def load_keyword_weights(path: str, default_weight: float) -> Dict[str, float]:
+    """
+    Read a keyword file: one `keyword` or `keyword,weight` per line, `#` for comments
+    """
+    weights = {}
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            keyword, _, weight = line.rpartition(",")
+            if keyword:
+                try:
+                    weights[keyword] = float(weight)
+                    continue
+                except ValueError:
+                    pass
+            # No weight given, or the comma belongs to the keyword
+            weights[line] = default_weight
+    return weights
@@ -0,0 +1,50 @@
+# backend/utils/pagination.py
+"""
+Pagination helpers: keyset cursors over (created_at, id) and list total modes
+"""
+
+from sqlalchemy import String, tuple_, type_coerce
+from typing import Tuple
+from datetime import datetime
+import base64
+import enum
+import json
+
+class TotalMode(str, enum.Enum):
+    """How a list endpoint computes its total"""
+    NONE = "none"      # skip the total entirely
+    APPROX = "approx"  # cached per-filter counters
+    EXACT = "exact"    # COUNT(*) over the filtered rows
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Build an opaque cursor pointing at a row"""
+    payload = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Parse a cursor back into (created_at, id)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+def sqlite_timestamp(value: datetime) -> str:
+    """Render a datetime the way SQLite's CURRENT_TIMESTAMP stores it"""
+    text = value.replace(tzinfo=None).strftime("%Y-%m-%d %H:%M:%S")
+    if value.microsecond:
+        text += f".{value.microsecond:06d}"
+    return text
+
+def after_cursor(model, cursor: str, dialect_name: str):
+    """Filter for rows after the cursor in (created_at DESC, id DESC) order"""
+    created_at, row_id = decode_cursor(cursor)
+
+    if dialect_name == "sqlite":
+        # SQLite keeps timestamps as text without fractional seconds, so compare
+        # against the stored form; otherwise same-second ties skip the id check
+        return tuple_(type_coerce(model.created_at, String), model.id) < \
+            tuple_(sqlite_timestamp(created_at), row_id)
+
+    return tuple_(model.created_at, model.id) < tuple_(created_at, row_id)